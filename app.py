@@ -9,7 +9,10 @@ try:
     from fastapi.responses import JSONResponse
     from fastapi.exceptions import HTTPException
     from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
-    from database import engine, Base
+    from database import BreakerScopeMiddleware, DatabaseUnavailable, db_breaker
+    from migrations.runner import ensure_schema
+    from utils.read_routing import ReadYourWritesMiddleware
+    from utils.report_jobs import shutdown_report_pool
 except ImportError as e:
     print(f"❌ FATAL: Missing dependency - {e}")
     raise
@@ -22,49 +25,57 @@ try:
     from routes.time_slots import router as time_slots_router
     from routes.reservations import router as reservations_router
     from routes.reservation_attendees import router as reservation_attendees_router
+    from routes.reservation_series import router as reservation_series_router
     from routes.rules import router as rules_router
     from routes.fees import router as fees_router
     from routes.admin import router as admin_router
     from routes.reports import router as reports_router
+    from routes.exports import router as exports_router
 except ImportError as e:
     print(f"❌ FATAL: Could not import routes - {e}")
     raise
 
-print("\n" + "=" * 60)
-print("🚀 STERLING CATERING API - STARTUP CHECK")
-print("=" * 60)
-
 DATABASE_URL = os.getenv("DATABASE_URL")
 SECRET_KEY = os.getenv("SECRET_KEY")
 ENVIRONMENT = os.getenv("ENVIRONMENT", "development")
 
-if not DATABASE_URL:
-    print("❌ FATAL: DATABASE_URL not set!")
-    raise EnvironmentError("Missing DATABASE_URL")
 
-if not SECRET_KEY:
-    print("⚠️  WARNING: SECRET_KEY not set - using default (INSECURE!)")
-else:
-    print("✅ SECRET_KEY configured")
+def startup_check():
+    """Environment banner - printed once at startup, not on import."""
+    print("\n" + "=" * 60)
+    print("🚀 STERLING CATERING API - STARTUP CHECK")
+    print("=" * 60)
+
+    if not DATABASE_URL:
+        print("❌ FATAL: DATABASE_URL not set!")
+        raise EnvironmentError("Missing DATABASE_URL")
+
+    if not SECRET_KEY:
+        print("⚠️  WARNING: SECRET_KEY not set - using default (INSECURE!)")
+    else:
+        print("✅ SECRET_KEY configured")
 
-print(f"✅ DATABASE_URL configured: {DATABASE_URL[:30]}...")
-print(f"✅ ENVIRONMENT: {ENVIRONMENT}")
-print("=" * 60 + "\n")
+    print(f"✅ DATABASE_URL configured: {DATABASE_URL[:30]}...")
+    print(f"✅ ENVIRONMENT: {ENVIRONMENT}")
+    print(f"🌐 CORS configured for: {origins}")
+    print("=" * 60 + "\n")
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    startup_check()
     print("🚀 Starting Sterling Catering API v1.0.0")
     print(f"📍 Environment: {ENVIRONMENT}")
 
     try:
-        Base.metadata.create_all(bind=engine)
-        print("✅ Database tables verified")
+        version = ensure_schema()
+        print(f"✅ Database schema at version {version}")
     except Exception as e:
         print(f"❌ Database error: {e}")
         raise
 
     yield
+    shutdown_report_pool()
     print("👋 Shutting down Sterling Catering API")
 
 
@@ -78,6 +89,12 @@ app = FastAPI(
 # Trust Proxy Headers (Required for HTTPS on Railway)
 app.add_middleware(ProxyHeadersMiddleware, trusted_hosts="*")
 
+# Keep a client's reads on the primary right after it writes (no-op without a replica)
+app.add_middleware(ReadYourWritesMiddleware)
+
+# Count a request's database connection failures once, however many sessions it opens
+app.add_middleware(BreakerScopeMiddleware)
+
 
 def parse_env_origins() -> list[str]:
     """
@@ -116,7 +133,6 @@ def get_cors_origins() -> list[str]:
 
 
 origins = get_cors_origins()
-print(f"🌐 CORS configured for: {origins}")
 
 app.add_middleware(
     CORSMiddleware,
@@ -149,6 +165,27 @@ async def http_exception_handler(request: Request, exc: HTTPException):
     )
 
 
+@app.exception_handler(DatabaseUnavailable)
+async def database_unavailable_handler(request: Request, exc: DatabaseUnavailable):
+    origin = request.headers.get("origin")
+    print(f"⚠️  HTTP 503: {exc} (circuit breaker open)")
+
+    headers = {"Retry-After": str(int(exc.retry_after + 0.999))}
+    if origin in origins:
+        headers.update({
+            "Access-Control-Allow-Origin": origin,
+            "Access-Control-Allow-Credentials": "true",
+            "Access-Control-Allow-Methods": "*",
+            "Access-Control-Allow-Headers": "*",
+        })
+
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Database temporarily unavailable, please retry"},
+        headers=headers,
+    )
+
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     import traceback
@@ -187,12 +224,12 @@ app.include_router(dining_rooms_router, prefix="/dining-rooms", tags=["Dining Ro
 app.include_router(time_slots_router, prefix="/time-slots", tags=["Time Slots"])
 app.include_router(reservations_router, prefix="/reservations", tags=["Reservations"])
 app.include_router(reservation_attendees_router, prefix="/reservations", tags=["Reservation Attendees"])
+app.include_router(reservation_series_router, prefix="/reservation-series", tags=["Reservation Series"])
 app.include_router(rules_router, prefix="/rules", tags=["Rules"])
 app.include_router(fees_router, prefix="/reservations", tags=["Fees"])
 app.include_router(admin_router, prefix="/admin", tags=["Admin"])
 app.include_router(reports_router, prefix="/admin/reports", tags=["Reports"])
-
-print("✅ All routes registered successfully")
+app.include_router(exports_router, prefix="/admin/export", tags=["Exports"])
 
 
 @app.api_route("/", methods=["GET", "HEAD"], tags=["Health Check"])
@@ -223,6 +260,7 @@ def health_check():
     return {
         "status": "healthy" if db_status == "connected" else "degraded",
         "database": db_status,
+        "circuit_breaker": db_breaker.stats()["state"],
         "timestamp": datetime.utcnow().isoformat(),
     }
 
@@ -0,0 +1,168 @@
+# benchmarks/async_load_benchmark.py
+#!/usr/bin/env python3
+"""
+Benchmark: concurrent GET /members through the sync (get_db) and async
+(get_async_db) session paths.
+
+Both paths hit the same file-backed SQLite database with the same pool
+size. Every SELECT is delayed by a fixed amount inside the
+driver's own thread to stand in for network round trips to Postgres,
+so the numbers show how many requests each path keeps in flight rather
+than how fast SQLite is. The sync path is capped by Starlette's
+threadpool (40 workers); the async path only by the connection pool.
+
+Requests carry a real bearer token and go through the real
+get_current_user, which runs on the event loop: the first request loads
+the user through an async session, the rest hit the principal cache.
+
+Past roughly 3x the threadpool size the sync path can stall outright:
+threads block waiting for a pooled connection while finished requests
+wait for a thread to run get_db's teardown and hand theirs back. Those
+requests surface as pool-timeout errors.
+
+Usage:
+    python benchmarks/async_load_benchmark.py [requests] [concurrency] [latency_ms] [pool_size]
+"""
+import asyncio
+import os
+import sys
+import tempfile
+import time as timer
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_tmp = tempfile.TemporaryDirectory()
+# The app's own engines use the benchmark database too: get_current_user
+# loads the user through them on a principal-cache miss
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(_tmp.name, 'bench.db')}")
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+import httpx
+from fastapi import Depends
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app import app
+from database import Base, engine, get_async_db, get_db
+from models import Member, User
+from schemas.member import MemberResponse
+from utils.auth import create_access_token, get_current_user
+from utils.principal_cache import Principal
+
+
+def sync_get_my_members(
+    current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """The pre-async /members handler, kept here as the baseline."""
+    return db.query(Member).filter(Member.user_id == current_user.id).all()
+
+
+def add_latency(engine, latency: float, is_async: bool) -> None:
+    """Sleep `latency` seconds per SELECT, in the thread running SQLite."""
+
+    def delay(statement):
+        if statement.startswith("SELECT"):
+            timer.sleep(latency)
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, _record):
+        if is_async:
+            # aiosqlite owns the sqlite3 connection on its own thread
+            dbapi_connection.await_(dbapi_connection._connection.set_trace_callback(delay))
+        else:
+            dbapi_connection.set_trace_callback(delay)
+
+
+async def drive(path: str, requests: int, concurrency: int, token: str) -> tuple[float, list[float], int]:
+    # App errors (pool timeouts when the sync path stalls) count as failed requests
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    latencies: list[float] = []
+    errors = 0
+    queue = iter(range(requests))
+    headers = {"Authorization": f"Bearer {token}"}
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", headers=headers) as client:
+
+        async def worker():
+            nonlocal errors
+            for _ in queue:
+                started = timer.perf_counter()
+                response = await client.get(path)
+                if response.status_code != 200:
+                    errors += 1
+                    continue
+                latencies.append(timer.perf_counter() - started)
+
+        started = timer.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return timer.perf_counter() - started, latencies, errors
+
+
+def report(label: str, elapsed: float, latencies: list[float], errors: int) -> None:
+    if not latencies:
+        print(f"   {label:<6} all {errors} requests failed")
+        return
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] * 1000
+    p95 = latencies[int(len(latencies) * 0.95)] * 1000
+    print(
+        f"   {label:<6} {len(latencies) / elapsed:8.0f} req/s   "
+        f"p50 {p50:7.1f} ms   p95 {p95:7.1f} ms   errors {errors}"
+    )
+
+
+async def measure(requests: int, concurrency: int, token: str) -> None:
+    for label, url in (("sync", "/bench/sync-members"), ("async", "/members")):
+        await drive(url, min(requests, concurrency), concurrency, token)  # warm the pool
+        report(label, *await drive(url, requests, concurrency, token))
+
+
+def run(requests: int = 2000, concurrency: int = 100, latency_ms: float = 20, pool_size: int = 100):
+    path = engine.url.database
+    pool = {"pool_size": pool_size, "max_overflow": 0, "pool_timeout": 10}
+
+    sync_engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False}, **pool)
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}", **pool)
+    Base.metadata.create_all(bind=sync_engine)
+
+    SyncSession = sessionmaker(bind=sync_engine, autoflush=False)
+    AsyncSession = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+    with SyncSession() as db:
+        user = User(email="bench@example.com", name="Bench", password_hash="x")
+        db.add(user)
+        db.flush()
+        db.add_all([Member(user_id=user.id, name=f"Member {i}", relation="family") for i in range(10)])
+        db.commit()
+        token = create_access_token(user_id=user.id, is_admin=False)
+
+    add_latency(sync_engine, latency_ms / 1000, is_async=False)
+    add_latency(async_engine.sync_engine, latency_ms / 1000, is_async=True)
+
+    def override_get_db():
+        with SyncSession() as db:
+            yield db
+
+    async def override_get_async_db():
+        async with AsyncSession() as db:
+            yield db
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    app.add_api_route("/bench/sync-members", sync_get_my_members, response_model=list[MemberResponse])
+
+    print(f"\n📊 {requests} requests, concurrency {concurrency}, "
+          f"{latency_ms:.0f} ms per SELECT, pool {pool_size}\n")
+    try:
+        # One event loop throughout: the async pool's wait queue is bound to it
+        asyncio.run(measure(requests, concurrency, token))
+    finally:
+        app.dependency_overrides.clear()
+        asyncio.run(async_engine.dispose())
+        sync_engine.dispose()
+
+
+if __name__ == "__main__":
+    args = [float(a) for a in sys.argv[1:5]]
+    run(*(int(a) if i != 2 else a for i, a in enumerate(args)))
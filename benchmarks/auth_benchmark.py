@@ -0,0 +1,73 @@
+# benchmarks/auth_benchmark.py
+#!/usr/bin/env python3
+"""
+Benchmark: per-request authentication overhead in get_current_user.
+
+Compares the token check with a cold verified-token cache (HS256 signature
+check + claim parsing on every call, the old behaviour) against a warm one,
+both with the principal cache warm, i.e. the steady state for a client
+reusing its token.
+
+Usage:
+    python benchmarks/auth_benchmark.py [iterations]
+"""
+import asyncio
+import os
+import sys
+import time as timer
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from fastapi.security import HTTPAuthorizationCredentials
+
+import models  # noqa: F401  (registers every mapper)
+from utils.auth import create_access_token, get_current_user
+from utils.principal_cache import Principal, principal_cache
+from utils.token_cache import token_cache
+
+
+async def time_calls(fn, iterations: int) -> float:
+    """Mean microseconds per call."""
+    started = timer.perf_counter()
+    for _ in range(iterations):
+        await fn()
+    return (timer.perf_counter() - started) / iterations * 1_000_000
+
+
+async def measure(iterations: int) -> tuple[float, float]:
+    principal = Principal(id=1, is_admin=False, name="Bench")
+    principal_cache.put(principal)
+
+    credentials = HTTPAuthorizationCredentials(
+        scheme="Bearer",
+        credentials=create_access_token(user_id=principal.id, is_admin=False),
+    )
+
+    async def authenticate():
+        # No session is opened on a principal-cache hit
+        return await get_current_user(credentials=credentials)
+
+    async def authenticate_cold():
+        token_cache.clear()
+        return await authenticate()
+
+    await authenticate()  # warm up imports and caches
+
+    cold = await time_calls(authenticate_cold, iterations)
+    warm = await time_calls(authenticate, iterations)
+    return cold, warm
+
+
+def run(iterations: int = 50_000):
+    cold, warm = asyncio.run(measure(iterations))
+
+    print(f"\n📊 get_current_user, {iterations} calls each\n")
+    print(f"   verify every request  {cold:7.2f} µs/request")
+    print(f"   verified-token cache  {warm:7.2f} µs/request   ({cold / warm:.1f}x faster)")
+    print(f"\n   {token_cache.stats()}\n")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
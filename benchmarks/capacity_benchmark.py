@@ -0,0 +1,126 @@
+# benchmarks/capacity_benchmark.py
+#!/usr/bin/env python3
+"""
+Benchmark: sweep-line capacity engine vs. the old overlap COUNT query.
+
+Builds a throwaway SQLite database with one room-day holding N reservations
+(default 10,000) and times both approaches for a batch of proposed windows.
+
+Usage:
+    python benchmarks/capacity_benchmark.py [reservations] [probes]
+"""
+import os
+import random
+import sys
+import time as timer
+from datetime import date, time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from database import Base
+from models import DiningRoom, Reservation, ReservationAttendee, User
+from utils.capacity import room_peak_occupancy
+
+BENCH_DATE = date(2030, 1, 4)
+
+
+def _random_window(rng: random.Random) -> tuple[time, time]:
+    start_hour = rng.randint(11, 19)
+    start_min = rng.choice([0, 15, 30, 45])
+    end_hour = min(start_hour + rng.randint(1, 3), 22)
+    return time(start_hour, start_min), time(end_hour, start_min if end_hour < 22 else 0)
+
+
+def build_fixture(db, n_reservations: int, rng: random.Random) -> DiningRoom:
+    user = User(email="bench@example.com", name="Bench", password_hash="x")
+    room = DiningRoom(name="Bench Hall", capacity=10_000_000)
+    db.add_all([user, room])
+    db.flush()
+
+    reservations = []
+    for _ in range(n_reservations):
+        start, end = _random_window(rng)
+        reservations.append(
+            Reservation(
+                created_by_id=user.id,
+                dining_room_id=room.id,
+                date=BENCH_DATE,
+                meal_type="dinner",
+                start_time=start,
+                end_time=end,
+                status="confirmed",
+            )
+        )
+    db.add_all(reservations)
+    db.flush()
+
+    attendees = []
+    for res in reservations:
+        for i in range(rng.randint(1, 6)):
+            attendees.append(
+                ReservationAttendee(
+                    reservation_id=res.id,
+                    name=f"Guest {i}",
+                    attendee_type="guest",
+                )
+            )
+    db.add_all(attendees)
+    db.commit()
+    return room
+
+
+def legacy_count(db, room_id: int, start: time, end: time) -> int:
+    """The pre-engine check: every attendee of every overlapping reservation."""
+    return (
+        db.query(ReservationAttendee)
+        .join(Reservation, ReservationAttendee.reservation_id == Reservation.id)
+        .filter(
+            Reservation.dining_room_id == room_id,
+            Reservation.date == BENCH_DATE,
+            Reservation.status == "confirmed",
+            Reservation.start_time < end,
+            Reservation.end_time > start,
+        )
+        .count()
+    )
+
+
+def run(n_reservations: int = 10_000, probes: int = 50):
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    rng = random.Random(42)
+
+    print(f"🔨 Building room-day with {n_reservations:,} reservations...")
+    room = build_fixture(db, n_reservations, rng)
+    windows = [_random_window(rng) for _ in range(probes)]
+
+    t0 = timer.perf_counter()
+    legacy = [legacy_count(db, room.id, s, e) for s, e in windows]
+    legacy_ms = (timer.perf_counter() - t0) * 1000 / probes
+
+    t0 = timer.perf_counter()
+    peaks = [room_peak_occupancy(db, room.id, BENCH_DATE, s, e) for s, e in windows]
+    engine_ms = (timer.perf_counter() - t0) * 1000 / probes
+
+    overstated = sum(1 for a, b in zip(legacy, peaks) if a > b)
+    avg_gap = sum(a - b for a, b in zip(legacy, peaks)) / probes
+
+    print("=" * 60)
+    print(f"Legacy COUNT:      {legacy_ms:8.2f} ms/check")
+    print(f"Sweep-line engine: {engine_ms:8.2f} ms/check")
+    print(f"COUNT overstated occupancy on {overstated}/{probes} windows "
+          f"(avg +{avg_gap:.0f} people)")
+    print("=" * 60)
+
+    db.close()
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    run(*args)
@@ -0,0 +1,116 @@
+# benchmarks/export_benchmark.py
+#!/usr/bin/env python3
+"""
+Benchmark: exporting every reservation, as /admin/reservations does it
+(all rows loaded as ORM objects and dumped as one JSON array) vs. the
+streaming export (yield_per + CSV/NDJSON chunks).
+
+Reports time to the first byte, total time and tracemalloc's peak for
+each. Exits 1 if the streamed CSV is missing rows.
+
+Usage:
+    python benchmarks/export_benchmark.py [reservations]
+"""
+import json
+import os
+import sys
+import tempfile
+import time as timer
+import tracemalloc
+from datetime import date, time, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from database import Base
+from models import DiningRoom, Reservation, User
+from routes.exports import export_chunks
+from schemas.reservation import ReservationResponse
+
+FIRST_DATE = date(2030, 1, 1)
+
+
+def build_fixture(db, n_reservations: int) -> None:
+    user = User(email="bench@example.com", name="Bench", password_hash="x")
+    room = DiningRoom(name="Bench Hall", capacity=1000)
+    db.add_all([user, room])
+    db.flush()
+    db.execute(insert(Reservation), [
+        {
+            "created_by_id": user.id,
+            "dining_room_id": room.id,
+            "date": FIRST_DATE + timedelta(days=i % 365),
+            "meal_type": "dinner",
+            "start_time": time(18, 0),
+            "end_time": time(20, 0),
+            "status": "confirmed",
+            "attendee_count": i % 8,
+        }
+        for i in range(n_reservations)
+    ])
+    db.commit()
+
+
+def materialized(db):
+    """The /admin/reservations approach: everything in memory, one body."""
+    reservations = db.query(Reservation).order_by(Reservation.date).all()
+    yield json.dumps([ReservationResponse.model_validate(r).model_dump(mode="json") for r in reservations])
+
+
+def measure(chunks) -> tuple[float, float, float, int]:
+    """(first byte s, total s, peak MiB, body bytes)"""
+    tracemalloc.start()
+    started = timer.perf_counter()
+    first = None
+    size = 0
+    for chunk in chunks:
+        if first is None:
+            first = timer.perf_counter() - started
+        size += len(chunk)
+    total = timer.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return first, total, peak / 1024 / 1024, size
+
+
+def run(n_reservations: int = 100_000) -> int:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        Base.metadata.create_all(engine)
+        Session = sessionmaker(bind=engine)
+        with Session() as db:
+            build_fixture(db, n_reservations)
+
+        print(f"\n📊 Exporting {n_reservations} reservations\n")
+        for label, make in (
+            ("JSON array (ORM)", materialized),
+            ("streamed CSV", lambda db: export_chunks(db, "reservations", "csv")),
+            ("streamed NDJSON", lambda db: export_chunks(db, "reservations", "ndjson")),
+        ):
+            with Session() as db:
+                first, total, peak, size = measure(make(db))
+            print(
+                f"   {label:<17} first byte {first * 1000:8.1f} ms   total {total:6.2f} s   "
+                f"peak {peak:8.2f} MiB   {size / 1024 / 1024:6.1f} MiB body"
+            )
+
+        with Session() as db:
+            # Header line plus one line per reservation
+            lines = sum(chunk.count("\n") for chunk in export_chunks(db, "reservations", "csv")) - 1
+
+        engine.dispose()
+
+    print()
+    if lines != n_reservations:
+        print(f"❌ CSV export has {lines} rows, expected {n_reservations}")
+        return 1
+    print(f"✅ CSV export has all {n_reservations} rows")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(run(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000))
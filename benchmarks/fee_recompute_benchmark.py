@@ -0,0 +1,101 @@
+# benchmarks/fee_recompute_benchmark.py
+#!/usr/bin/env python3
+"""
+Benchmark: bulk fee recomputation after a rule change.
+
+Builds a throwaway file-backed SQLite database with N future reservations
+(default 100,000), each carrying a peak-hours fee where applicable, then
+changes the rule's amount and times recompute_rule_fees.
+
+Usage:
+    python benchmarks/fee_recompute_benchmark.py [reservations]
+"""
+import os
+import sys
+import tempfile
+import time as timer
+from datetime import date, time, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from database import Base
+from models import DiningRoom, Fee, Reservation, Rule, User
+from utils.fee_recompute import recompute_rule_fees
+
+
+def build_fixture(db, n_reservations: int) -> Rule:
+    user = User(email="bench@example.com", name="Bench", password_hash="x")
+    rule = Rule(code="peak_hours", name="Peak", fee_type="flat", base_amount=15.0, enabled=1)
+    db.add_all([user, DiningRoom(name="Bench Hall", capacity=1_000_000), rule])
+    db.flush()
+
+    first_day = date.today() + timedelta(days=1)
+    db.execute(
+        insert(Reservation),
+        [
+            {
+                "created_by_id": user.id,
+                "dining_room_id": 1,
+                "date": first_day + timedelta(days=i % 365),
+                "meal_type": "dinner",
+                "start_time": time(18, 0),
+                "end_time": time(20, 0),
+                "status": "confirmed",
+                "attendee_count": 1,
+                "member_count": 1,
+                "guest_count": 0,
+            }
+            for i in range(n_reservations)
+        ],
+    )
+    db.execute(
+        insert(Fee),
+        [
+            {
+                "reservation_id": res_id,
+                "rule_id": rule.id,
+                "quantity": None,
+                "calculated_amount": 15.0,
+                "paid": 1 if res_id % 50 == 0 else 0,
+            }
+            for res_id, res_date in db.query(Reservation.id, Reservation.date)
+            if res_date.weekday() in [4, 5, 6]
+        ],
+    )
+    db.commit()
+    return rule
+
+
+def run(n_reservations: int = 100_000):
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        Base.metadata.create_all(bind=engine)
+        db = sessionmaker(bind=engine, autoflush=False)()
+
+        print(f"🔨 Building {n_reservations:,} future reservations...")
+        rule = build_fixture(db, n_reservations)
+
+        rule.base_amount = 20.0
+        db.commit()
+
+        t0 = timer.perf_counter()
+        stats = recompute_rule_fees(db, rule.id)
+        elapsed = timer.perf_counter() - t0
+
+        print("=" * 60)
+        print(f"Recomputed:      {stats['processed']:,} reservations in {elapsed:.2f} s")
+        print(f"Updated:         {stats['updated']:,}")
+        print(f"Skipped (paid):  {stats['skipped']:,}")
+        print("=" * 60)
+
+        db.close()
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:2]]
+    run(*args)
@@ -0,0 +1,79 @@
+# benchmarks/import_budget.py
+#!/usr/bin/env python3
+"""
+Import-time budget check for `import app` (run in CI or before a deploy).
+
+Runs `python -X importtime -c "import app"` in fresh interpreters and
+fails (exit 1) when:
+- the best cumulative import time of `app` exceeds the budget, or
+- a module that must stay lazy (reportlab, numpy, bcrypt) is imported
+  at startup
+
+Usage:
+    python benchmarks/import_budget.py [budget_ms] [runs]
+
+The budget can also come from IMPORT_BUDGET_MS.
+"""
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_BUDGET_MS = 1200
+
+# Heavy modules only needed by rarely used endpoints
+LAZY_MODULES = ("reportlab", "numpy", "bcrypt")
+
+
+def import_profile() -> list[tuple[str, int, int]]:
+    """(module, self_us, cumulative_us) for every module `import app` loads."""
+    env = dict(os.environ)
+    env.setdefault("DATABASE_URL", "sqlite://")
+    env.setdefault("SECRET_KEY", "import-budget")
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app"],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True,
+    )
+
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def run(budget_ms: float, runs: int = 3) -> int:
+    profiles = [import_profile() for _ in range(runs)]
+    best = min(profiles, key=lambda rows: next(c for name, _, c in rows if name == "app"))
+    app_ms = next(c for name, _, c in best if name == "app") / 1000
+
+    print(f"\n📦 import app: {app_ms:.0f} ms (best of {runs}, budget {budget_ms:.0f} ms)\n")
+    print("   slowest modules (self time):")
+    for name, self_us, _ in sorted(best, key=lambda row: row[1], reverse=True)[:10]:
+        print(f"   {self_us / 1000:8.1f} ms  {name}")
+
+    failures = []
+    if app_ms > budget_ms:
+        failures.append(f"import app took {app_ms:.0f} ms (budget {budget_ms:.0f} ms)")
+
+    loaded = {name.split(".")[0] for name, _, _ in best}
+    for module in LAZY_MODULES:
+        if module in loaded:
+            failures.append(f"{module} is imported at startup; import it on first use")
+
+    print()
+    for failure in failures:
+        print(f"❌ {failure}")
+    if not failures:
+        print("✅ Import budget OK")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    budget = float(sys.argv[1]) if len(sys.argv) > 1 else float(os.getenv("IMPORT_BUDGET_MS", DEFAULT_BUDGET_MS))
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    sys.exit(run(budget, runs))
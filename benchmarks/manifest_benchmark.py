@@ -0,0 +1,154 @@
+# benchmarks/manifest_benchmark.py
+#!/usr/bin/env python3
+"""
+Benchmark: building the day's kitchen manifest.
+
+Compares the per-reservation assembly the kitchen does today (list the
+day's reservations, then fetch each one's attendees and each member's
+record) with build_kitchen_manifest's single joined query. Counts SQL
+statements and times both; exits 1 unless the manifest takes exactly one
+query at every size, or if dietary_tags mis-tags any of DIETARY_CASES.
+
+Usage:
+    python benchmarks/manifest_benchmark.py [reservations...]
+"""
+import os
+import random
+import sys
+import time as timer
+from datetime import date, time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from database import Base
+from models import DiningRoom, Member, Reservation, ReservationAttendee, User
+from routes.reports import build_kitchen_manifest
+from utils.dietary import dietary_tags
+
+BENCH_DATE = date(2030, 1, 4)
+RESTRICTIONS = [
+    None, "vegan", "Gluten-free", "NO shellfish, pork", "nut allergy", "none", "Vegetarian; no dairy",
+    "N/A", "vegetarian (no eggs)",
+]
+
+# Free text -> the tags the kitchen should see
+DIETARY_CASES = {
+    "n/a": [],
+    "N / A": [],
+    "None": [],
+    "n/a; vegan": ["vegan"],
+    "NO shellfish, pork": ["shellfish", "pork"],
+    "vegetarian (no eggs)": ["vegetarian", "eggs"],
+    "Gluten-free (celiac)": ["gluten"],
+    "nut allergy (severe)": ["nut"],
+}
+
+
+def build_fixture(db, n_reservations: int, rng: random.Random) -> None:
+    users = [User(email=f"bench{i}@example.com", name=f"Bench {i}", password_hash="x") for i in range(20)]
+    rooms = [DiningRoom(name=f"Room {i}", capacity=1000) for i in range(4)]
+    db.add_all(users + rooms)
+    db.flush()
+    members = [
+        Member(user_id=user.id, name=f"{user.name} member {i}", dietary_restrictions=rng.choice(RESTRICTIONS))
+        for user in users for i in range(3)
+    ]
+    db.add_all(members)
+    db.flush()
+
+    for _ in range(n_reservations):
+        creator = rng.choice(users)
+        reservation = Reservation(
+            created_by_id=creator.id,
+            dining_room_id=rng.choice(rooms).id,
+            date=BENCH_DATE,
+            meal_type=rng.choice(["lunch", "dinner"]),
+            start_time=time(rng.randint(11, 20), 0),
+            end_time=time(21, 0),
+            status="confirmed",
+        )
+        db.add(reservation)
+        db.flush()
+        member = rng.choice(members)
+        db.add(ReservationAttendee(
+            reservation_id=reservation.id, member_id=member.id, name=member.name, attendee_type="member",
+        ))
+        for g in range(rng.randint(0, 4)):
+            db.add(ReservationAttendee(
+                reservation_id=reservation.id, name=f"Guest {g}", attendee_type="guest",
+                dietary_restrictions=rng.choice(RESTRICTIONS),
+            ))
+    db.commit()
+
+
+def per_reservation(db) -> int:
+    """Today's approach: the reservation list, then attendees one reservation at a time."""
+    attendees = 0
+    reservations = db.query(Reservation).filter(
+        Reservation.date == BENCH_DATE, Reservation.status == "confirmed"
+    ).all()
+    for reservation in reservations:
+        for attendee in db.query(ReservationAttendee).filter(ReservationAttendee.reservation_id == reservation.id).all():
+            if attendee.member_id:
+                db.query(Member).filter(Member.id == attendee.member_id).first()
+            attendees += 1
+    return attendees
+
+
+def measure(fn, db, engine) -> tuple[int, float]:
+    statements = 0
+
+    def count(*_args):
+        nonlocal statements
+        statements += 1
+
+    event.listen(engine, "before_cursor_execute", count)
+    started = timer.perf_counter()
+    fn(db)
+    elapsed = timer.perf_counter() - started
+    event.remove(engine, "before_cursor_execute", count)
+    db.expunge_all()
+    return statements, elapsed
+
+
+def run(sizes: list[int]) -> int:
+    print("\n📊 Kitchen manifest for one day\n")
+    manifest_counts = []
+    for n in sizes:
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        db = sessionmaker(bind=engine)()
+        build_fixture(db, n, random.Random(n))
+        db.expunge_all()
+
+        old_queries, old_s = measure(per_reservation, db, engine)
+        new_queries, new_s = measure(lambda s: build_kitchen_manifest(s, BENCH_DATE), db, engine)
+        manifest_counts.append(new_queries)
+        print(
+            f"   {n:>5} reservations   per reservation {old_queries:5d} queries {old_s * 1000:8.1f} ms   "
+            f"manifest {new_queries} query {new_s * 1000:7.1f} ms"
+        )
+        db.close()
+        engine.dispose()
+
+    print()
+    if any(count != 1 for count in manifest_counts):
+        print(f"❌ Expected 1 query per manifest, got {manifest_counts}")
+        return 1
+    print("✅ Manifest built from one query at every size")
+
+    wrong = {text: dietary_tags(text) for text, tags in DIETARY_CASES.items() if dietary_tags(text) != tags}
+    if wrong:
+        print(f"❌ Wrong dietary tags: {wrong}")
+        return 1
+    print(f"✅ Dietary tags correct for {len(DIETARY_CASES)} sample restrictions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(run([int(arg) for arg in sys.argv[1:]] or [10, 100, 500]))
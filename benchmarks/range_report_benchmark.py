@@ -0,0 +1,138 @@
+# benchmarks/range_report_benchmark.py
+#!/usr/bin/env python3
+"""
+Benchmark: peak Python memory while rendering the multi-day report.
+
+Renders ranges of increasing length (same reservations per day) two ways
+and reports tracemalloc's peak for each:
+
+- all at once: every day's rows loaded, every page's flowables built,
+  then one doc.build() (what a naive multi-day report would do)
+- day by day: iter_report_days + render_range_report_pdf, as served by
+  GET /admin/reports/range-pdf
+
+The output goes to a temp file in both cases so the PDF bytes themselves
+are not counted. Also checks that the range endpoint path issues a
+constant number of queries.
+
+Usage:
+    python benchmarks/range_report_benchmark.py [reservations_per_day] [days...]
+"""
+import os
+import random
+import sys
+import tempfile
+import time as timer
+import tracemalloc
+from datetime import date, time, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from database import Base
+from models import DiningRoom, Reservation, User
+from routes.reports import iter_report_days, load_daily_report_data, load_report_rooms
+from utils.report_render import _report_doc, daily_report_flowables, render_range_report_pdf
+
+FIRST_DATE = date(2030, 1, 1)
+
+
+def build_fixture(db, days: int, per_day: int) -> None:
+    rng = random.Random(days)
+    users = [User(email=f"bench{i}@example.com", name=f"Bench {i}", password_hash="x") for i in range(20)]
+    rooms = [DiningRoom(name=f"Room {i}", capacity=1000) for i in range(4)]
+    db.add_all(users + rooms)
+    db.flush()
+    for day in range(days):
+        for _ in range(per_day):
+            start_hour = rng.randint(11, 20)
+            db.add(Reservation(
+                created_by_id=rng.choice(users).id,
+                dining_room_id=rng.choice(rooms).id,
+                date=FIRST_DATE + timedelta(days=day),
+                meal_type="dinner",
+                start_time=time(start_hour, 0),
+                end_time=time(min(start_hour + 2, 22), 0),
+                attendee_count=rng.randint(1, 6),
+                status="confirmed",
+            ))
+    db.commit()
+
+
+def all_at_once(db, start: date, end: date, output) -> None:
+    from reportlab.platypus import PageBreak
+
+    days = []
+    day = start
+    while day <= end:
+        rooms, bookings = load_daily_report_data(db, day)
+        days.append((day, rooms, bookings))
+        day += timedelta(days=1)
+
+    elements = []
+    for i, (day, rooms, bookings) in enumerate(days):
+        elements += ([PageBreak()] if i else []) + daily_report_flowables(day, rooms, bookings)
+    _report_doc(output).build(elements)
+
+
+def day_by_day(db, start: date, end: date, output) -> None:
+    render_range_report_pdf(output, load_report_rooms(db), iter_report_days(db, start, end))
+
+
+def measure(render, db, days: int) -> tuple[float, float]:
+    """(peak MiB, seconds)"""
+    end = FIRST_DATE + timedelta(days=days - 1)
+    with tempfile.TemporaryFile() as output:
+        tracemalloc.start()
+        started = timer.perf_counter()
+        render(db, FIRST_DATE, end, output)
+        elapsed = timer.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    db.expunge_all()
+    return peak / 1024 / 1024, elapsed
+
+
+def run(per_day: int, lengths: list[int]) -> int:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    build_fixture(db, max(lengths), per_day)
+
+    measure(day_by_day, db, 1)  # warm up imports and font metrics
+
+    print(f"\n📊 Range report, {per_day} reservations per day, peak traced memory\n")
+    for days in lengths:
+        naive_peak, naive_s = measure(all_at_once, db, days)
+        peak, seconds = measure(day_by_day, db, days)
+        print(
+            f"   {days:>3} days   all at once {naive_peak:7.2f} MiB ({naive_s:5.2f} s)   "
+            f"day by day {peak:7.2f} MiB ({seconds:5.2f} s)"
+        )
+
+    statements = 0
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _count(*_args):
+        nonlocal statements
+        statements += 1
+
+    with tempfile.TemporaryFile() as output:
+        day_by_day(db, FIRST_DATE, FIRST_DATE + timedelta(days=max(lengths) - 1), output)
+
+    print()
+    if statements != 2:
+        print(f"❌ Expected 2 queries for the range, got {statements}")
+        return 1
+    print(f"✅ {max(lengths)}-day range rendered from 2 queries")
+    return 0
+
+
+if __name__ == "__main__":
+    per_day = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    lengths = [int(arg) for arg in sys.argv[2:]] or [7, 31, 92]
+    sys.exit(run(per_day, lengths))
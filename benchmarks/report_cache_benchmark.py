@@ -0,0 +1,161 @@
+# benchmarks/report_cache_benchmark.py
+#!/usr/bin/env python3
+"""
+Benchmark: GET /admin/reports/daily-pdf for one busy day, three ways:
+
+- render every time (cache cleared before each request, the old behaviour)
+- cached bytes (same date, no writes in between)
+- conditional GET (client sends the ETag back and gets a 304)
+
+Finishes with two invalidation checks, exiting 1 if either fails:
+
+- adding one reservation on the day changes the ETag
+- booking a reservation series (bulk inserts, no ORM flush) over a day
+  whose daily PDF, kitchen manifest and report job are all cached changes
+  both ETags and makes the report job render again
+
+Usage:
+    python benchmarks/report_cache_benchmark.py [requests] [reservations]
+"""
+import os
+import random
+import sys
+import tempfile
+import time as timer
+from datetime import timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_tmp = tempfile.TemporaryDirectory()
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(_tmp.name, 'bench.db')}")
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from fastapi.testclient import TestClient
+
+from app import app
+from benchmarks.report_query_benchmark import BENCH_DATE, build_fixture
+from database import Base, SessionLocal, engine
+from models import Member, Reservation
+from utils.admin_auth import get_admin_user
+from utils.auth import get_current_user
+from utils.principal_cache import Principal
+from utils.report_cache import report_cache
+
+URL = f"/admin/reports/daily-pdf?date={BENCH_DATE.isoformat()}"
+SERIES_DATE = BENCH_DATE + timedelta(days=7)
+
+
+def time_requests(client: TestClient, requests: int, before=None, headers=None) -> tuple[float, int]:
+    """Mean milliseconds per request and the last status code."""
+    status = None
+    started = timer.perf_counter()
+    for _ in range(requests):
+        if before:
+            before()
+        status = client.get(URL, headers=headers).status_code
+    return (timer.perf_counter() - started) / requests * 1000, status
+
+
+def wait_for_job(client: TestClient, job_id: str) -> bytes | None:
+    """The job's PDF once rendered, None if it failed."""
+    while True:
+        response = client.get(f"/admin/reports/jobs/{job_id}")
+        if response.headers["content-type"] == "application/pdf":
+            return response.content
+        if response.json()["status"] == "failed":
+            return None
+        timer.sleep(0.05)
+
+
+def check_series_invalidation(client: TestClient) -> str | None:
+    """Book a series over a fully cached day; the reason it failed, if it did."""
+    day = SERIES_DATE.isoformat()
+    pdf_url = f"/admin/reports/daily-pdf?date={day}"
+    manifest_url = f"/admin/reports/manifest?date={day}"
+
+    pdf_etag = client.get(pdf_url).headers["etag"]
+    manifest = client.get(manifest_url)
+    job = client.post("/admin/reports/jobs", json={"date": day}).json()
+    before = wait_for_job(client, job["id"])
+
+    booked = client.post("/reservation-series", json={
+        "dining_room_id": 1,
+        "frequency": "weekly",
+        "start_date": day,
+        "end_date": (SERIES_DATE + timedelta(days=14)).isoformat(),
+        "meal_type": "dinner",
+        "start_time": "18:00",
+        "end_time": "20:00",
+    })
+    if booked.status_code != 201:
+        return f"series booking failed ({booked.status_code})"
+
+    # The job first: fetching the daily PDF would re-fill the cache
+    job = client.post("/admin/reports/jobs", json={"date": day}).json()
+    if job["status"] == "done":
+        return "report job was served from the stale cache"
+    if wait_for_job(client, job["id"]) in (None, before):
+        return "report job did not render the series booking"
+    if client.get(pdf_url, headers={"If-None-Match": pdf_etag}).status_code != 200:
+        return "daily PDF ETag did not change after a series booking"
+    after = client.get(manifest_url, headers={"If-None-Match": manifest.headers["etag"]})
+    if after.status_code != 200 or after.json()["attendee_count"] != manifest.json()["attendee_count"] + 1:
+        return "kitchen manifest did not change after a series booking"
+    return None
+
+
+def run(requests: int = 50, reservations: int = 150) -> int:
+    Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        build_fixture(db, reservations, random.Random(reservations))
+
+    principal = Principal(id=1, is_admin=True, name="Bench")
+    app.dependency_overrides[get_admin_user] = lambda: principal
+    app.dependency_overrides[get_current_user] = lambda: principal
+    client = TestClient(app)
+    etag = client.get(URL).headers["etag"]
+
+    rendered, _ = time_requests(client, requests, before=report_cache.clear)
+    client.get(URL)  # fill the cache
+    cached, _ = time_requests(client, requests)
+    conditional, status = time_requests(client, requests, headers={"If-None-Match": etag})
+
+    print(f"\n📊 daily-pdf, {reservations} reservations, {requests} requests each\n")
+    print(f"   render every time  {rendered:8.2f} ms/request")
+    print(f"   cached bytes       {cached:8.2f} ms/request   ({rendered / cached:.1f}x faster)")
+    print(f"   If-None-Match      {conditional:8.2f} ms/request   (status {status})")
+    print(f"\n   {report_cache.stats()}\n")
+
+    with SessionLocal() as db:
+        template = db.query(Reservation).first()
+        db.add(Reservation(
+            created_by_id=template.created_by_id,
+            dining_room_id=template.dining_room_id,
+            date=BENCH_DATE,
+            meal_type="dinner",
+            start_time=template.start_time,
+            end_time=template.end_time,
+            status="confirmed",
+        ))
+        db.commit()
+
+    if client.get(URL, headers={"If-None-Match": etag}).status_code != 200:
+        print("❌ ETag did not change after a reservation write")
+        return 1
+    print("✅ Reservation write invalidated the cached report")
+
+    with SessionLocal() as db:
+        # The series creator attends every occurrence as a member
+        db.add(Member(user_id=principal.id, name="Bench", dietary_restrictions="vegan"))
+        db.commit()
+    failure = check_series_invalidation(client)
+    if failure:
+        print(f"❌ {failure}")
+        return 1
+    print("✅ Series booking invalidated the cached report, manifest and report job")
+    return 0
+
+
+if __name__ == "__main__":
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    reservations = int(sys.argv[2]) if len(sys.argv) > 2 else 150
+    sys.exit(run(requests, reservations))
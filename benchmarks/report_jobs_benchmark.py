@@ -0,0 +1,135 @@
+# benchmarks/report_jobs_benchmark.py
+#!/usr/bin/env python3
+"""
+Benchmark: how much report rendering slows every other request.
+
+A probe client keeps calling a cheap endpoint (GET /rules) while daily
+reports for many different dates are rendered, either inline through
+GET /admin/reports/daily-pdf (the ReportLab layout holds the GIL in this
+process) or through the report job API (rendered in the worker pool).
+Reports the probe's latency for each case against an idle baseline, and
+the wall time until every report is ready.
+
+Usage:
+    python benchmarks/report_jobs_benchmark.py [reports] [reservations_per_day]
+"""
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time as timer
+from datetime import date, time, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_tmp = tempfile.TemporaryDirectory()
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(_tmp.name, 'bench.db')}")
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+FIRST_DATE = date(2030, 1, 1)
+
+
+def build_fixture(days: int, per_day: int) -> None:
+    from database import Base, SessionLocal, engine
+    from models import DiningRoom, Reservation, User
+
+    Base.metadata.create_all(bind=engine)
+    rng = random.Random(days)
+    with SessionLocal() as db:
+        users = [User(email=f"bench{i}@example.com", name=f"Bench {i}", password_hash="x") for i in range(20)]
+        rooms = [DiningRoom(name=f"Room {i}", capacity=1000) for i in range(4)]
+        db.add_all(users + rooms)
+        db.flush()
+        for day in range(days):
+            for _ in range(per_day):
+                start_hour = rng.randint(11, 20)
+                db.add(Reservation(
+                    created_by_id=rng.choice(users).id,
+                    dining_room_id=rng.choice(rooms).id,
+                    date=FIRST_DATE + timedelta(days=day),
+                    meal_type="dinner",
+                    start_time=time(start_hour, 0),
+                    end_time=time(min(start_hour + 2, 22), 0),
+                    attendee_count=rng.randint(1, 6),
+                    status="confirmed",
+                ))
+        db.commit()
+
+
+async def probe(client, stop: asyncio.Event) -> list[float]:
+    latencies = []
+    while not stop.is_set():
+        started = timer.perf_counter()
+        await client.get("/rules")
+        latencies.append(timer.perf_counter() - started)
+        await asyncio.sleep(0.005)
+    return latencies
+
+
+async def render_inline(client, dates: list[date]) -> None:
+    await asyncio.gather(*(client.get(f"/admin/reports/daily-pdf?date={d}") for d in dates))
+
+
+async def render_jobs(client, dates: list[date]) -> None:
+    async def one(d: date):
+        job = (await client.post("/admin/reports/jobs", json={"date": d.isoformat()})).json()
+        while (await client.get(f"/admin/reports/jobs/{job['id']}")).status_code == 202:
+            await asyncio.sleep(0.02)
+
+    # Stay within the job queue bound, like a polite client would
+    for i in range(0, len(dates), 8):
+        await asyncio.gather(*(one(d) for d in dates[i:i + 8]))
+
+
+async def measure(client, workload, dates) -> tuple[float, list[float]]:
+    from utils.report_cache import report_cache
+
+    report_cache.clear()
+    stop = asyncio.Event()
+    probing = asyncio.create_task(probe(client, stop))
+    started = timer.perf_counter()
+    if workload:
+        await workload(client, dates)
+    else:
+        await asyncio.sleep(1)
+    elapsed = timer.perf_counter() - started
+    stop.set()
+    return elapsed, await probing
+
+
+def summary(label: str, elapsed: float, latencies: list[float]) -> None:
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] * 1000
+    p95 = latencies[int(len(latencies) * 0.95)] * 1000
+    print(f"   {label:<14} probe p50 {p50:6.1f} ms  p95 {p95:6.1f} ms   reports ready in {elapsed:5.2f} s")
+
+
+async def main(reports: int, per_day: int) -> None:
+    import httpx
+
+    from app import app
+    from utils.admin_auth import get_admin_user
+    from utils.principal_cache import Principal
+    from utils.report_jobs import shutdown_report_pool
+
+    app.dependency_overrides[get_admin_user] = lambda: Principal(id=1, is_admin=True, name="Bench")
+    dates = [FIRST_DATE + timedelta(days=d) for d in range(reports)]
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        await render_jobs(client, dates[:2])  # start the worker processes
+
+        print(f"\n📊 {reports} daily reports ({per_day} reservations each) vs a GET /rules probe\n")
+        summary("idle", *await measure(client, None, dates))
+        summary("inline render", *await measure(client, render_inline, dates))
+        summary("report jobs", *await measure(client, render_jobs, dates))
+        print()
+
+    shutdown_report_pool()
+
+
+if __name__ == "__main__":
+    reports = int(sys.argv[1]) if len(sys.argv) > 1 else 24
+    per_day = int(sys.argv[2]) if len(sys.argv) > 2 else 150
+    build_fixture(reports, per_day)
+    asyncio.run(main(reports, per_day))
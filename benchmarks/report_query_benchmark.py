@@ -0,0 +1,99 @@
+# benchmarks/report_query_benchmark.py
+#!/usr/bin/env python3
+"""
+Query-count check for the daily operations PDF.
+
+Builds throwaway SQLite databases with a growing number of confirmed
+reservations on one day (spread over several rooms and creators), renders
+create_daily_report_pdf for each and counts the SQL statements it issues.
+The count must not grow with the number of reservations; exits 1 if it does.
+
+Usage:
+    python benchmarks/report_query_benchmark.py [sizes...]
+"""
+import os
+import random
+import sys
+import time as timer
+from datetime import date, time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from database import Base
+from models import DiningRoom, Reservation, User
+from routes.reports import create_daily_report_pdf
+
+BENCH_DATE = date(2030, 1, 4)
+
+# The report loads reservations (joined to creators) and rooms
+EXPECTED_QUERIES = 2
+
+
+def build_fixture(db, n_reservations: int, rng: random.Random) -> None:
+    users = [User(email=f"bench{i}@example.com", name=f"Bench {i}", password_hash="x") for i in range(20)]
+    rooms = [DiningRoom(name=f"Room {i}", capacity=1000) for i in range(4)]
+    db.add_all(users + rooms)
+    db.flush()
+
+    for _ in range(n_reservations):
+        start_hour = rng.randint(11, 20)
+        db.add(Reservation(
+            created_by_id=rng.choice(users).id,
+            dining_room_id=rng.choice(rooms).id,
+            date=BENCH_DATE,
+            meal_type="dinner",
+            start_time=time(start_hour, 0),
+            end_time=time(min(start_hour + rng.randint(1, 2), 22), 0),
+            attendee_count=rng.randint(1, 6),
+            status="confirmed",
+        ))
+    db.commit()
+
+
+def measure(n_reservations: int) -> tuple[int, float]:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    build_fixture(db, n_reservations, random.Random(n_reservations))
+    db.expunge_all()
+
+    statements = 0
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _count(*_args):
+        nonlocal statements
+        statements += 1
+
+    started = timer.perf_counter()
+    create_daily_report_pdf(BENCH_DATE, db)
+    elapsed = timer.perf_counter() - started
+
+    db.close()
+    engine.dispose()
+    return statements, elapsed
+
+
+def run(sizes: list[int]) -> int:
+    print("\n📊 create_daily_report_pdf, SQL statements per report\n")
+    counts = []
+    for n in sizes:
+        queries, elapsed = measure(n)
+        counts.append(queries)
+        print(f"   {n:>6} reservations  {queries:3d} queries  {elapsed * 1000:8.1f} ms")
+
+    print()
+    if any(count != EXPECTED_QUERIES for count in counts):
+        print(f"❌ Expected {EXPECTED_QUERIES} queries for every size, got {counts}")
+        return 1
+    print(f"✅ Constant query count ({EXPECTED_QUERIES})")
+    return 0
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [0, 10, 50, 200]
+    sys.exit(run(sizes))
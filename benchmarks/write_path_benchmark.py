@@ -0,0 +1,89 @@
+# benchmarks/write_path_benchmark.py
+#!/usr/bin/env python3
+"""
+Benchmark: reservation write path (create_reservation) latency and commits.
+
+Runs create_reservation directly against a throwaway file-backed SQLite
+database (so every COMMIT pays for a real fsync) and reports the mean
+latency and number of COMMITs per booking.
+
+Usage:
+    python benchmarks/write_path_benchmark.py [bookings]
+"""
+import os
+import sys
+import tempfile
+import time as timer
+from datetime import date, time, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from database import Base
+from models import DiningRoom, Member, Rule, User
+from routes.reservations import create_reservation
+from schemas.reservation import ReservationCreate
+
+
+def build_fixture(db) -> User:
+    user = User(email="bench@example.com", name="Bench", password_hash="x")
+    db.add_all([user, DiningRoom(name="Bench Hall", capacity=1_000_000)])
+    db.flush()
+    db.add(Member(user_id=user.id, name="Bench", relation="self"))
+    db.add_all([
+        Rule(code="peak_hours", name="Peak", fee_type="flat", base_amount=15.0, enabled=1),
+        Rule(code="excess_member_guests", name="Guests", fee_type="per_person", base_amount=15.0, enabled=1),
+        Rule(code="excess_occupancy", name="Occupancy", fee_type="per_person", base_amount=15.0, threshold=12, enabled=1),
+    ])
+    db.commit()
+    return user
+
+
+def run(bookings: int = 500):
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        Base.metadata.create_all(bind=engine)
+        Session = sessionmaker(bind=engine, autoflush=False)
+
+        commits = 0
+
+        @event.listens_for(engine, "commit")
+        def _count_commit(conn):
+            nonlocal commits
+            commits += 1
+
+        with Session() as db:
+            user = build_fixture(db)
+            user_id = user.id
+
+        commits = 0
+        start_day = date(2030, 1, 4)
+        elapsed = 0.0
+        for i in range(bookings):
+            payload = ReservationCreate(
+                dining_room_id=1,
+                date=start_day + timedelta(days=i % 60),
+                meal_type="dinner",
+                start_time=time(18, 0),
+                end_time=time(20, 0),
+            )
+            with Session() as db:
+                current_user = db.get(User, user_id)
+                t0 = timer.perf_counter()
+                create_reservation(payload, current_user=current_user, db=db)
+                elapsed += timer.perf_counter() - t0
+
+        print("=" * 60)
+        print(f"Bookings:        {bookings}")
+        print(f"Latency:         {elapsed * 1000 / bookings:8.2f} ms/booking")
+        print(f"Commits:         {commits / bookings:8.2f} per booking")
+        print("=" * 60)
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:2]]
+    run(*args)
@@ -1,52 +1,447 @@
 # database.py
+import threading
 import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 
-from sqlalchemy import create_engine, text
+from fastapi import Request
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
 from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, DeclarativeBase
 
 from config import settings
+from utils.pool_metrics import InstrumentedAsyncQueuePool, InstrumentedQueuePool, instrument_engine
+from utils.read_routing import client_key, read_router
 
 DATABASE_URL = settings.DATABASE_URL
+DATABASE_REPLICA_URL = settings.DATABASE_REPLICA_URL
 
-if DATABASE_URL.startswith("sqlite"):
-    engine = create_engine(
-        DATABASE_URL,
-        connect_args={"check_same_thread": False},
-    )
-else:
-    engine = create_engine(
-        DATABASE_URL,
-        pool_pre_ping=True,   # detect dead connections before use
-        pool_recycle=300,     # refresh connections periodically (seconds)
-        pool_size=5,
-        max_overflow=10,
-        pool_timeout=30,
+
+def async_database_url(url: str) -> str:
+    """Map a sync DATABASE_URL onto its async driver."""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+
+    if backend == "sqlite":
+        return parsed.set(drivername="sqlite+aiosqlite").render_as_string(hide_password=False)
+
+    if backend in ("postgres", "postgresql"):
+        parsed = parsed.set(drivername="postgresql+asyncpg")
+        # asyncpg takes `ssl`, not libpq's `sslmode`
+        sslmode = parsed.query.get("sslmode")
+        if sslmode:
+            parsed = parsed.difference_update_query(["sslmode"]).update_query_dict({"ssl": sslmode})
+        return parsed.render_as_string(hide_password=False)
+
+    raise ValueError(f"No async driver configured for '{backend}'")
+
+
+def _is_memory_sqlite(url: str) -> bool:
+    return make_url(url).database in (None, "", ":memory:")
+
+
+def _pool_options(url: str) -> dict:
+    options = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+    }
+    if not url.startswith("sqlite"):
+        options["pool_pre_ping"] = True                    # detect dead connections before use
+        options["pool_recycle"] = settings.DB_POOL_RECYCLE  # refresh connections periodically (seconds)
+    return options
+
+
+def make_engine(url: str):
+    if url.startswith("sqlite"):
+        if _is_memory_sqlite(url):
+            return create_engine(url, connect_args={"check_same_thread": False})
+        return create_engine(
+            url,
+            connect_args={"check_same_thread": False},
+            poolclass=InstrumentedQueuePool,
+            **_pool_options(url),
+        )
+    return create_engine(url, poolclass=InstrumentedQueuePool, **_pool_options(url))
+
+
+def make_async_engine(url: str):
+    # Same database through an async driver (asyncpg / aiosqlite), for
+    # I/O-bound read endpoints that should not hold a threadpool worker
+    # while waiting on the database.
+    if url.startswith("sqlite") and _is_memory_sqlite(url):
+        return create_async_engine(async_database_url(url))
+    return create_async_engine(
+        async_database_url(url),
+        poolclass=InstrumentedAsyncQueuePool,
+        **_pool_options(url),
     )
 
+
+engine = make_engine(DATABASE_URL)
+
 SessionLocal = sessionmaker(
     autocommit=False,
     autoflush=False,
     bind=engine,
 )
 
+async_engine = make_async_engine(DATABASE_URL)
+
+instrument_engine(engine, "primary")
+instrument_engine(async_engine.sync_engine, "primary_async")
+
+# expire_on_commit=False: async sessions cannot lazy-load expired attributes
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+
+# ==================== READ REPLICA (OPTIONAL) ====================
+# Read-only handlers can be served from DATABASE_REPLICA_URL; see
+# get_read_db / get_async_read_db below.
+
+replica_engine = None
+ReplicaSessionLocal = None
+async_replica_engine = None
+AsyncReplicaSessionLocal = None
+
+if DATABASE_REPLICA_URL:
+    replica_engine = make_engine(DATABASE_REPLICA_URL)
+    ReplicaSessionLocal = sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        bind=replica_engine,
+    )
+    async_replica_engine = make_async_engine(DATABASE_REPLICA_URL)
+    instrument_engine(replica_engine, "replica")
+    instrument_engine(async_replica_engine.sync_engine, "replica_async")
+    AsyncReplicaSessionLocal = async_sessionmaker(
+        bind=async_replica_engine,
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
+
 class Base(DeclarativeBase):
     pass
 
+
+class DatabaseUnavailable(Exception):
+    """Raised (and mapped to 503) while the circuit breaker is open."""
+
+    def __init__(self, retry_after: float):
+        super().__init__("Database temporarily unavailable")
+        self.retry_after = retry_after
+
+
+# Breaker bookkeeping for the current request (see BreakerScopeMiddleware):
+# the breakers it already counted a failure on, and those it holds the probe of
+_request_breakers: ContextVar[dict | None] = ContextVar("request_breakers", default=None)
+
+
+class CircuitBreaker:
+    """
+    Fail fast while the database is down instead of tying up workers.
+
+    closed    -> requests flow; consecutive connection failures are counted
+    open      -> requests are rejected immediately until the cool-down ends
+    half_open -> one probe request is let through; success closes the
+                 breaker, failure re-opens it with a doubled cool-down
+                 (exponential backoff, capped), never sleeping a worker
+
+    Only connection-level errors count (see record_error), and at most once
+    per request: a request may open several sessions (auth, endpoint), and
+    they all share its one failure and its probe.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        base_cooldown: float = 1.0,
+        max_cooldown: float = 30.0,
+    ):
+        self.failure_threshold = failure_threshold
+        self.base_cooldown = base_cooldown
+        self.max_cooldown = max_cooldown
+
+        self._lock = threading.Lock()
+        self.state = "closed"
+        self._consecutive_failures = 0
+        self._cooldown = base_cooldown
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+        # Counters
+        self.failures = 0
+        self.rejections = 0
+        self.retries = 0  # half-open probes
+        self.trips = 0
+        self.disconnects = 0  # connections invalidated by the pool (incl. pre-ping)
+
+    def allow(self) -> bool:
+        """
+        Raise DatabaseUnavailable unless a session may use the database.
+        Returns True if the session is a half-open probe (see release_probe).
+        """
+        request = _request_breakers.get()
+        if request is not None and self in request["probes"]:
+            # Another session of the probe request; the first one releases
+            return False
+
+        with self._lock:
+            if self.state == "closed":
+                return False
+
+            remaining = self._opened_at + self._cooldown - time.monotonic()
+            if self.state == "open" and remaining <= 0:
+                self.state = "half_open"
+
+            if self.state == "half_open" and not self._probe_in_flight:
+                self._probe_in_flight = True
+                self.retries += 1
+                if request is not None:
+                    request["probes"].add(self)
+                return True
+
+            self.rejections += 1
+            raise DatabaseUnavailable(retry_after=max(remaining, 1.0))
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._consecutive_failures = 0
+            if self.state != "closed":
+                self.state = "closed"
+                self._cooldown = self.base_cooldown
+
+    def record_error(self, exc: OperationalError) -> None:
+        """
+        Count `exc` if the database could not be reached (connect failure or
+        dropped connection). Lock and statement timeouts, "database is
+        locked" and the like come from a live database and are not counted.
+        """
+        if exc.connection_invalidated:
+            self.record_failure()
+
+    def record_failure(self) -> None:
+        request = _request_breakers.get()
+        if request is not None:
+            if self in request["failed"]:
+                return
+            request["failed"].add(self)
+
+        with self._lock:
+            self.failures += 1
+            self._consecutive_failures += 1
+
+            if self.state == "half_open":
+                self._cooldown = min(self._cooldown * 2, self.max_cooldown)
+                self._trip()
+            elif self.state == "closed" and self._consecutive_failures >= self.failure_threshold:
+                self._trip()
+
+    def release_probe(self) -> None:
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_disconnect(self) -> None:
+        with self._lock:
+            self.disconnects += 1
+
+    def _trip(self) -> None:
+        self.state = "open"
+        self._opened_at = time.monotonic()
+        self._probe_in_flight = False
+        self.trips += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "state": self.state,
+                "consecutive_failures": self._consecutive_failures,
+                "cooldown_seconds": self._cooldown,
+                "failures": self.failures,
+                "rejections": self.rejections,
+                "retries": self.retries,
+                "trips": self.trips,
+                "disconnects": self.disconnects,
+            }
+
+
+db_breaker = CircuitBreaker()
+replica_breaker = CircuitBreaker()
+
+
+class BreakerScopeMiddleware:
+    """Give each request its own breaker bookkeeping (one failure, one probe)."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = _request_breakers.set({"failed": set(), "probes": set()})
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _request_breakers.reset(token)
+
+
+def _flag_connection_errors(context, breaker: CircuitBreaker) -> None:
+    if context.is_disconnect:
+        breaker.record_disconnect()
+    elif context.connection is None and not context.is_pre_ping:
+        # Could not connect at all. Flag it like a dropped connection so
+        # the raised error's connection_invalidated is set for record_error
+        context.is_disconnect = True
+
+
+@event.listens_for(engine, "handle_error")
+@event.listens_for(async_engine.sync_engine, "handle_error")
+def _count_disconnects(context) -> None:
+    _flag_connection_errors(context, db_breaker)
+
+
+if replica_engine is not None:
+    @event.listens_for(replica_engine, "handle_error")
+    @event.listens_for(async_replica_engine.sync_engine, "handle_error")
+    def _count_replica_disconnects(context) -> None:
+        _flag_connection_errors(context, replica_breaker)
+
+
 def get_db():
+    """
+    Yield a session. Connection liveness is handled by the pool
+    (pool_pre_ping); connection failures feed the circuit breaker, which
+    answers 503 immediately while the database is down.
+    """
+    probe = db_breaker.allow()
     db = SessionLocal()
     try:
-        # Postgres only: quick retry to survive DB restarts/recovery on Railway
-        if not DATABASE_URL.startswith("sqlite"):
-            for attempt in range(5):
-                try:
-                    db.execute(text("SELECT 1"))
-                    break
-                except OperationalError:
-                    if attempt == 4:
-                        raise
-                    time.sleep(1)
-
         yield db
+    except OperationalError as e:
+        db_breaker.record_error(e)
+        raise
+    else:
+        db_breaker.record_success()
     finally:
+        if probe:
+            db_breaker.release_probe()
         db.close()
+
+
+@asynccontextmanager
+async def primary_async_session():
+    """
+    Async session on the primary behind the circuit breaker, for code that
+    needs one outside dependency injection (get_current_user's cache miss).
+    """
+    probe = db_breaker.allow()
+    async with AsyncSessionLocal() as db:
+        try:
+            yield db
+        except OperationalError as e:
+            db_breaker.record_error(e)
+            raise
+        else:
+            db_breaker.record_success()
+        finally:
+            if probe:
+                db_breaker.release_probe()
+
+
+async def get_async_db():
+    """
+    Async counterpart of get_db for `async def` endpoints. Shares the same
+    circuit breaker.
+    """
+    async with primary_async_session() as db:
+        yield db
+
+
+# ==================== READ-ONLY SESSIONS ====================
+
+def _replica_admitted(request: Request) -> bool | None:
+    """
+    None   -> read from the primary
+    bool   -> read from the replica (value: is this a half-open probe)
+    """
+    if not read_router.use_replica(client_key(request.headers.get("authorization"))):
+        return None
+    try:
+        return replica_breaker.allow()
+    except DatabaseUnavailable:
+        read_router.record_fallback()
+        return None
+
+
+def get_read_db(request: Request):
+    """
+    Session for read-only handlers. Uses the replica when one is configured,
+    except for callers who wrote within the sticky window; falls back to the
+    primary when the replica cannot be reached.
+    """
+    probe = _replica_admitted(request)
+    if probe is not None:
+        db = ReplicaSessionLocal()
+        try:
+            db.connection()  # check out now so an unreachable replica falls back
+        except OperationalError as e:
+            replica_breaker.record_error(e)
+            read_router.record_fallback()
+            db.close()
+            if probe:
+                replica_breaker.release_probe()
+        else:
+            try:
+                yield db
+            except OperationalError as e:
+                replica_breaker.record_error(e)
+                raise
+            else:
+                replica_breaker.record_success()
+            finally:
+                if probe:
+                    replica_breaker.release_probe()
+                db.close()
+            return
+
+    yield from get_db()
+
+
+async def get_async_read_db(request: Request):
+    """Async counterpart of get_read_db."""
+    probe = _replica_admitted(request)
+    if probe is not None:
+        db = AsyncReplicaSessionLocal()
+        try:
+            await db.connection()
+        except OperationalError as e:
+            replica_breaker.record_error(e)
+            read_router.record_fallback()
+            await db.close()
+            if probe:
+                replica_breaker.release_probe()
+        else:
+            try:
+                yield db
+            except OperationalError as e:
+                replica_breaker.record_error(e)
+                raise
+            else:
+                replica_breaker.record_success()
+            finally:
+                if probe:
+                    replica_breaker.release_probe()
+                await db.close()
+            return
+
+    async with primary_async_session() as db:
+        yield db
@@ -0,0 +1,63 @@
+# migrations/add_fee_version_to_reservations.py
+#!/usr/bin/env python3
+"""
+Migration: Add fee_version to reservations table (cross-db, idempotent)
+
+- Postgres: uses ADD COLUMN IF NOT EXISTS
+- SQLite: checks schema via SQLAlchemy inspector before ALTER TABLE
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text, inspect
+from database import engine
+
+
+def _column_exists(table_name: str, column_name: str) -> bool:
+    insp = inspect(engine)
+    cols = [c["name"] for c in insp.get_columns(table_name)]
+    return column_name in cols
+
+
+def upgrade():
+    with engine.connect() as conn:
+        dialect = conn.dialect.name
+
+        if dialect == "postgresql":
+            conn.execute(text("""
+                ALTER TABLE reservations
+                ADD COLUMN IF NOT EXISTS fee_version INTEGER NOT NULL DEFAULT 0
+            """))
+        else:
+            if not _column_exists("reservations", "fee_version"):
+                conn.execute(text("""
+                    ALTER TABLE reservations
+                    ADD COLUMN fee_version INTEGER NOT NULL DEFAULT 0
+                """))
+
+        conn.commit()
+
+    print("✅ fee_version ensured on reservations")
+
+
+def downgrade():
+    with engine.connect() as conn:
+        dialect = conn.dialect.name
+
+        if dialect == "postgresql":
+            conn.execute(text("""
+                ALTER TABLE reservations
+                DROP COLUMN IF EXISTS fee_version
+            """))
+            conn.commit()
+            print("✅ fee_version dropped (if it existed)")
+            return
+
+        print("⚠️  SQLite downgrade not performed (DROP COLUMN may not be supported).")
+        print("   If you really need it, recreate the table without fee_version.")
+
+
+if __name__ == "__main__":
+    upgrade()
@@ -0,0 +1,99 @@
+# migrations/add_party_counts_to_reservations.py
+#!/usr/bin/env python3
+"""
+Migration: Add attendee_count / member_count / guest_count to reservations
+(cross-db, idempotent)
+
+- Adds the three counter columns if missing (NOT NULL DEFAULT 0)
+- Backfills them from reservation_attendees in id-range batches, committing
+  after each batch so large tables don't hold one long write lock
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text, inspect
+from database import engine
+
+COUNTER_COLUMNS = ["attendee_count", "member_count", "guest_count"]
+BATCH_SIZE = 1000
+
+
+def _column_exists(table_name: str, column_name: str) -> bool:
+    insp = inspect(engine)
+    cols = [c["name"] for c in insp.get_columns(table_name)]
+    return column_name in cols
+
+
+def backfill(batch_size: int = BATCH_SIZE):
+    with engine.connect() as conn:
+        max_id = conn.execute(text("SELECT MAX(id) FROM reservations")).scalar() or 0
+
+        for lo in range(0, max_id + 1, batch_size):
+            hi = lo + batch_size - 1
+            conn.execute(text("""
+                UPDATE reservations
+                SET attendee_count = (
+                        SELECT COUNT(*) FROM reservation_attendees ra
+                        WHERE ra.reservation_id = reservations.id
+                    ),
+                    member_count = (
+                        SELECT COUNT(*) FROM reservation_attendees ra
+                        WHERE ra.reservation_id = reservations.id
+                          AND ra.attendee_type = 'member'
+                    ),
+                    guest_count = (
+                        SELECT COUNT(*) FROM reservation_attendees ra
+                        WHERE ra.reservation_id = reservations.id
+                          AND ra.attendee_type <> 'member'
+                    )
+                WHERE id BETWEEN :lo AND :hi
+            """), {"lo": lo, "hi": hi})
+            conn.commit()
+            print(f"   ↻ backfilled reservations {lo}-{min(hi, max_id)}")
+
+
+def upgrade():
+    with engine.connect() as conn:
+        dialect = conn.dialect.name
+
+        for column in COUNTER_COLUMNS:
+            if dialect == "postgresql":
+                conn.execute(text(f"""
+                    ALTER TABLE reservations
+                    ADD COLUMN IF NOT EXISTS {column} INTEGER NOT NULL DEFAULT 0
+                """))
+            else:
+                if not _column_exists("reservations", column):
+                    conn.execute(text(f"""
+                        ALTER TABLE reservations
+                        ADD COLUMN {column} INTEGER NOT NULL DEFAULT 0
+                    """))
+
+        conn.commit()
+
+    backfill()
+    print("✅ party counters ensured and backfilled on reservations")
+
+
+def downgrade():
+    with engine.connect() as conn:
+        dialect = conn.dialect.name
+
+        if dialect == "postgresql":
+            for column in COUNTER_COLUMNS:
+                conn.execute(text(f"""
+                    ALTER TABLE reservations
+                    DROP COLUMN IF EXISTS {column}
+                """))
+            conn.commit()
+            print("✅ party counters dropped (if they existed)")
+            return
+
+        print("⚠️  SQLite downgrade not performed (DROP COLUMN may not be supported).")
+        print("   If you really need it, recreate the table without the counter columns.")
+
+
+if __name__ == "__main__":
+    upgrade()
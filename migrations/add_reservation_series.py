@@ -0,0 +1,78 @@
+# migrations/add_reservation_series.py
+#!/usr/bin/env python3
+"""
+Migration: Add reservation_series table and reservations.series_id
+(cross-db, idempotent)
+
+- Creates reservation_series if missing
+- Adds nullable series_id to reservations if missing
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text, inspect
+from database import engine
+from models.reservation_series import ReservationSeries
+
+
+def _column_exists(table_name: str, column_name: str) -> bool:
+    insp = inspect(engine)
+    cols = [c["name"] for c in insp.get_columns(table_name)]
+    return column_name in cols
+
+
+def upgrade():
+    ReservationSeries.__table__.create(bind=engine, checkfirst=True)
+
+    with engine.connect() as conn:
+        dialect = conn.dialect.name
+
+        if dialect == "postgresql":
+            conn.execute(text("""
+                ALTER TABLE reservations
+                ADD COLUMN IF NOT EXISTS series_id INTEGER
+                REFERENCES reservation_series(id) ON DELETE SET NULL
+            """))
+            conn.execute(text("""
+                CREATE INDEX IF NOT EXISTS ix_reservations_series_id
+                ON reservations (series_id)
+            """))
+        else:
+            if not _column_exists("reservations", "series_id"):
+                conn.execute(text("""
+                    ALTER TABLE reservations
+                    ADD COLUMN series_id INTEGER
+                    REFERENCES reservation_series(id) ON DELETE SET NULL
+                """))
+            conn.execute(text("""
+                CREATE INDEX IF NOT EXISTS ix_reservations_series_id
+                ON reservations (series_id)
+            """))
+
+        conn.commit()
+
+    print("✅ reservation_series table and reservations.series_id ensured")
+
+
+def downgrade():
+    with engine.connect() as conn:
+        dialect = conn.dialect.name
+
+        if dialect == "postgresql":
+            conn.execute(text("""
+                ALTER TABLE reservations
+                DROP COLUMN IF EXISTS series_id
+            """))
+            conn.execute(text("DROP TABLE IF EXISTS reservation_series"))
+            conn.commit()
+            print("✅ series_id and reservation_series dropped (if they existed)")
+            return
+
+        print("⚠️  SQLite downgrade not performed (DROP COLUMN may not be supported).")
+        print("   If you really need it, recreate the table without series_id.")
+
+
+if __name__ == "__main__":
+    upgrade()
@@ -0,0 +1,90 @@
+# migrations/reconcile_party_counts.py
+#!/usr/bin/env python3
+"""
+Maintenance script: Detect drift between the reservation party counters
+(attendee_count / member_count / guest_count) and reservation_attendees.
+
+- Read-only by default: prints every reservation whose counters disagree
+- Pass --fix to rewrite the drifted counters from the real attendee rows
+- Exits non-zero when drift is found and not fixed (usable from cron/CI)
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import case, func, or_
+
+from database import SessionLocal
+from models import Reservation, ReservationAttendee
+
+
+def find_drift(db):
+    actual = (
+        db.query(
+            ReservationAttendee.reservation_id.label("reservation_id"),
+            func.count(ReservationAttendee.id).label("attendees"),
+            func.sum(case((ReservationAttendee.attendee_type == "member", 1), else_=0)).label("members"),
+            func.sum(case((ReservationAttendee.attendee_type == "member", 0), else_=1)).label("guests"),
+        )
+        .group_by(ReservationAttendee.reservation_id)
+        .subquery()
+    )
+
+    attendees = func.coalesce(actual.c.attendees, 0)
+    members = func.coalesce(actual.c.members, 0)
+    guests = func.coalesce(actual.c.guests, 0)
+
+    return (
+        db.query(Reservation, attendees, members, guests)
+        .outerjoin(actual, actual.c.reservation_id == Reservation.id)
+        .filter(
+            or_(
+                Reservation.attendee_count != attendees,
+                Reservation.member_count != members,
+                Reservation.guest_count != guests,
+            )
+        )
+        .order_by(Reservation.id)
+        .all()
+    )
+
+
+def reconcile(fix: bool = False) -> int:
+    db = SessionLocal()
+    try:
+        drifted = find_drift(db)
+
+        if not drifted:
+            print("✅ Party counters match reservation_attendees")
+            return 0
+
+        for res, attendees, members, guests in drifted:
+            print(
+                f"⚠️  Reservation {res.id}: "
+                f"stored {res.attendee_count}/{res.member_count}/{res.guest_count}, "
+                f"actual {attendees}/{members}/{guests} (total/members/guests)"
+            )
+            if fix:
+                res.attendee_count = attendees
+                res.member_count = members
+                res.guest_count = guests
+
+        if fix:
+            db.commit()
+            print(f"✅ Fixed {len(drifted)} reservation(s)")
+            return 0
+
+        print(f"❌ {len(drifted)} reservation(s) drifted. Re-run with --fix to repair.")
+        return 1
+
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Error: {e}")
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    sys.exit(reconcile(fix="--fix" in sys.argv[1:]))
@@ -0,0 +1,111 @@
+# migrations/runner.py
+#!/usr/bin/env python3
+"""
+Migration runner: apply the schema migrations in this folder in order,
+each exactly once, and record them in a schema_migrations table.
+
+- Fresh database: creates every table from the models, then runs the
+  migrations (their column checks make them no-ops) to stamp the version
+- Existing database without schema_migrations: the migrations were all
+  written to be idempotent, so pending ones are simply run
+- Boot only calls current_version() - one query - and runs pending
+  migrations when the database is behind LATEST_VERSION
+
+Seed/maintenance scripts (add_all_families, set_josh_admin, fix_rooms,
+reconcile_party_counts) are NOT migrations and are never run from here.
+
+Usage:
+    python migrations/runner.py            # apply pending migrations
+    python migrations/runner.py --status   # print current/latest version
+"""
+
+import importlib
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from datetime import datetime, timezone
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, insert, text
+from sqlalchemy.exc import DBAPIError
+
+from database import Base, engine
+
+# (version, module) - append new migrations at the end, never reorder
+MIGRATIONS = [
+    (1, "add_is_active_to_rooms"),
+    (2, "add_guest_allowance"),
+    (3, "add_meal_type_to_reservations"),
+    (4, "add_new_fee_rules"),
+    (5, "add_party_counts_to_reservations"),
+    (6, "add_reservation_series"),
+    (7, "add_fee_version_to_reservations"),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+schema_migrations = Table(
+    "schema_migrations",
+    MetaData(),
+    Column("version", Integer, primary_key=True),
+    Column("name", String, nullable=False),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+
+def current_version(bind=engine) -> int:
+    """Highest applied migration; 0 if schema_migrations doesn't exist yet."""
+    try:
+        with bind.connect() as conn:
+            # Plain SQL: skips statement compilation on the boot path
+            return conn.execute(text("SELECT MAX(version) FROM schema_migrations")).scalar() or 0
+    except DBAPIError:
+        # No schema_migrations table (fresh or pre-runner database)
+        return 0
+
+
+def upgrade() -> int:
+    """Apply every pending migration in order. Returns the new version."""
+    schema_migrations.create(bind=engine, checkfirst=True)
+
+    # Models may define tables no migration creates (fresh database)
+    import models  # noqa: F401  (registers every table on Base.metadata)
+    Base.metadata.create_all(bind=engine)
+
+    version = current_version()
+    pending = [(v, name) for v, name in MIGRATIONS if v > version]
+    if not pending:
+        print(f"✅ Schema up to date (version {version})")
+        return version
+
+    for v, name in pending:
+        print(f"🔧 Applying migration {v}: {name}")
+        module = importlib.import_module(f"migrations.{name}")
+        module.upgrade()
+
+        with engine.begin() as conn:
+            conn.execute(insert(schema_migrations).values(
+                version=v,
+                name=name,
+                applied_at=datetime.now(timezone.utc),
+            ))
+        version = v
+
+    print(f"✅ Schema migrated to version {version}")
+    return version
+
+
+def ensure_schema() -> int:
+    """Boot-time check: one version lookup; migrate only if behind."""
+    version = current_version()
+    if version >= LATEST_VERSION:
+        return version
+    print(f"⚠️  Schema at version {version}, latest is {LATEST_VERSION} - migrating")
+    return upgrade()
+
+
+if __name__ == "__main__":
+    if "--status" in sys.argv[1:]:
+        print(f"Schema version {current_version()} (latest {LATEST_VERSION})")
+    else:
+        upgrade()
@@ -4,8 +4,9 @@ from models.member import Member
 from models.dining_room import DiningRoom
 from models.time_slot import TimeSlot
 from models.reservation import Reservation
+from models.reservation_series import ReservationSeries
 from models.reservation_attendee import ReservationAttendee
 from models.rule import Rule
 from models.fee import Fee
 
-__all__ = ["User", "Member", "DiningRoom", "TimeSlot", "Reservation", "ReservationAttendee", "Rule", "Fee"]
\ No newline at end of file
+__all__ = ["User", "Member", "DiningRoom", "TimeSlot", "Reservation", "ReservationSeries", "ReservationAttendee", "Rule", "Fee"]
\ No newline at end of file
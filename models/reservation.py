@@ -19,6 +19,7 @@ if TYPE_CHECKING:
     from models.dining_room import DiningRoom
     from models.reservation_attendee import ReservationAttendee
     from models.fee import Fee
+    from models.reservation_series import ReservationSeries
 
 
 class Reservation(Base):
@@ -39,6 +40,12 @@ class Reservation(Base):
         nullable=False,
         index=True,
     )
+    series_id: Mapped[int | None] = mapped_column(
+        Integer,
+        ForeignKey("reservation_series.id", ondelete="SET NULL"),
+        nullable=True,
+        index=True,
+    )
 
     # Reservation details
     date: Mapped[date_type] = mapped_column(Date, nullable=False, index=True)
@@ -53,6 +60,15 @@ class Reservation(Base):
         index=True,
     )
 
+    # Party counters - maintained by the attendee routes in the same
+    # transaction as the attendee insert/delete (see adjust_party_counts)
+    attendee_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    member_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    guest_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+
+    # Bumped whenever this reservation's fees change; drives the fees ETag
+    fee_version: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -64,6 +80,10 @@ class Reservation(Base):
     # Relationships
     created_by: Mapped["User"] = relationship("User", back_populates="reservations")  # type: ignore
     dining_room: Mapped["DiningRoom"] = relationship("DiningRoom")  # type: ignore
+    series: Mapped["ReservationSeries | None"] = relationship(
+        "ReservationSeries",
+        back_populates="reservations",
+    )  # type: ignore
     attendees: Mapped[list["ReservationAttendee"]] = relationship(
         "ReservationAttendee",
         back_populates="reservation",
@@ -75,6 +95,23 @@ class Reservation(Base):
         cascade="all, delete-orphan",
     )  # type: ignore
 
+    def adjust_party_counts(self, members: int = 0, guests: int = 0) -> None:
+        """
+        Bump the party counters by the given member/guest deltas.
+        Uses SQL-side increments so concurrent writers don't lose updates;
+        the values reload from the DB on next access after flush/commit.
+        """
+        cls = type(self)
+        self.attendee_count = cls.attendee_count + (members + guests)
+        if members:
+            self.member_count = cls.member_count + members
+        if guests:
+            self.guest_count = cls.guest_count + guests
+
+    def bump_fee_version(self) -> None:
+        """Mark this reservation's fees as changed (SQL-side increment)."""
+        self.fee_version = type(self).fee_version + 1
+
     def __repr__(self) -> str:
         return (
             f"<Reservation(id={self.id}, room={self.dining_room_id}, date={self.date}, "
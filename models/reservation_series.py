@@ -0,0 +1,70 @@
+# models/reservation_series.py
+"""
+Reservation Series model - a recurring booking (e.g. every Friday).
+The series is expanded server-side into ordinary Reservation rows,
+each pointing back here via Reservation.series_id.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from datetime import date as date_type
+from datetime import time as time_type
+
+from sqlalchemy import String, Integer, Text, Date, DateTime, Time, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from database import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from models.reservation import Reservation
+
+
+class ReservationSeries(Base):
+    __tablename__ = "reservation_series"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+
+    # Foreign keys
+    created_by_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    dining_room_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("dining_rooms.id", ondelete="RESTRICT"),
+        nullable=False,
+        index=True,
+    )
+
+    # Recurrence rule
+    frequency: Mapped[str] = mapped_column(String(20), nullable=False)  # 'weekly' or 'monthly'
+    start_date: Mapped[date_type] = mapped_column(Date, nullable=False)
+    end_date: Mapped[date_type] = mapped_column(Date, nullable=False)
+
+    # Template for every occurrence
+    meal_type: Mapped[str] = mapped_column(String(20), nullable=False)
+    start_time: Mapped[time_type] = mapped_column(Time, nullable=False)
+    end_time: Mapped[time_type] = mapped_column(Time, nullable=False)
+    notes: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    # Timestamps
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+
+    # Relationships
+    reservations: Mapped[list["Reservation"]] = relationship(
+        "Reservation",
+        back_populates="series",
+    )  # type: ignore
+
+    def __repr__(self) -> str:
+        return (
+            f"<ReservationSeries(id={self.id}, room={self.dining_room_id}, "
+            f"{self.frequency} {self.start_date}..{self.end_date})>"
+        )
@@ -3,8 +3,8 @@ from __future__ import annotations
 from sqlalchemy import String, Integer, Boolean, DateTime
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime, timezone
-import bcrypt
 from database import Base
+from utils.passwords import hash_password_sync, verify_password_sync
 
 
 class User(Base):
@@ -34,12 +34,9 @@ class User(Base):
     reservations: Mapped[list["Reservation"]] = relationship("Reservation", back_populates="created_by", cascade="all, delete-orphan")  # type: ignore
 
     def set_password(self, password: str) -> None:
-        """Hashes the password using bcrypt."""
-        password_bytes = password.encode('utf-8')
-        salt = bcrypt.gensalt()
-        hashed = bcrypt.hashpw(password_bytes, salt)
-        self.password_hash = hashed.decode('utf-8')
+        """Hashes the password using bcrypt (blocking; request handlers use utils.passwords)."""
+        self.password_hash = hash_password_sync(password)
     
     def check_password(self, password: str) -> bool:
-        """Verifies a password against the stored hash."""
-        return bcrypt.checkpw(password.encode('utf-8'), self.password_hash.encode('utf-8'))
\ No newline at end of file
+        """Verifies a password against the stored hash (blocking)."""
+        return verify_password_sync(password, self.password_hash)
\ No newline at end of file
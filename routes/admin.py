@@ -7,17 +7,19 @@ from __future__ import annotations
 
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import datetime
+
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Response, status
 from pydantic import BaseModel
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 
-from database import get_db
+from config import settings
+from database import db_breaker, get_db, get_read_db, replica_breaker
 from models.dining_room import DiningRoom
 from models.fee import Fee
 from models.member import Member
 from models.reservation import Reservation
-from models.reservation_attendee import ReservationAttendee
 from models.rule import Rule
 from models.user import User
 from schemas.dining_room import DiningRoomResponse
@@ -27,6 +29,15 @@ from schemas.reservation import ReservationResponse
 from schemas.rule import RuleResponse, RuleUpdate
 from schemas.user import UserResponse
 from utils.admin_auth import get_admin_user
+from utils.passwords import metrics as password_metrics
+from utils.principal_cache import Principal, principal_cache
+from utils.report_cache import report_cache
+from utils.report_jobs import report_job_stats
+from utils.token_cache import token_cache
+from utils.pool_metrics import pool_stats
+from utils.read_routing import read_router
+from utils.fee_recompute import get_recompute_job, run_recompute_job, start_recompute_job
+from utils.fee_rules import fee_rule_registry
 
 router = APIRouter()
 
@@ -48,13 +59,29 @@ class AdminStats(BaseModel):
     total_revenue: float
 
 
+class FeeRecomputeJob(BaseModel):
+    """Progress of a bulk fee recomputation"""
+    id: str
+    rule_id: int
+    status: str  # queued, running, done, failed
+    total: int
+    processed: int
+    inserted: int
+    updated: int
+    deleted: int
+    skipped: int  # paid or overridden fees left alone
+    error: str | None = None
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+
+
 # ==================== DASHBOARD STATS ====================
 
 @router.get("/stats", response_model=AdminStats)
 @router.get("/stats/", response_model=AdminStats)
 def get_admin_stats(
-    admin: User = Depends(get_admin_user),
-    db: Session = Depends(get_db),
+    admin: Principal = Depends(get_admin_user),
+    db: Session = Depends(get_read_db),
 ):
     """Get dashboard statistics"""
     total_users = db.query(User).count()
@@ -76,13 +103,64 @@ def get_admin_stats(
     }
 
 
+# ==================== CACHE STATS ====================
+
+@router.get("/cache-stats")
+@router.get("/cache-stats/")
+def get_cache_stats(
+    admin: Principal = Depends(get_admin_user),
+):
+    """Hit/miss counters for the in-process caches"""
+    return {
+        "principal_cache": principal_cache.stats(),
+        "token_cache": token_cache.stats(),
+        "report_cache": report_cache.stats(),
+    }
+
+
+# ==================== RUNTIME METRICS ====================
+
+@router.get("/metrics")
+@router.get("/metrics/")
+def get_runtime_metrics(
+    admin: Principal = Depends(get_admin_user),
+):
+    """Queueing and resource counters for this worker process"""
+    return {
+        "password_hashing": password_metrics.stats(),
+        "database": db_breaker.stats(),
+        "replica": {
+            "routing": read_router.stats(),
+            "breaker": replica_breaker.stats(),
+        },
+        "report_jobs": report_job_stats(),
+    }
+
+
+@router.get("/pool-stats")
+@router.get("/pool-stats/")
+def get_pool_stats(
+    admin: Principal = Depends(get_admin_user),
+):
+    """Connection-pool configuration, checkout waits and peaks, per engine"""
+    return {
+        "settings": {
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "pool_timeout": settings.DB_POOL_TIMEOUT,
+            "pool_recycle": settings.DB_POOL_RECYCLE,
+        },
+        "pools": pool_stats(),
+    }
+
+
 # ==================== VIEW ALL DATA ====================
 
 @router.get("/users", response_model=List[UserResponse])
 @router.get("/users/", response_model=List[UserResponse])
 def get_all_users(
-    admin: User = Depends(get_admin_user),
-    db: Session = Depends(get_db),
+    admin: Principal = Depends(get_admin_user),
+    db: Session = Depends(get_read_db),
 ):
     """Get all users in system"""
     return db.query(User).order_by(User.created_at.desc()).all()
@@ -91,8 +169,8 @@ def get_all_users(
 @router.get("/reservations", response_model=List[ReservationResponse])
 @router.get("/reservations/", response_model=List[ReservationResponse])
 def get_all_reservations(
-    admin: User = Depends(get_admin_user),
-    db: Session = Depends(get_db),
+    admin: Principal = Depends(get_admin_user),
+    db: Session = Depends(get_read_db),
     status: str | None = None,
     room_id: int | None = None,
 ):
@@ -115,10 +193,6 @@ def get_all_reservations(
 
     result: list[ReservationResponse] = []
     for res in reservations:
-        attendee_count = db.query(ReservationAttendee).filter_by(
-            reservation_id=res.id
-        ).count()
-
         result.append(
             ReservationResponse(
                 id=res.id,
@@ -131,7 +205,7 @@ def get_all_reservations(
                 notes=res.notes,
                 status=res.status,
                 created_at=res.created_at,
-                attendee_count=attendee_count,
+                attendee_count=res.attendee_count,
             )
         )
 
@@ -141,8 +215,8 @@ def get_all_reservations(
 @router.get("/members", response_model=List[MemberResponse])
 @router.get("/members/", response_model=List[MemberResponse])
 def get_all_members(
-    admin: User = Depends(get_admin_user),
-    db: Session = Depends(get_db),
+    admin: Principal = Depends(get_admin_user),
+    db: Session = Depends(get_read_db),
 ):
     """Get all family members across all users"""
     return db.query(Member).order_by(Member.name).all()
@@ -153,22 +227,32 @@ def get_all_members(
 @router.get("/rules", response_model=List[RuleResponse])
 @router.get("/rules/", response_model=List[RuleResponse])
 def get_all_rules_admin(
-    admin: User = Depends(get_admin_user),
-    db: Session = Depends(get_db),
+    admin: Principal = Depends(get_admin_user),
+    db: Session = Depends(get_read_db),
 ):
     """Get all fee rules (including disabled ones)"""
     return db.query(Rule).order_by(Rule.id).all()
 
 
+# Rule fields that change what a fee is worth
+FEE_INPUT_FIELDS = ("base_amount", "threshold", "enabled")
+
+
 @router.patch("/rules/{rule_id}", response_model=RuleResponse)
 @router.patch("/rules/{rule_id}/", response_model=RuleResponse)
 def update_rule(
     rule_id: int,
     rule_update: RuleUpdate,
-    admin: User = Depends(get_admin_user),
+    response: Response,
+    background_tasks: BackgroundTasks,
+    admin: Principal = Depends(get_admin_user),
     db: Session = Depends(get_db),
 ):
-    """Update fee rule (amount, threshold, enabled status)"""
+    """
+    Update fee rule (amount, threshold, enabled status).
+    If a pricing field changed, fees on future reservations are recomputed
+    in the background; the job id is returned in X-Fee-Recompute-Job.
+    """
     rule = db.query(Rule).filter(Rule.id == rule_id).first()
     if not rule:
         raise HTTPException(status_code=404, detail="Rule not found")
@@ -179,14 +263,56 @@ def update_rule(
     if "enabled" in data and data["enabled"] is not None:
         data["enabled"] = 1 if data["enabled"] else 0
 
+    pricing_changed = any(
+        key in data and data[key] != getattr(rule, key) for key in FEE_INPUT_FIELDS
+    )
+
     for key, value in data.items():
         setattr(rule, key, value)
 
     db.commit()
+    fee_rule_registry.invalidate()
     db.refresh(rule)
+
+    if pricing_changed:
+        job_id = start_recompute_job(rule.id)
+        background_tasks.add_task(run_recompute_job, job_id)
+        response.headers["X-Fee-Recompute-Job"] = job_id
+
     return rule
 
 
+@router.post("/rules/{rule_id}/recompute-fees", response_model=FeeRecomputeJob, status_code=status.HTTP_202_ACCEPTED)
+@router.post("/rules/{rule_id}/recompute-fees/", response_model=FeeRecomputeJob, status_code=status.HTTP_202_ACCEPTED)
+def recompute_rule_fees(
+    rule_id: int,
+    background_tasks: BackgroundTasks,
+    admin: Principal = Depends(get_admin_user),
+    db: Session = Depends(get_db),
+):
+    """Manually re-price a rule's fees on every future reservation"""
+    rule = db.query(Rule).filter(Rule.id == rule_id).first()
+    if not rule:
+        raise HTTPException(status_code=404, detail="Rule not found")
+
+    job_id = start_recompute_job(rule.id)
+    background_tasks.add_task(run_recompute_job, job_id)
+    return get_recompute_job(job_id)
+
+
+@router.get("/fee-recompute-jobs/{job_id}", response_model=FeeRecomputeJob)
+@router.get("/fee-recompute-jobs/{job_id}/", response_model=FeeRecomputeJob)
+def get_fee_recompute_job(
+    job_id: str,
+    admin: Principal = Depends(get_admin_user),
+):
+    """Poll the progress of a bulk fee recomputation"""
+    job = get_recompute_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
 # ==================== DINING ROOM MANAGEMENT ====================
 
 @router.patch("/dining-rooms/{room_id}", response_model=DiningRoomResponse)
@@ -194,7 +320,7 @@ def update_rule(
 def update_dining_room(
     room_id: int,
     room_update: DiningRoomUpdate,
-    admin: User = Depends(get_admin_user),
+    admin: Principal = Depends(get_admin_user),
     db: Session = Depends(get_db),
 ):
     """Update dining room capacity or availability"""
@@ -220,8 +346,8 @@ def update_dining_room(
 @router.get("/fees", response_model=List[FeeResponse])
 @router.get("/fees/", response_model=List[FeeResponse])
 def admin_list_fees(
-    admin: User = Depends(get_admin_user),
-    db: Session = Depends(get_db),
+    admin: Principal = Depends(get_admin_user),
+    db: Session = Depends(get_read_db),
 ):
     """List all fees (most recent first)"""
     return db.query(Fee).order_by(Fee.created_at.desc()).all()
@@ -232,7 +358,7 @@ def admin_list_fees(
 def admin_update_fee(
     fee_id: int,
     fee_update: FeeUpdate,
-    admin: User = Depends(get_admin_user),
+    admin: Principal = Depends(get_admin_user),
     db: Session = Depends(get_db),
 ):
     """Update a fee (override amount, mark paid/unpaid)"""
@@ -249,6 +375,7 @@ def admin_update_fee(
     if "override_amount" in data:
         fee.override_amount = data["override_amount"]
 
+    fee.reservation.bump_fee_version()
     db.commit()
     db.refresh(fee)
     return fee
@@ -260,7 +387,7 @@ def admin_update_fee(
 @router.delete("/reservations/{reservation_id}/", status_code=status.HTTP_204_NO_CONTENT)
 def admin_delete_reservation(
     reservation_id: int,
-    admin: User = Depends(get_admin_user),
+    admin: Principal = Depends(get_admin_user),
     db: Session = Depends(get_db),
 ):
     """Admin can delete ANY reservation"""
@@ -277,7 +404,7 @@ def admin_delete_reservation(
 @router.delete("/members/{member_id}/", status_code=status.HTTP_204_NO_CONTENT)
 def admin_delete_member(
     member_id: int,
-    admin: User = Depends(get_admin_user),
+    admin: Principal = Depends(get_admin_user),
     db: Session = Depends(get_db),
 ):
     """Admin can delete ANY member"""
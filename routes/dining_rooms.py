@@ -1,16 +1,85 @@
 # routes/dining_rooms.py
-from fastapi import APIRouter, Depends
+from datetime import date, datetime, timedelta
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List
-from database import get_db
+from database import get_async_read_db, get_read_db
 from models.dining_room import DiningRoom
-from schemas.dining_room import DiningRoomResponse
+from schemas.dining_room import AvailabilityResponse, DiningRoomResponse, RoomAvailability
+from utils.availability import occupancy_matrix, parse_granularity, remaining_capacity
 
 router = APIRouter()
 
+MAX_AVAILABILITY_DAYS = 62
+
+
 @router.get("/", response_model=List[DiningRoomResponse])
 @router.get("", response_model=List[DiningRoomResponse])
-def get_dining_rooms(db: Session = Depends(get_db)):
+async def get_dining_rooms(db: AsyncSession = Depends(get_async_read_db)):
     """Get all dining rooms (includes is_active field)"""
-    rooms = db.query(DiningRoom).all()
-    return rooms
\ No newline at end of file
+    rooms = await db.scalars(select(DiningRoom))
+    return rooms.all()
+
+
+@router.get("/availability", response_model=AvailabilityResponse)
+@router.get("/availability/", response_model=AvailabilityResponse)
+def get_availability(
+    date_from: date = Query(..., alias="from"),
+    date_to: date = Query(..., alias="to"),
+    granularity: str = "15m",
+    db: Session = Depends(get_read_db),
+):
+    """
+    Remaining capacity for every active room in every time bucket.
+
+    Query params:
+    - from / to: inclusive date range (YYYY-MM-DD)
+    - granularity: bucket size, e.g. 15m, 30m, 1h (must divide 24 hours)
+
+    Bucket i of every room starts at bucket_starts[i].
+    """
+    try:
+        minutes = parse_granularity(granularity)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if date_to < date_from:
+        raise HTTPException(status_code=400, detail="'to' must be on or after 'from'")
+    if (date_to - date_from).days + 1 > MAX_AVAILABILITY_DAYS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Range too large (max {MAX_AVAILABILITY_DAYS} days)",
+        )
+
+    rooms = (
+        db.query(DiningRoom)
+        .filter(DiningRoom.is_active == True)  # noqa: E712
+        .order_by(DiningRoom.id)
+        .all()
+    )
+
+    occupancy = occupancy_matrix(db, rooms, date_from, date_to, minutes)
+    remaining = remaining_capacity(rooms, occupancy)
+
+    start = datetime.combine(date_from, datetime.min.time())
+    step = timedelta(minutes=minutes)
+    bucket_starts = [start + i * step for i in range(occupancy.shape[1])]
+
+    return AvailabilityResponse(
+        date_from=date_from,
+        date_to=date_to,
+        granularity_minutes=minutes,
+        bucket_starts=bucket_starts,
+        rooms=[
+            RoomAvailability(
+                id=room.id,
+                name=room.name,
+                capacity=room.capacity,
+                remaining=remaining[i].tolist(),
+            )
+            for i, room in enumerate(rooms)
+        ],
+    )
@@ -0,0 +1,201 @@
+# routes/exports.py
+"""
+Bulk exports for finance: reservations, attendees and fees as CSV or NDJSON.
+
+GET /admin/export/{reservations|attendees|fees}.{csv|ndjson}?from=&to=
+
+Rows are read with yield_per (a server-side cursor on Postgres) and sent
+in batches as they arrive, so an export of any size holds one batch in
+memory and the first bytes go out straight away. Date filters apply to the
+reservation date (attendees and fees follow their reservation).
+"""
+import csv
+import io
+import json
+from datetime import datetime, date
+from typing import Iterator
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from database import get_read_db
+from models.dining_room import DiningRoom
+from models.fee import Fee
+from models.reservation import Reservation
+from models.reservation_attendee import ReservationAttendee
+from models.rule import Rule
+from models.user import User
+from utils.admin_auth import get_admin_user
+from utils.principal_cache import Principal
+
+router = APIRouter()
+
+# Rows fetched from the cursor (and written to the response) per batch
+EXPORT_BATCH_SIZE = 1000
+
+MEDIA_TYPES = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+}
+
+
+# ==================== DATASETS ====================
+
+# (column name in the export, selected expression)
+EXPORT_COLUMNS = {
+    "reservations": [
+        ("id", Reservation.id),
+        ("date", Reservation.date),
+        ("meal_type", Reservation.meal_type),
+        ("start_time", Reservation.start_time),
+        ("end_time", Reservation.end_time),
+        ("status", Reservation.status),
+        ("dining_room_id", Reservation.dining_room_id),
+        ("dining_room", DiningRoom.name),
+        ("created_by_id", Reservation.created_by_id),
+        ("created_by_email", User.email),
+        ("attendee_count", Reservation.attendee_count),
+        ("member_count", Reservation.member_count),
+        ("guest_count", Reservation.guest_count),
+        ("notes", Reservation.notes),
+        ("created_at", Reservation.created_at),
+    ],
+    "attendees": [
+        ("id", ReservationAttendee.id),
+        ("reservation_id", ReservationAttendee.reservation_id),
+        ("reservation_date", Reservation.date),
+        ("name", ReservationAttendee.name),
+        ("attendee_type", ReservationAttendee.attendee_type),
+        ("member_id", ReservationAttendee.member_id),
+        ("dietary_restrictions", ReservationAttendee.dietary_restrictions),
+    ],
+    "fees": [
+        ("id", Fee.id),
+        ("reservation_id", Fee.reservation_id),
+        ("reservation_date", Reservation.date),
+        ("rule_id", Fee.rule_id),
+        ("rule_code", Rule.code),
+        ("quantity", Fee.quantity),
+        ("calculated_amount", Fee.calculated_amount),
+        ("override_amount", Fee.override_amount),
+        ("paid", Fee.paid),
+        ("created_at", Fee.created_at),
+    ],
+}
+
+
+def export_query(db: Session, dataset: str, start: date | None = None, end: date | None = None):
+    """The dataset's rows (in EXPORT_COLUMNS order), streamed in batches"""
+    query = db.query(*(column for _, column in EXPORT_COLUMNS[dataset]))
+
+    if dataset == "reservations":
+        query = (
+            query.outerjoin(DiningRoom, DiningRoom.id == Reservation.dining_room_id)
+            .outerjoin(User, User.id == Reservation.created_by_id)
+            .order_by(Reservation.date, Reservation.id)
+        )
+    elif dataset == "attendees":
+        query = (
+            query.join(Reservation, Reservation.id == ReservationAttendee.reservation_id)
+            .order_by(Reservation.date, ReservationAttendee.id)
+        )
+    else:
+        query = (
+            query.join(Reservation, Reservation.id == Fee.reservation_id)
+            .outerjoin(Rule, Rule.id == Fee.rule_id)
+            .order_by(Reservation.date, Fee.id)
+        )
+
+    if start:
+        query = query.filter(Reservation.date >= start)
+    if end:
+        query = query.filter(Reservation.date <= end)
+
+    return query.yield_per(EXPORT_BATCH_SIZE)
+
+
+# ==================== FORMATS ====================
+
+def _plain(value):
+    # Dates/times as ISO 8601, like the JSON API
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return value
+
+
+def _csv_chunks(names: list[str], rows) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(names)
+    for i, row in enumerate(rows, 1):
+        writer.writerow([_plain(value) for value in row])
+        if i % EXPORT_BATCH_SIZE == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def _ndjson_chunks(names: list[str], rows) -> Iterator[str]:
+    lines = []
+    for row in rows:
+        lines.append(json.dumps({name: _plain(value) for name, value in zip(names, row)}))
+        if len(lines) == EXPORT_BATCH_SIZE:
+            yield "\n".join(lines) + "\n"
+            lines = []
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+
+def export_chunks(db: Session, dataset: str, fmt: str, start: date | None = None, end: date | None = None) -> Iterator[str]:
+    """The export body, one batch of rows per chunk"""
+    names = [name for name, _ in EXPORT_COLUMNS[dataset]]
+    rows = export_query(db, dataset, start, end)
+    if fmt == "csv":
+        return _csv_chunks(names, rows)
+    return _ndjson_chunks(names, rows)
+
+
+# ==================== ENDPOINT ====================
+
+def _parse_date(value: str | None, param: str) -> date | None:
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid '{param}' date. Use YYYY-MM-DD")
+
+
+@router.get("/{dataset}.{fmt}")
+@router.get("/{dataset}.{fmt}/")
+def export_dataset(
+    dataset: str,
+    fmt: str,
+    from_date: str | None = Query(default=None, alias="from"),
+    to_date: str | None = Query(default=None, alias="to"),
+    admin: Principal = Depends(get_admin_user),
+    db: Session = Depends(get_read_db),
+):
+    """
+    Stream every reservation, attendee or fee (optionally limited to
+    reservation dates from/to, inclusive) as CSV or NDJSON
+    """
+    if dataset not in EXPORT_COLUMNS or fmt not in MEDIA_TYPES:
+        raise HTTPException(status_code=404, detail="Unknown export")
+
+    start = _parse_date(from_date, "from")
+    end = _parse_date(to_date, "to")
+    if start and end and end < start:
+        raise HTTPException(status_code=400, detail="'to' must not be before 'from'")
+
+    span = "_".join(d.strftime("%Y%m%d") for d in (start, end) if d)
+    filename = f"sterling_{dataset}{'_' + span if span else ''}.{fmt}"
+
+    # The session stays open until the response finishes (request-scoped dependency)
+    return StreamingResponse(
+        export_chunks(db, dataset, fmt, start, end),
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -1,10 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from database import get_db
-from models.user import User
+from database import get_async_db, get_db
 from models.member import Member
 from schemas.member import MemberCreate, MemberUpdate, MemberResponse
 from utils.auth import get_current_user
+from utils.principal_cache import Principal
 
 router = APIRouter()
 
@@ -13,7 +15,7 @@ router = APIRouter()
 @router.post("/", response_model=MemberResponse, status_code=status.HTTP_201_CREATED)
 def create_member(
     member_in: MemberCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     new_member = Member(
@@ -30,23 +32,26 @@ def create_member(
 
 @router.get("", response_model=list[MemberResponse])
 @router.get("/", response_model=list[MemberResponse])
-def get_my_members(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+async def get_my_members(
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    return db.query(Member).filter(Member.user_id == current_user.id).all()
+    members = await db.scalars(select(Member).where(Member.user_id == current_user.id))
+    return members.all()
 
 
 @router.get("/{member_id}", response_model=MemberResponse)
-def get_member(
+async def get_member(
     member_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    member = db.query(Member).filter(
-        Member.id == member_id,
-        Member.user_id == current_user.id
-    ).first()
+    member = await db.scalar(
+        select(Member).where(
+            Member.id == member_id,
+            Member.user_id == current_user.id
+        )
+    )
 
     if not member:
         raise HTTPException(status_code=404, detail="Member not found")
@@ -58,7 +63,7 @@ def get_member(
 def update_member(
     member_id: int,
     member_update: MemberUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     member = db.query(Member).filter(
@@ -80,7 +85,7 @@ def update_member(
 @router.delete("/{member_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_member(
     member_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     member = db.query(Member).filter(
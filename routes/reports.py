@@ -1,275 +1,475 @@
 # FORCE UPDATE: 2026-02-03 REPORT FIX
 # routes/reports.py
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
 from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy import case
 from sqlalchemy.orm import Session
-from datetime import datetime, date
+from collections import Counter
+from datetime import datetime, date, time, timedelta
 from io import BytesIO
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import letter, landscape
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
-from reportlab.lib.enums import TA_CENTER
-
-from database import get_db
+from itertools import groupby
+from typing import Iterator
+import tempfile
+
+from database import get_db, get_read_db
 from models.user import User
 from models.reservation import Reservation
 from models.dining_room import DiningRoom
+from models.member import Member
 from models.reservation_attendee import ReservationAttendee
 from utils.admin_auth import get_admin_user
+from utils.dietary import dietary_tags
+from utils.etags import etag_matches
+from utils.principal_cache import Principal
+from utils.report_cache import report_cache, report_versions
+from utils.report_jobs import (
+    ReportJobsBusy,
+    get_report_job,
+    get_report_job_result,
+    submit_report_job,
+)
+from utils.report_render import (
+    ReportBooking,
+    ReportRoom,
+    render_daily_report_bytes,
+    render_daily_report_pdf,
+    render_range_report_pdf,
+)
 
 router = APIRouter()
 
-def create_daily_report_pdf(target_date: date, db: Session) -> BytesIO:
-    """Generate daily operations PDF for restaurant"""
-    
-    buffer = BytesIO()
-    doc = SimpleDocTemplate(
-        buffer,
-        pagesize=landscape(letter),
-        rightMargin=0.5*inch,
-        leftMargin=0.5*inch,
-        topMargin=0.75*inch,
-        bottomMargin=0.5*inch
-    )
-    
-    # Container for PDF elements
-    elements = []
-    styles = getSampleStyleSheet()
-    
-    # Custom styles
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=24,
-        textColor=colors.HexColor('#121212'),
-        spaceAfter=6,
-        alignment=TA_CENTER,
-        fontName='Helvetica-Bold'
+# Longest range GET /range-pdf renders (one page per day)
+MAX_RANGE_DAYS = 92
+
+# Range reservations are read from the cursor in batches of this size
+RANGE_BATCH_SIZE = 500
+
+# Rendered range PDFs spill from memory to a temp file past this size
+RANGE_SPOOL_BYTES = 1024 * 1024
+
+
+# ==================== SCHEMAS ====================
+
+class ReportJobRequest(BaseModel):
+    """Report to render in the background (defaults to today)"""
+    date: str | None = None
+
+
+class ReportJob(BaseModel):
+    """Status of a background report render"""
+    id: str
+    kind: str
+    date: date
+    filename: str
+    status: str
+    size: int | None = None
+    error: str | None = None
+    created_at: datetime
+    finished_at: datetime | None = None
+
+
+class ManifestAttendee(BaseModel):
+    id: int
+    name: str
+    attendee_type: str
+    dietary_restrictions: str | None = None
+    dietary_tags: list[str]
+
+
+class ManifestReservation(BaseModel):
+    reservation_id: int
+    start_time: time
+    end_time: time
+    created_by: str | None = None
+    attendees: list[ManifestAttendee]
+
+
+class ManifestMeal(BaseModel):
+    meal_type: str
+    attendee_count: int
+    dietary_counts: dict[str, int]
+    reservations: list[ManifestReservation]
+
+
+class ManifestRoom(BaseModel):
+    room_id: int
+    room_name: str
+    attendee_count: int
+    dietary_counts: dict[str, int]
+    meals: list[ManifestMeal]
+
+
+class KitchenManifest(BaseModel):
+    """Day-of-service attendee list with dietary tag counts, per room and meal"""
+    date: date
+    attendee_count: int
+    dietary_counts: dict[str, int]
+    rooms: list[ManifestRoom]
+
+
+# ==================== REPORT DATA ====================
+
+def _booking_columns() -> tuple:
+    """Reservation fields the report shows, plus the creator's name"""
+    return (
+        Reservation.dining_room_id,
+        Reservation.start_time,
+        Reservation.end_time,
+        Reservation.attendee_count,
+        User.name,
     )
-    
-    subtitle_style = ParagraphStyle(
-        'CustomSubtitle',
-        parent=styles['Normal'],
-        fontSize=11,
-        textColor=colors.HexColor('#757575'),
-        spaceAfter=20,
-        alignment=TA_CENTER,
-        fontName='Helvetica'
+
+
+def load_report_rooms(db: Session) -> list[ReportRoom]:
+    return [
+        ReportRoom(*row)
+        for row in db.query(DiningRoom.id, DiningRoom.name, DiningRoom.is_active)
+        .order_by(DiningRoom.id)
+        .all()
+    ]
+
+
+def load_daily_report_data(db: Session, target_date: date) -> tuple[list[ReportRoom], list[ReportBooking]]:
+    """
+    Everything the daily report shows, in two queries: the day's confirmed
+    reservations joined to their creator's name (attendee counts are on the
+    reservation row), and the rooms.
+    """
+    bookings = [
+        ReportBooking(*row)
+        for row in db.query(*_booking_columns())
+        .outerjoin(User, User.id == Reservation.created_by_id)
+        .filter(
+            Reservation.date == target_date,
+            Reservation.status == "confirmed"
+        )
+        .order_by(Reservation.start_time)
+        .all()
+    ]
+
+    return load_report_rooms(db), bookings
+
+
+def iter_report_days(db: Session, start: date, end: date) -> Iterator[tuple[date, list[ReportBooking]]]:
+    """
+    Every date from start to end (inclusive) with its confirmed bookings.
+    One range query, read in batches and grouped by date as it is
+    consumed; dates without bookings come through with an empty list.
+    """
+    rows = (
+        db.query(Reservation.date, *_booking_columns())
+        .outerjoin(User, User.id == Reservation.created_by_id)
+        .filter(
+            Reservation.date >= start,
+            Reservation.date <= end,
+            Reservation.status == "confirmed"
+        )
+        .order_by(Reservation.date, Reservation.start_time)
+        .yield_per(RANGE_BATCH_SIZE)
     )
+    by_day = groupby(rows, key=lambda row: row[0])
+    current = next(by_day, None)
+
+    day = start
+    while day <= end:
+        if current is not None and current[0] == day:
+            yield day, [ReportBooking(*row[1:]) for row in current[1]]
+            current = next(by_day, None)
+        else:
+            yield day, []
+        day += timedelta(days=1)
+
+
+# ==================== PDF ====================
+
+def create_daily_report_pdf(target_date: date, db: Session) -> BytesIO:
+    """Generate daily operations PDF for restaurant"""
+    rooms, bookings = load_daily_report_data(db, target_date)
+    return render_daily_report_pdf(target_date, rooms, bookings)
+
+
+def _parse_report_date(value: str | None) -> date:
+    if not value:
+        return datetime.now().date()
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
+
+
+def _daily_report_filename(target_date: date) -> str:
+    return f"sterling_daily_report_{target_date.strftime('%Y%m%d')}.pdf"
+
+
+@router.get("/daily-pdf")
+@router.get("/daily-pdf/")
+def get_daily_report_pdf(
+    date: str | None = None,
+    if_none_match: str | None = Header(default=None),
+    admin: Principal = Depends(get_admin_user),
+    # Primary, not the replica: a lagging replica read would be cached
+    # under the post-write version and served until the next write
+    db: Session = Depends(get_db)
+):
+    target_date = _parse_report_date(date)
     
-    header_style = ParagraphStyle(
-        'SectionHeader',
-        parent=styles['Heading2'],
-        fontSize=14,
-        textColor=colors.HexColor('#eb5638'),
-        spaceAfter=10,
-        fontName='Helvetica-Bold'
-    )
+    # Read the version before the data so a concurrent write can only make
+    # this render look stale, never fresh
+    etag = report_versions.etag(target_date)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
     
-    # ==================== HEADER ====================
-    elements.append(Paragraph("STERLING CATERING", title_style))
-    elements.append(Paragraph("DAILY OPERATIONS REPORT", title_style))
+    if etag_matches(if_none_match, etag):
+        report_cache.record_not_modified()
+        return Response(status_code=304, headers=headers)
     
-    date_str = target_date.strftime("%A, %B %d, %Y")
-    elements.append(Paragraph(date_str, subtitle_style))
-    elements.append(Paragraph(
-        "Contact: (555) 123-4567 | reservations@sterlingcatering.com",
-        subtitle_style
-    ))
+    pdf = report_cache.get("daily", target_date, etag)
+    if pdf is None:
+        pdf = create_daily_report_pdf(target_date, db).getvalue()
+        report_cache.put("daily", target_date, etag, pdf)
     
-    elements.append(Spacer(1, 0.3*inch))
+    headers["Content-Disposition"] = f'attachment; filename="{_daily_report_filename(target_date)}"'
     
-    # ==================== GET DATA ====================
+    return Response(content=pdf, media_type="application/pdf", headers=headers)
+
+
+# ==================== REPORT JOBS ====================
+
+@router.post("/jobs", response_model=ReportJob, status_code=status.HTTP_202_ACCEPTED)
+@router.post("/jobs/", response_model=ReportJob, status_code=status.HTTP_202_ACCEPTED)
+def create_report_job(
+    job_request: ReportJobRequest,
+    admin: Principal = Depends(get_admin_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Render the daily report in the background. A report that is already
+    being rendered (or was just rendered) returns the existing job.
+    """
+    target_date = _parse_report_date(job_request.date)
+    etag = report_versions.etag(target_date)
     
-    # Get all reservations for the day (Confirmed only)
-    reservations = db.query(Reservation).filter(
-        Reservation.date == target_date,
-        Reservation.status == "confirmed"
-    ).order_by(Reservation.start_time).all()
+    try:
+        return submit_report_job(
+            "daily",
+            target_date,
+            etag,
+            _daily_report_filename(target_date),
+            render_daily_report_bytes,
+            lambda: (target_date, *load_daily_report_data(db, target_date)),
+        )
+    except ReportJobsBusy:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Report queue is full, please retry",
+            headers={"Retry-After": "5"},
+        )
+
+
+@router.get("/jobs/{job_id}", response_model=ReportJob)
+@router.get("/jobs/{job_id}/", response_model=ReportJob)
+def get_report_job_status(
+    job_id: str,
+    response: Response,
+    admin: Principal = Depends(get_admin_user),
+):
+    """Poll a report job: its status while pending, then the PDF itself"""
+    job = get_report_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Report job not found")
     
-    # Get all rooms
-    rooms = db.query(DiningRoom).order_by(DiningRoom.id).all()
+    if job["status"] == "done":
+        pdf = get_report_job_result(job_id)
+        if pdf is not None:
+            return Response(
+                content=pdf,
+                media_type="application/pdf",
+                headers={"Content-Disposition": f'attachment; filename="{job["filename"]}"'},
+            )
     
-    # Calculate stats
-    total_reservations = len(reservations)
-    total_guests = sum([
-        db.query(ReservationAttendee).filter_by(reservation_id=r.id).count()
-        for r in reservations
-    ])
+    if job["status"] != "failed":
+        response.status_code = status.HTTP_202_ACCEPTED
+    return job
+
+
+# ==================== RANGE REPORT ====================
+
+def _iter_file(file, chunk_size: int = 64 * 1024):
+    try:
+        while chunk := file.read(chunk_size):
+            yield chunk
+    finally:
+        file.close()
+
+
+@router.get("/range-pdf")
+@router.get("/range-pdf/")
+def get_range_report_pdf(
+    from_date: str = Query(alias="from"),
+    to_date: str = Query(alias="to"),
+    admin: Principal = Depends(get_admin_user),
+    db: Session = Depends(get_read_db)
+):
+    """
+    Daily operations report for every date in a range, one page per day
+    (e.g. a week for planning).
+
+    Days are laid out one at a time straight from the range query, so memory
+    stays flat however long the range is. ReportLab writes the PDF's
+    cross-reference table last, so nothing can be sent before the final
+    page; the file is spooled (to disk past RANGE_SPOOL_BYTES) and then
+    streamed out in chunks.
+    """
+    start = _parse_report_date(from_date)
+    end = _parse_report_date(to_date)
+    if end < start:
+        raise HTTPException(status_code=400, detail="'to' must not be before 'from'")
+    if (end - start).days + 1 > MAX_RANGE_DAYS:
+        raise HTTPException(status_code=400, detail=f"Range is limited to {MAX_RANGE_DAYS} days")
     
-    # ==================== SUMMARY STATS ====================
-    elements.append(Paragraph("TODAY'S SUMMARY", header_style))
+    output = tempfile.SpooledTemporaryFile(max_size=RANGE_SPOOL_BYTES)
+    try:
+        render_range_report_pdf(output, load_report_rooms(db), iter_report_days(db, start, end))
+    except Exception:
+        output.close()
+        raise
+    size = output.tell()
+    output.seek(0)
     
-    stats_data = [
-        ['Total Reservations', 'Total Guests', 'Active Rooms', 'Operating Hours'],
-        [
-            str(total_reservations),
-            str(total_guests),
-            str(sum(1 for r in rooms if r.is_active)),
-            '11:00 AM - 9:00 PM'
+    filename = f"sterling_operations_report_{start.strftime('%Y%m%d')}_{end.strftime('%Y%m%d')}.pdf"
+    return StreamingResponse(
+        _iter_file(output),
+        media_type="application/pdf",
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "Content-Length": str(size),
+        }
+    )
+
+
+# ==================== KITCHEN MANIFEST ====================
+
+def build_kitchen_manifest(db: Session, target_date: date) -> KitchenManifest:
+    """
+    Every attendee of the day's confirmed reservations, by room and meal, in
+    one joined query. Members' dietary restrictions come from their member
+    record (current), guests' from the attendee row.
+    """
+    rows = (
+        db.query(
+            DiningRoom.id,
+            DiningRoom.name,
+            Reservation.meal_type,
+            Reservation.id,
+            Reservation.start_time,
+            Reservation.end_time,
+            User.name,
+            ReservationAttendee.id,
+            ReservationAttendee.name,
+            ReservationAttendee.attendee_type,
+            case(
+                (Member.id.is_not(None), Member.dietary_restrictions),
+                else_=ReservationAttendee.dietary_restrictions,
+            ),
+        )
+        .select_from(ReservationAttendee)
+        .join(Reservation, Reservation.id == ReservationAttendee.reservation_id)
+        .join(DiningRoom, DiningRoom.id == Reservation.dining_room_id)
+        .outerjoin(User, User.id == Reservation.created_by_id)
+        .outerjoin(Member, Member.id == ReservationAttendee.member_id)
+        .filter(
+            Reservation.date == target_date,
+            Reservation.status == "confirmed"
+        )
+        .order_by(DiningRoom.id, Reservation.start_time, Reservation.id, ReservationAttendee.id)
+        .all()
+    )
+
+    rooms: dict[int, dict] = {}
+    day_counts: Counter = Counter()
+    for (room_id, room_name, meal_type, reservation_id, start_time, end_time, created_by,
+         attendee_id, name, attendee_type, dietary) in rows:
+        room = rooms.setdefault(room_id, {
+            "room_id": room_id, "room_name": room_name, "counts": Counter(), "meals": {},
+        })
+        meal = room["meals"].setdefault(meal_type, {
+            "meal_type": meal_type, "counts": Counter(), "reservations": {},
+        })
+        reservation = meal["reservations"].setdefault(reservation_id, ManifestReservation(
+            reservation_id=reservation_id,
+            start_time=start_time,
+            end_time=end_time,
+            created_by=created_by,
+            attendees=[],
+        ))
+
+        tags = dietary_tags(dietary)
+        reservation.attendees.append(ManifestAttendee(
+            id=attendee_id,
+            name=name,
+            attendee_type=attendee_type,
+            dietary_restrictions=dietary,
+            dietary_tags=tags,
+        ))
+        for counts in (room["counts"], meal["counts"], day_counts):
+            counts.update(tags)
+
+    def attendee_total(reservations) -> int:
+        return sum(len(r.attendees) for r in reservations)
+
+    manifest_rooms = []
+    for room in rooms.values():
+        meals = [
+            ManifestMeal(
+                meal_type=meal["meal_type"],
+                attendee_count=attendee_total(meal["reservations"].values()),
+                dietary_counts=dict(meal["counts"].most_common()),
+                reservations=list(meal["reservations"].values()),
+            )
+            for meal in room["meals"].values()
         ]
-    ]
-    
-    stats_table = Table(stats_data, colWidths=[2.5*inch, 2.5*inch, 2.5*inch, 2.5*inch])
-    stats_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#121212')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 10),
-        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 1), (-1, -1), 16),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
-        ('TOPPADDING', (0, 0), (-1, -1), 12),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e0e0e0')),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f8f8f8'))
-    ]))
-    
-    elements.append(stats_table)
-    elements.append(Spacer(1, 0.3*inch))
-    
-    # ==================== TIMELINE SCHEDULE ====================
-    elements.append(Paragraph("RESERVATION SCHEDULE", header_style))
-    
-    # Create time slots (11:00 AM - 9:00 PM in 1-hour increments)
-    time_slots = []
-    for hour in range(11, 22):
-        # Convert to AM/PM
-        if hour == 12:
-            time_str = "12:00 PM"
-        elif hour > 12:
-            time_str = f"{hour-12}:00 PM"
-        else:
-            time_str = f"{hour}:00 AM"
-        time_slots.append((hour, time_str))
-    
-    # Build schedule table
-    header_row = ['TIME'] + [room.name for room in rooms]
-    schedule_data = [header_row]
-    
-    # For each time slot, find reservations
-    for hour, time_str in time_slots:
-        row = [time_str]
-        
-        # --- FIXED LOGIC ---
-        for room in rooms:
-            cell_content = ""
-            
-            if not room.is_active:
-                cell_content = "CLOSED"
-            else:
-                # Find ALL reservations for this room at this time
-                found_reservations = []
-                for res in reservations:
-                    if res.dining_room_id != room.id:
-                        continue
-                        
-                    # Handle start_time types (string vs object)
-                    if isinstance(res.start_time, str):
-                        start_hour = int(res.start_time.split(':')[0])
-                    else:
-                        start_hour = res.start_time.hour
-
-                    # Handle end_time types
-                    if isinstance(res.end_time, str):
-                        end_hour = int(res.end_time.split(':')[0])
-                    else:
-                        end_hour = res.end_time.hour
-                    
-                    # LOGIC: Check if current timeline hour falls within reservation window
-                    if start_hour <= hour < end_hour:
-                        user = db.query(User).filter_by(id=res.created_by_id).first()
-                        if user:
-                            attendee_count = db.query(ReservationAttendee).filter_by(
-                                reservation_id=res.id
-                            ).count()
-                            # Append to list instead of breaking
-                            found_reservations.append(f"• {user.name} ({attendee_count})")
-                
-                # Join with newlines to show multiple
-                if found_reservations:
-                    cell_content = "\n".join(found_reservations)
-            
-            row.append(cell_content)
-        # -------------------
-        
-        schedule_data.append(row)
-    
-    # Calculate column widths dynamically
-    num_rooms = len(rooms)
-    room_col_width = (9 * inch) / num_rooms
-    col_widths = [1.5*inch] + [room_col_width] * num_rooms
-    
-    schedule_table = Table(schedule_data, colWidths=col_widths, repeatRows=1)
-    
-    # Style the schedule table
-    table_style = [
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#121212')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 9),
-        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 1), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#e0e0e0')),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f8f8f8')]),
-        ('LEFTPADDING', (0, 0), (-1, -1), 6),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 6),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-    ]
-    
-    # Highlight cells
-    for row_idx in range(1, len(schedule_data)):
-        for col_idx in range(1, len(schedule_data[row_idx])):
-            cell = schedule_data[row_idx][col_idx]
-            if cell == "CLOSED":
-                 table_style.append(('BACKGROUND', (col_idx, row_idx), (col_idx, row_idx), colors.HexColor('#e0e0e0')))
-                 table_style.append(('TEXTCOLOR', (col_idx, row_idx), (col_idx, row_idx), colors.HexColor('#757575')))
-            elif cell and "•" in cell:
-                table_style.append(('BACKGROUND', (col_idx, row_idx), (col_idx, row_idx), colors.HexColor('#fff5f3')))
-                table_style.append(('TEXTCOLOR', (col_idx, row_idx), (col_idx, row_idx), colors.HexColor('#121212')))
-                table_style.append(('FONTNAME', (col_idx, row_idx), (col_idx, row_idx), 'Helvetica-Bold'))
-    
-    schedule_table.setStyle(TableStyle(table_style))
-    elements.append(schedule_table)
-    
-    # Footer
-    elements.append(Spacer(1, 0.3*inch))
-    footer_style = ParagraphStyle(
-        'Footer', parent=styles['Normal'], fontSize=8, textColor=colors.HexColor('#757575'), alignment=TA_CENTER, fontName='Helvetica'
+        manifest_rooms.append(ManifestRoom(
+            room_id=room["room_id"],
+            room_name=room["room_name"],
+            attendee_count=sum(meal.attendee_count for meal in meals),
+            dietary_counts=dict(room["counts"].most_common()),
+            meals=meals,
+        ))
+
+    return KitchenManifest(
+        date=target_date,
+        attendee_count=len(rows),
+        dietary_counts=dict(day_counts.most_common()),
+        rooms=manifest_rooms,
     )
-    elements.append(Paragraph(f"Generated on {datetime.now().strftime('%Y-%m-%d at %H:%M')} | Sterling Catering Operations", footer_style))
-    
-    doc.build(elements)
-    buffer.seek(0)
-    return buffer
 
-@router.get("/daily-pdf")
-@router.get("/daily-pdf/")
-def get_daily_report_pdf(
+
+@router.get("/manifest", response_model=KitchenManifest)
+@router.get("/manifest/", response_model=KitchenManifest)
+def get_kitchen_manifest(
     date: str | None = None,
-    admin: User = Depends(get_admin_user),
+    if_none_match: str | None = Header(default=None),
+    admin: Principal = Depends(get_admin_user),
+    # Primary for the same reason as /daily-pdf: the result is cached per version
     db: Session = Depends(get_db)
 ):
-    if date:
-        try:
-            target_date = datetime.strptime(date, "%Y-%m-%d").date()
-        except ValueError:
-            raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
-    else:
-        target_date = datetime.now().date()
+    """
+    Kitchen manifest for a date (default today). Cached per date until the
+    next reservation, attendee or member change; honours If-None-Match.
+    """
+    target_date = _parse_report_date(date)
     
-    pdf_buffer = create_daily_report_pdf(target_date, db)
-    filename = f"sterling_daily_report_{target_date.strftime('%Y%m%d')}.pdf"
+    etag = report_versions.etag(target_date, "manifest")
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
     
-    return StreamingResponse(
-        pdf_buffer,
-        media_type="application/pdf",
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
-    )
\ No newline at end of file
+    if etag_matches(if_none_match, etag):
+        report_cache.record_not_modified()
+        return Response(status_code=304, headers=headers)
+    
+    body = report_cache.get("manifest", target_date, etag)
+    if body is None:
+        body = build_kitchen_manifest(db, target_date).model_dump_json().encode("utf-8")
+        report_cache.put("manifest", target_date, etag, body)
+    
+    return Response(content=body, media_type="application/json", headers=headers)
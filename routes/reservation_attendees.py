@@ -4,13 +4,14 @@ Reservation Attendee routes - managing who's coming to reservations
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from database import get_db
-from models.user import User
 from models.reservation import Reservation
 from models.member import Member
 from models.dining_room import DiningRoom  # <--- ADDED THIS IMPORT
 from models.reservation_attendee import ReservationAttendee
-from schemas.reservation_attendee import AttendeeCreate, AttendeeResponse
+from schemas.reservation_attendee import AttendeeBatchCreate, AttendeeCreate, AttendeeResponse
 from utils.auth import get_current_user
+from utils.principal_cache import Principal
+from utils.capacity import room_peak_occupancy
 from routes.reservations import apply_automatic_fees
 
 router = APIRouter()
@@ -21,18 +22,13 @@ def assert_capacity_available(db: Session, reservation: Reservation, adding: int
     if not room:
         raise HTTPException(status_code=404, detail="Dining room not found")
 
-    # Count total attendees currently occupying this room during this reservation's time window
-    occupancy = (
-        db.query(ReservationAttendee)
-        .join(Reservation, ReservationAttendee.reservation_id == Reservation.id)
-        .filter(
-            Reservation.dining_room_id == reservation.dining_room_id,
-            Reservation.date == reservation.date,
-            Reservation.status == "confirmed",
-            Reservation.start_time < reservation.end_time,
-            Reservation.end_time > reservation.start_time,
-        )
-        .count()
+    # Peak concurrent headcount in this room during this reservation's time window
+    occupancy = room_peak_occupancy(
+        db,
+        reservation.dining_room_id,
+        reservation.date,
+        reservation.start_time,
+        reservation.end_time,
     )
 
     if occupancy + adding > room.capacity:
@@ -55,7 +51,7 @@ def assert_capacity_available(db: Session, reservation: Reservation, adding: int
 def add_attendee(
     reservation_id: int,
     attendee_in: AttendeeCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """
@@ -120,15 +116,137 @@ def add_attendee(
         )
 
     db.add(new_attendee)
-    db.commit()
-    db.refresh(new_attendee)
+    if new_attendee.attendee_type == "member":
+        reservation.adjust_party_counts(members=1)
+    else:
+        reservation.adjust_party_counts(guests=1)
+    db.flush()
 
     # TRIGGER FEE RECALCULATION
     apply_automatic_fees(db, reservation)
+    db.commit()
+    db.refresh(new_attendee)
 
     return new_attendee
 
 
+@router.post(
+    "/{reservation_id}/attendees:batch",
+    response_model=list[AttendeeResponse],
+    status_code=status.HTTP_201_CREATED,
+)
+def add_attendees_batch(
+    reservation_id: int,
+    batch_in: AttendeeBatchCreate,
+    current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """
+    Add several attendees to a reservation in one all-or-nothing request.
+
+    Members are validated with a single query, capacity is checked once for
+    the whole batch, rows are inserted together and fees recomputed once.
+    If any item is invalid nothing is written and the 400 detail lists
+    {index, detail} for every failing item.
+    """
+    reservation = db.query(Reservation).filter(
+        Reservation.id == reservation_id,
+        Reservation.created_by_id == current_user.id,
+    ).first()
+
+    if not reservation:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Reservation not found")
+
+    items = batch_in.attendees
+
+    # One query: the user's requested members, plus whether each is already attending
+    member_ids = {item.member_id for item in items if item.member_id}
+    members_by_id: dict[int, tuple[Member, int | None]] = {}
+    if member_ids:
+        rows = (
+            db.query(Member, ReservationAttendee.id)
+            .outerjoin(
+                ReservationAttendee,
+                (ReservationAttendee.member_id == Member.id)
+                & (ReservationAttendee.reservation_id == reservation_id),
+            )
+            .filter(Member.id.in_(member_ids), Member.user_id == current_user.id)
+            .all()
+        )
+        members_by_id = {member.id: (member, existing_id) for member, existing_id in rows}
+
+    errors: list[dict] = []
+    new_attendees: list[ReservationAttendee] = []
+    seen_member_ids: set[int] = set()
+
+    for index, item in enumerate(items):
+        if not item.member_id and not item.name:
+            errors.append({"index": index, "detail": "Must provide either member_id or name"})
+            continue
+
+        # Case 1: a registered member
+        if item.member_id:
+            found = members_by_id.get(item.member_id)
+            if not found:
+                errors.append({"index": index, "detail": "Member not found"})
+                continue
+
+            member, existing_id = found
+            if existing_id is not None or member.id in seen_member_ids:
+                errors.append({
+                    "index": index,
+                    "detail": f"{member.name} is already added to this reservation",
+                })
+                continue
+
+            seen_member_ids.add(member.id)
+            new_attendees.append(
+                ReservationAttendee(
+                    reservation_id=reservation_id,
+                    member_id=member.id,
+                    name=member.name,
+                    attendee_type="member",
+                    dietary_restrictions=member.dietary_restrictions,
+                )
+            )
+
+        # Case 2: a one-time guest
+        else:
+            new_attendees.append(
+                ReservationAttendee(
+                    reservation_id=reservation_id,
+                    member_id=None,
+                    name=item.name,
+                    attendee_type="guest",
+                    dietary_restrictions=item.dietary_restrictions,
+                )
+            )
+
+    if errors:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"message": "No attendees were added", "errors": errors},
+        )
+
+    assert_capacity_available(db, reservation, adding=len(new_attendees))
+
+    members_added = sum(1 for a in new_attendees if a.attendee_type == "member")
+    db.add_all(new_attendees)
+    reservation.adjust_party_counts(
+        members=members_added,
+        guests=len(new_attendees) - members_added,
+    )
+    db.flush()
+
+    # TRIGGER FEE RECALCULATION (once for the whole batch)
+    apply_automatic_fees(db, reservation)
+
+    # Build the response before commit expires the new rows
+    result = [AttendeeResponse.model_validate(a) for a in new_attendees]
+    db.commit()
+    return result
+
+
 @router.get(
     "/{reservation_id}/attendees",
     response_model=list[AttendeeResponse],
@@ -139,7 +257,7 @@ def add_attendee(
 )
 def get_attendees(
     reservation_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """
@@ -172,7 +290,7 @@ def get_attendees(
 def remove_attendee(
     reservation_id: int,
     attendee_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """
@@ -196,9 +314,14 @@ def remove_attendee(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Attendee not found")
 
     db.delete(attendee)
-    db.commit()
+    if attendee.attendee_type == "member":
+        reservation.adjust_party_counts(members=-1)
+    else:
+        reservation.adjust_party_counts(guests=-1)
+    db.flush()
 
     # TRIGGER FEE RECALCULATION
     apply_automatic_fees(db, reservation)
+    db.commit()
 
     return None
\ No newline at end of file
@@ -0,0 +1,293 @@
+# routes/reservation_series.py
+"""
+Reservation Series routes - recurring bookings (every week / every month).
+
+A series is expanded server-side into ordinary reservations. Capacity for
+every occurrence is validated from one range query, and the reservations,
+creator attendees and automatic fees are each inserted with a single bulk
+statement. Occurrences that would exceed room capacity are skipped and
+reported back as conflicts.
+"""
+from __future__ import annotations
+
+from datetime import MAXYEAR, date, timedelta
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from database import get_db
+from models.dining_room import DiningRoom
+from models.fee import Fee
+from models.member import Member
+from models.reservation import Reservation
+from models.reservation_attendee import ReservationAttendee
+from models.reservation_series import ReservationSeries
+from schemas.reservation import ReservationResponse
+from schemas.reservation_series import (
+    ReservationSeriesCreate,
+    ReservationSeriesResponse,
+    SeriesConflict,
+)
+from utils.auth import get_current_user
+from utils.principal_cache import Principal
+from utils.capacity import load_room_range_intervals, peak_occupancy
+from utils.fee_rules import DEFAULT_GUEST_ALLOWANCE, FeeInputs, evaluate_fees, fee_rule_registry
+
+router = APIRouter()
+
+MAX_SERIES_OCCURRENCES = 104
+
+
+def expand_occurrences(
+    frequency: str,
+    start_date: date,
+    end_date: date,
+    limit: int | None = None,
+) -> list[date]:
+    """
+    Dates for a weekly or monthly rule, inclusive of both ends.
+    Monthly series keep the start date's day-of-month and skip months
+    that don't have it (e.g. the 31st).
+    With a limit, expansion stops after limit + 1 dates - enough for the
+    caller to tell the series is too long without walking all of it.
+    """
+    dates: list[date] = []
+
+    def full() -> bool:
+        return limit is not None and len(dates) > limit
+
+    if frequency == "weekly":
+        current = start_date
+        while current <= end_date and not full():
+            dates.append(current)
+            try:
+                current += timedelta(days=7)
+            except OverflowError:
+                # Past date.max - nothing further to book
+                break
+        return dates
+
+    year, month = start_date.year, start_date.month
+    while year <= MAXYEAR and not full():
+        try:
+            current = date(year, month, start_date.day)
+        except ValueError:
+            current = None
+        if current is not None:
+            if current > end_date:
+                break
+            dates.append(current)
+        elif date(year, month, 1) > end_date:
+            break
+
+        month += 1
+        if month > 12:
+            year, month = year + 1, 1
+    return dates
+
+
+@router.post("", response_model=ReservationSeriesResponse, status_code=status.HTTP_201_CREATED)
+@router.post("/", response_model=ReservationSeriesResponse, status_code=status.HTTP_201_CREATED)
+def create_reservation_series(
+    series_in: ReservationSeriesCreate,
+    current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """
+    Create a recurring reservation and book every occurrence that fits.
+    Occurrences that would put the room over capacity are listed in
+    `conflicts` instead of being booked.
+    """
+    if series_in.end_date < series_in.start_date:
+        raise HTTPException(status_code=400, detail="end_date must be on or after start_date")
+
+    dates = expand_occurrences(
+        series_in.frequency,
+        series_in.start_date,
+        series_in.end_date,
+        limit=MAX_SERIES_OCCURRENCES,
+    )
+    if len(dates) > MAX_SERIES_OCCURRENCES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Series too long (more than {MAX_SERIES_OCCURRENCES} occurrences)",
+        )
+
+    # Lock dining room row to prevent race conditions
+    dining_room = (
+        db.query(DiningRoom)
+        .filter(DiningRoom.id == series_in.dining_room_id)
+        .with_for_update()
+        .first()
+    )
+
+    if not dining_room:
+        raise HTTPException(status_code=404, detail="Dining room not found")
+
+    # ---------------------------------------------------------
+    # CAPACITY CHECK - one range query for the whole series
+    # ---------------------------------------------------------
+    intervals_by_date = load_room_range_intervals(
+        db,
+        dining_room.id,
+        series_in.start_date,
+        series_in.end_date,
+        series_in.start_time,
+        series_in.end_time,
+    )
+
+    bookable: list[date] = []
+    conflicts: list[SeriesConflict] = []
+    for on_date in dates:
+        occupancy = peak_occupancy(
+            intervals_by_date.get(on_date, []),
+            series_in.start_time,
+            series_in.end_time,
+        )
+        # Each occurrence starts with a minimum footprint of 1 (creator)
+        if occupancy + 1 > dining_room.capacity:
+            conflicts.append(
+                SeriesConflict(
+                    date=on_date,
+                    detail=f"Room is at capacity ({occupancy}/{dining_room.capacity})",
+                )
+            )
+        else:
+            bookable.append(on_date)
+    # ---------------------------------------------------------
+
+    series = ReservationSeries(
+        created_by_id=current_user.id,
+        dining_room_id=dining_room.id,
+        frequency=series_in.frequency,
+        start_date=series_in.start_date,
+        end_date=series_in.end_date,
+        meal_type=series_in.meal_type,
+        start_time=series_in.start_time,
+        end_time=series_in.end_time,
+        notes=series_in.notes,
+    )
+    db.add(series)
+    db.flush()
+
+    occurrences: list[Reservation] = []
+    if bookable:
+        creator_member = db.query(Member).filter(Member.user_id == current_user.id).first()
+        party = 1 if creator_member else 0
+
+        # Bulk insert every occurrence in one statement
+        occurrences = list(
+            db.scalars(
+                insert(Reservation).returning(Reservation),
+                [
+                    {
+                        "created_by_id": current_user.id,
+                        "dining_room_id": dining_room.id,
+                        "series_id": series.id,
+                        "date": on_date,
+                        "meal_type": series_in.meal_type,
+                        "start_time": series_in.start_time,
+                        "end_time": series_in.end_time,
+                        "notes": series_in.notes,
+                        "status": "confirmed",
+                        "attendee_count": party,
+                        "member_count": party,
+                        "guest_count": 0,
+                    }
+                    for on_date in bookable
+                ],
+            )
+        )
+
+        # Creator attendees, one statement
+        if creator_member:
+            db.execute(
+                insert(ReservationAttendee),
+                [
+                    {
+                        "reservation_id": res.id,
+                        "member_id": creator_member.id,
+                        "name": creator_member.name,
+                        "attendee_type": "member",
+                        "dietary_restrictions": creator_member.dietary_restrictions,
+                    }
+                    for res in occurrences
+                ],
+            )
+
+        # Automatic fees, computed set-wise and inserted in one statement
+        rules = fee_rule_registry.get(db)
+        allowance = (creator_member.guest_allowance or DEFAULT_GUEST_ALLOWANCE) if creator_member else 0
+        fee_rows = [
+            {
+                "reservation_id": res.id,
+                "rule_id": rule.id,
+                "quantity": quantity,
+                "calculated_amount": amount,
+                "paid": 0,
+            }
+            for res in occurrences
+            for rule, quantity, amount in evaluate_fees(
+                rules,
+                FeeInputs(
+                    on_date=res.date,
+                    total_count=party,
+                    guest_count=0,
+                    guest_allowance=allowance,
+                ),
+            )
+            if amount > 0
+        ]
+        if fee_rows:
+            db.execute(insert(Fee), fee_rows)
+
+    response = ReservationSeriesResponse(
+        id=series.id,
+        created_by_id=series.created_by_id,
+        dining_room_id=series.dining_room_id,
+        frequency=series.frequency,
+        start_date=series.start_date,
+        end_date=series.end_date,
+        meal_type=series.meal_type,
+        start_time=series.start_time,
+        end_time=series.end_time,
+        notes=series.notes,
+        created_at=series.created_at,
+        occurrences=[ReservationResponse.model_validate(res) for res in occurrences],
+        conflicts=conflicts,
+    )
+
+    db.commit()
+    return response
+
+
+@router.get("/{series_id}", response_model=ReservationSeriesResponse)
+def get_reservation_series(
+    series_id: int,
+    current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Get a series with its current occurrences"""
+    series = (
+        db.query(ReservationSeries)
+        .filter(
+            ReservationSeries.id == series_id,
+            ReservationSeries.created_by_id == current_user.id,
+        )
+        .first()
+    )
+
+    if not series:
+        raise HTTPException(status_code=404, detail="Series not found")
+
+    occurrences = (
+        db.query(Reservation)
+        .filter(Reservation.series_id == series.id)
+        .order_by(Reservation.date)
+        .all()
+    )
+
+    response = ReservationSeriesResponse.model_validate(series)
+    response.occurrences = [ReservationResponse.model_validate(res) for res in occurrences]
+    return response
@@ -1,14 +1,16 @@
 # routes/reservations.py
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import date as date_type
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import and_, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from database import get_db
-from models.user import User
+from database import get_async_db, get_db
 from models.reservation import Reservation
 from models.dining_room import DiningRoom
 from models.member import Member
 from models.reservation_attendee import ReservationAttendee
-from models.rule import Rule
 from models.fee import Fee
 from schemas.reservation import (
     ReservationCreate,
@@ -17,6 +19,9 @@ from schemas.reservation import (
     ReservationDetailResponse,
 )
 from utils.auth import get_current_user
+from utils.principal_cache import Principal
+from utils.capacity import room_peak_occupancy
+from utils.fee_rules import FeeInputs, evaluate_fees, fee_rule_registry, load_guest_inputs
 
 router = APIRouter()
 
@@ -29,7 +34,7 @@ router = APIRouter()
 @router.post("/", response_model=ReservationResponse, status_code=status.HTTP_201_CREATED)
 def create_reservation(
     reservation_in: ReservationCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     # Lock dining room row to prevent race conditions
@@ -46,18 +51,12 @@ def create_reservation(
     # ---------------------------------------------------------
     # CAPACITY CHECK (allows overlaps; blocks only when capacity exceeded)
     # ---------------------------------------------------------
-    current_occupancy = (
-        db.query(ReservationAttendee)
-        .join(Reservation, ReservationAttendee.reservation_id == Reservation.id)
-        .filter(
-            Reservation.dining_room_id == reservation_in.dining_room_id,
-            Reservation.date == reservation_in.date,
-            Reservation.status == "confirmed",
-            # Overlap logic: (StartA < EndB) and (EndA > StartB)
-            Reservation.start_time < reservation_in.end_time,
-            Reservation.end_time > reservation_in.start_time,
-        )
-        .count()
+    current_occupancy = room_peak_occupancy(
+        db,
+        reservation_in.dining_room_id,
+        reservation_in.date,
+        reservation_in.start_time,
+        reservation_in.end_time,
     )
 
     # Reservation starts with a minimum footprint of 1 (creator)
@@ -68,6 +67,10 @@ def create_reservation(
         )
     # ---------------------------------------------------------
 
+    # Everything below is one unit of work: reservation, creator attendee
+    # and fees are flushed together and committed once.
+    creator_member = db.query(Member).filter(Member.user_id == current_user.id).first()
+
     # Create reservation
     new_res = Reservation(
         created_by_id=current_user.id,
@@ -78,36 +81,30 @@ def create_reservation(
         end_time=reservation_in.end_time,
         notes=reservation_in.notes,
         status="confirmed",
+        attendee_count=1 if creator_member else 0,
+        member_count=1 if creator_member else 0,
+        guest_count=0,
     )
-
     db.add(new_res)
-    db.commit()
-    db.refresh(new_res)
 
     # Add creator as attendee if they have a member record
-    creator_member = db.query(Member).filter(Member.user_id == current_user.id).first()
-
     if creator_member:
-        attendee = ReservationAttendee(
-            reservation_id=new_res.id,
-            member_id=creator_member.id,
-            name=creator_member.name,
-            attendee_type="member",
-            dietary_restrictions=creator_member.dietary_restrictions,
+        new_res.attendees.append(
+            ReservationAttendee(
+                member_id=creator_member.id,
+                name=creator_member.name,
+                attendee_type="member",
+                dietary_restrictions=creator_member.dietary_restrictions,
+            )
         )
-        db.add(attendee)
-        db.commit()
+
+    db.flush()
 
     # Apply automatic fees
     apply_automatic_fees(db, new_res)
 
-    attendee_count = (
-        db.query(ReservationAttendee)
-        .filter_by(reservation_id=new_res.id)
-        .count()
-    )
-
-    return ReservationResponse(
+    # Build the response from memory before commit expires the instance
+    response = ReservationResponse(
         id=new_res.id,
         created_by_id=new_res.created_by_id,
         dining_room_id=new_res.dining_room_id,
@@ -118,9 +115,12 @@ def create_reservation(
         notes=new_res.notes,
         status=new_res.status,
         created_at=new_res.created_at,
-        attendee_count=attendee_count,
+        attendee_count=new_res.attendee_count,
     )
 
+    db.commit()
+    return response
+
 
 # ===============================
 # LIST MY RESERVATIONS
@@ -128,42 +128,99 @@ def create_reservation(
 
 @router.get("", response_model=list[ReservationResponse])
 @router.get("/", response_model=list[ReservationResponse])
-def get_my_reservations(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+async def get_my_reservations(
+    response: Response,
+    scope: str | None = Query(None, pattern="^(upcoming|past)$"),
+    date_from: date_type | None = None,
+    date_to: date_type | None = None,
+    cursor: str | None = None,
+    limit: int = Query(50, ge=1, le=200),
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    reservations = (
-        db.query(Reservation)
-        .filter(Reservation.created_by_id == current_user.id)
-        .order_by(Reservation.date.desc())
-        .all()
-    )
-
-    result: list[ReservationResponse] = []
-    for res in reservations:
-        attendee_count = (
-            db.query(ReservationAttendee)
-            .filter_by(reservation_id=res.id)
-            .count()
-        )
-
-        result.append(
-            ReservationResponse(
-                id=res.id,
-                created_by_id=res.created_by_id,
-                dining_room_id=res.dining_room_id,
-                date=res.date,
-                meal_type=res.meal_type,
-                start_time=res.start_time,
-                end_time=res.end_time,
-                notes=res.notes,
-                status=res.status,
-                created_at=res.created_at,
-                attendee_count=attendee_count,
+    """
+    List the current user's reservations, one page at a time.
+
+    Query params:
+    - scope: "upcoming" (today onward, soonest first) or "past" (before today)
+    - date_from / date_to: inclusive date range
+    - cursor: value of the X-Next-Cursor header from the previous page
+    - limit: page size
+
+    Attendee counts are read from the reservation's party counters, so the
+    cost of a page depends on `limit`, not on how many reservations the user
+    has.
+    """
+    query = select(Reservation).where(Reservation.created_by_id == current_user.id)
+
+    today = date_type.today()
+    if scope == "upcoming":
+        query = query.where(Reservation.date >= today)
+    elif scope == "past":
+        query = query.where(Reservation.date < today)
+
+    if date_from:
+        query = query.where(Reservation.date >= date_from)
+    if date_to:
+        query = query.where(Reservation.date <= date_to)
+
+    # Upcoming reads soonest-first; everything else newest-first
+    ascending = scope == "upcoming"
+
+    # Keyset pagination over (date, id)
+    if cursor:
+        try:
+            cursor_date_str, cursor_id_str = cursor.split("_", 1)
+            cursor_date = date_type.fromisoformat(cursor_date_str)
+            cursor_id = int(cursor_id_str)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+        if ascending:
+            query = query.where(
+                or_(
+                    Reservation.date > cursor_date,
+                    and_(Reservation.date == cursor_date, Reservation.id > cursor_id),
+                )
+            )
+        else:
+            query = query.where(
+                or_(
+                    Reservation.date < cursor_date,
+                    and_(Reservation.date == cursor_date, Reservation.id < cursor_id),
+                )
             )
-        )
 
-    return result
+    if ascending:
+        query = query.order_by(Reservation.date.asc(), Reservation.id.asc())
+    else:
+        query = query.order_by(Reservation.date.desc(), Reservation.id.desc())
+
+    # Fetch one extra row to know whether another page exists
+    rows = (await db.scalars(query.limit(limit + 1))).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    if has_more:
+        last = rows[-1]
+        response.headers["X-Next-Cursor"] = f"{last.date.isoformat()}_{last.id}"
+
+    return [
+        ReservationResponse(
+            id=res.id,
+            created_by_id=res.created_by_id,
+            dining_room_id=res.dining_room_id,
+            date=res.date,
+            meal_type=res.meal_type,
+            start_time=res.start_time,
+            end_time=res.end_time,
+            notes=res.notes,
+            status=res.status,
+            created_at=res.created_at,
+            attendee_count=res.attendee_count,
+        )
+        for res in rows
+    ]
 
 
 # ===============================
@@ -173,7 +230,7 @@ def get_my_reservations(
 @router.get("/{reservation_id}", response_model=ReservationDetailResponse)
 def get_reservation(
     reservation_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     res = (
@@ -215,7 +272,7 @@ def get_reservation(
 def update_reservation(
     reservation_id: int,
     update: ReservationUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     res = (
@@ -233,16 +290,8 @@ def update_reservation(
     for key, value in update.model_dump(exclude_unset=True).items():
         setattr(res, key, value)
 
-    db.commit()
-    db.refresh(res)
-
     apply_automatic_fees(db, res)
-
-    attendee_count = (
-        db.query(ReservationAttendee)
-        .filter_by(reservation_id=res.id)
-        .count()
-    )
+    db.commit()
 
     return ReservationResponse(
         id=res.id,
@@ -255,7 +304,7 @@ def update_reservation(
         notes=res.notes,
         status=res.status,
         created_at=res.created_at,
-        attendee_count=attendee_count,
+        attendee_count=res.attendee_count,
     )
 
 
@@ -266,7 +315,7 @@ def update_reservation(
 @router.delete("/{reservation_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_reservation(
     reservation_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     res = (
@@ -291,32 +340,55 @@ def delete_reservation(
 # ===============================
 
 def apply_automatic_fees(db: Session, reservation: Reservation):
-    attendees = (
-        db.query(ReservationAttendee)
-        .filter_by(reservation_id=reservation.id)
-        .all()
-    )
+    """
+    Recompute the automatic fees for a reservation.
+    Stages the changes on the session only; the caller owns the commit.
+    Party counters must be flushed (not pending SQL increments).
+
+    Rules come from the in-process registry, and the reservation's existing
+    fees are loaded in one query and diffed in memory, so a recompute costs
+    at most two SELECTs (fees + guest count/allowance). Guests and
+    allowances follow load_guest_inputs: attendees without a member record
+    are guests, and members without an allowance get the default.
+    """
+    rules = fee_rule_registry.get(db)
+    if not rules:
+        return
+
+    existing_by_rule = {
+        fee.rule_id: fee
+        for fee in db.query(Fee).filter(
+            Fee.reservation_id == reservation.id,
+            Fee.rule_id.in_([rule.id for rule in rules.values()]),
+        )
+    }
 
-    total_count = len(attendees)
+    guests, allowance = reservation.guest_count, 0
+    if any(rule.needs_allowance for rule in rules.values()):
+        guests, allowance = load_guest_inputs(db, [reservation.id]).get(reservation.id, (0, 0))
 
-    member_attendees = [a for a in attendees if a.member_id is not None]
-    guest_count = len([a for a in attendees if a.member_id is None])
+    inputs = FeeInputs(
+        on_date=reservation.date,
+        total_count=reservation.attendee_count,
+        guest_count=guests,
+        guest_allowance=allowance,
+    )
 
-    def set_fee(rule: Rule, quantity: int | None, amount: float):
-        existing = (
-            db.query(Fee)
-            .filter_by(reservation_id=reservation.id, rule_id=rule.id)
-            .first()
-        )
+    changed = False
+    for rule, quantity, amount in evaluate_fees(rules, inputs):
+        existing = existing_by_rule.get(rule.id)
 
         if amount <= 0:
             if existing:
                 db.delete(existing)
-            return
+                changed = True
+            continue
 
         if existing:
-            existing.quantity = quantity
-            existing.calculated_amount = amount
+            if existing.quantity != quantity or existing.calculated_amount != amount:
+                existing.quantity = quantity
+                existing.calculated_amount = amount
+                changed = True
         else:
             db.add(
                 Fee(
@@ -327,47 +399,7 @@ def apply_automatic_fees(db: Session, reservation: Reservation):
                     paid=0,
                 )
             )
+            changed = True
 
-    # ---------------------------
-    # PEAK HOURS (Fri/Sat/Sun)
-    # ---------------------------
-    peak_rule = db.query(Rule).filter_by(code="peak_hours", enabled=1).first()
-    if peak_rule:
-        is_peak_day = reservation.date.weekday() in [4, 5, 6]  # Fri/Sat/Sun
-        set_fee(peak_rule, None, peak_rule.base_amount if is_peak_day else 0)
-
-    # ---------------------------
-    # EXCESS OCCUPANCY (> threshold)
-    # ---------------------------
-    occupancy_rule = (
-        db.query(Rule).filter_by(code="excess_occupancy", enabled=1).first()
-    )
-    if occupancy_rule and occupancy_rule.threshold:
-        excess = max(0, total_count - occupancy_rule.threshold)
-        set_fee(
-            occupancy_rule,
-            excess if excess > 0 else None,
-            excess * occupancy_rule.base_amount,
-        )
-
-    # ---------------------------
-    # EXCESS MEMBER GUESTS (beyond allowance)
-    # ---------------------------
-    excess_guest_rule = (
-        db.query(Rule).filter_by(code="excess_member_guests", enabled=1).first()
-    )
-    if excess_guest_rule:
-        member_ids = [a.member_id for a in member_attendees if a.member_id is not None]
-        allowance = 0
-        if member_ids:
-            members = db.query(Member).filter(Member.id.in_(member_ids)).all()
-            allowance = sum((m.guest_allowance or 4) for m in members)
-
-        excess_guests = max(0, guest_count - allowance)
-        set_fee(
-            excess_guest_rule,
-            excess_guests if excess_guests > 0 else None,
-            excess_guests * excess_guest_rule.base_amount,
-        )
-
-    db.commit()
+    if changed:
+        reservation.bump_fee_version()
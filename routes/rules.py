@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from database import get_db
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from database import get_async_read_db
 from models.rule import Rule
 from schemas.rule import RuleResponse
 
@@ -9,14 +10,14 @@ router = APIRouter()
 
 @router.get("", response_model=list[RuleResponse])
 @router.get("/", response_model=list[RuleResponse])
-def get_rules(db: Session = Depends(get_db)):
-    rules = db.query(Rule).filter(Rule.enabled == 1).all()
-    return rules
+async def get_rules(db: AsyncSession = Depends(get_async_read_db)):
+    rules = await db.scalars(select(Rule).where(Rule.enabled == 1))
+    return rules.all()
 
 
 @router.get("/{rule_id}", response_model=RuleResponse)
-def get_rule(rule_id: int, db: Session = Depends(get_db)):
-    rule = db.query(Rule).filter(Rule.id == rule_id).first()
+async def get_rule(rule_id: int, db: AsyncSession = Depends(get_async_read_db)):
+    rule = await db.get(Rule, rule_id)
     if not rule:
         raise HTTPException(status_code=404, detail="Rule not found")
     return rule
\ No newline at end of file
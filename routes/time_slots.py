@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from database import get_db
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from database import get_async_read_db
 from models.time_slot import TimeSlot
 from schemas.time_slot import TimeSlotResponse
 
@@ -9,5 +10,6 @@ router = APIRouter()
 
 @router.get("", response_model=list[TimeSlotResponse])
 @router.get("/", response_model=list[TimeSlotResponse])
-def get_time_slots(db: Session = Depends(get_db)):
-    return db.query(TimeSlot).all()
+async def get_time_slots(db: AsyncSession = Depends(get_async_read_db)):
+    time_slots = await db.scalars(select(TimeSlot))
+    return time_slots.all()
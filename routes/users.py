@@ -1,60 +1,134 @@
 # routes/users.py
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from database import get_db
 from models.user import User
 from schemas.user import UserCreate, UserResponse, UserLogin, TokenResponse
-from utils.auth import create_access_token, get_current_user
+from utils.auth import create_access_token, get_current_user, revoke_access_token, security
+from utils.passwords import (
+    PasswordHashingBusy,
+    hash_password,
+    needs_rehash,
+    record_rehash,
+    verify_password,
+)
+from utils.principal_cache import Principal
 
 router = APIRouter()
 
 
+def _find_user_by_email(db: Session, email: str) -> User | None:
+    return db.query(User).filter(User.email == email).first()
+
+
+def _hashing_busy() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Authentication service is busy, please retry",
+        headers={"Retry-After": "1"},
+    )
+
+
 @router.post("", response_model=UserResponse)
 @router.post("/", response_model=UserResponse)
-def create_user(user_in: UserCreate, db: Session = Depends(get_db)):
-    """Create a new user account"""
-    existing = db.query(User).filter(User.email == user_in.email).first()
+async def create_user(user_in: UserCreate, db: Session = Depends(get_db)):
+    """
+    Create a new user account.
+    bcrypt runs on the dedicated hashing pool; DB work runs in the threadpool.
+    """
+    existing = await run_in_threadpool(_find_user_by_email, db, user_in.email)
     if existing:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="User already exists",
         )
 
-    new_user = User(email=user_in.email, name=user_in.name)
-    new_user.set_password(user_in.password)
+    try:
+        password_hash = await hash_password(user_in.password)
+    except PasswordHashingBusy:
+        raise _hashing_busy()
+
+    def save() -> UserResponse:
+        new_user = User(email=user_in.email, name=user_in.name, password_hash=password_hash)
+        db.add(new_user)
+        db.commit()
+        db.refresh(new_user)
+        return UserResponse.model_validate(new_user)
 
-    db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
-    return new_user
+    return await run_in_threadpool(save)
 
 
 @router.post("/login", response_model=TokenResponse)
 @router.post("/login/", response_model=TokenResponse)
-def login(credentials: UserLogin, db: Session = Depends(get_db)):
-    """Authenticate user and return JWT token"""
-    user = db.query(User).filter(User.email == credentials.email).first()
-    if not user or not user.check_password(credentials.password):
+async def login(credentials: UserLogin, db: Session = Depends(get_db)):
+    """
+    Authenticate user and return JWT token.
+    Hashes made with an outdated bcrypt work factor are upgraded transparently.
+    """
+    user = await run_in_threadpool(_find_user_by_email, db, credentials.email)
+
+    try:
+        valid = user is not None and await verify_password(
+            credentials.password, user.password_hash
+        )
+        new_hash = (
+            await hash_password(credentials.password)
+            if valid and needs_rehash(user.password_hash)
+            else None
+        )
+    except PasswordHashingBusy:
+        raise _hashing_busy()
+
+    if not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    def finish() -> UserResponse:
+        if new_hash:
+            user.password_hash = new_hash
+            db.commit()
+            db.refresh(user)
+            record_rehash()
+        return UserResponse.model_validate(user)
+
+    user_out = await run_in_threadpool(finish)
+
     access_token = create_access_token(
-        user_id=user.id,
-        is_admin=user.is_admin,
+        user_id=user_out.id,
+        is_admin=user_out.is_admin,
     )
 
     return {
         "access_token": access_token,
         "token_type": "bearer",
-        "user": user,
+        "user": user_out,
     }
 
 
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+@router.post("/logout/", status_code=status.HTTP_204_NO_CONTENT)
+def logout(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    current_user: Principal = Depends(get_current_user),
+):
+    """Revoke the bearer token used for this request"""
+    revoke_access_token(credentials.credentials)
+    return None
+
+
 @router.get("/me", response_model=UserResponse)
-def get_current_user_info(current_user: User = Depends(get_current_user)):
+def get_current_user_info(
+    current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
     """Get current authenticated user's information"""
-    return current_user
+    user = db.query(User).filter(User.id == current_user.id).first()
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    return user
@@ -1,4 +1,6 @@
 # schemas/dining_room.py
+from datetime import date, datetime
+
 from pydantic import BaseModel
 
 class DiningRoomResponse(BaseModel):
@@ -9,4 +11,20 @@ class DiningRoomResponse(BaseModel):
     is_active: bool  # CRITICAL: Must include this field
     
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class RoomAvailability(BaseModel):
+    """Remaining capacity for one room, one value per time bucket"""
+    id: int
+    name: str
+    capacity: int
+    remaining: list[int]
+
+
+class AvailabilityResponse(BaseModel):
+    """Availability heatmap across all active rooms"""
+    date_from: date
+    date_to: date
+    granularity_minutes: int
+    bucket_starts: list[datetime]
+    rooms: list[RoomAvailability]
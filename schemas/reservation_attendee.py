@@ -2,7 +2,10 @@
 """
 Pydantic schemas for Reservation Attendee
 """
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
+
+# Most attendees one batch request may add; larger parties take several requests
+MAX_BATCH_ATTENDEES = 100
 
 
 class AttendeeCreate(BaseModel):
@@ -24,4 +27,11 @@ class AttendeeResponse(BaseModel):
     attendee_type: str  # "member" or "guest"
     dietary_restrictions: str | None
     
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+class AttendeeBatchCreate(BaseModel):
+    """
+    What the user sends when adding several attendees at once.
+    Each item follows the same rules as AttendeeCreate.
+    """
+    attendees: list[AttendeeCreate] = Field(min_length=1, max_length=MAX_BATCH_ATTENDEES)
@@ -0,0 +1,51 @@
+# schemas/reservation_series.py
+"""
+Pydantic schemas for Reservation Series (recurring reservations)
+"""
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict
+from datetime import datetime
+from datetime import date as date_type
+from datetime import time
+
+from schemas.reservation import ReservationResponse
+
+
+class ReservationSeriesCreate(BaseModel):
+    """What the user sends when booking a recurring reservation"""
+    dining_room_id: int
+    frequency: Literal["weekly", "monthly"]
+    start_date: date_type
+    end_date: date_type
+    meal_type: str
+    start_time: time
+    end_time: time
+    notes: str | None = None
+
+
+class SeriesConflict(BaseModel):
+    """An occurrence that could not be booked"""
+    date: date_type
+    detail: str
+
+
+class ReservationSeriesResponse(BaseModel):
+    """What we send back to the user"""
+    id: int
+    created_by_id: int
+    dining_room_id: int
+    frequency: str
+    start_date: date_type
+    end_date: date_type
+    meal_type: str
+    start_time: time
+    end_time: time
+    notes: str | None
+    created_at: datetime
+
+    # Expanded occurrences
+    occurrences: list[ReservationResponse] = []
+    conflicts: list[SeriesConflict] = []
+
+    model_config = ConfigDict(from_attributes=True)
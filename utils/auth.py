@@ -2,14 +2,17 @@
 """
 Authentication utilities - JWT token creation and verification
 """
+import secrets
+
 import jwt
 from datetime import datetime, timedelta, timezone
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
 from config import settings
-from database import get_db
+from database import primary_async_session
 from models.user import User
+from utils.principal_cache import Principal, principal_cache
+from utils.token_cache import token_cache
 
 # Security scheme for Swagger UI
 security = HTTPBearer()
@@ -17,12 +20,15 @@ security = HTTPBearer()
 
 def create_access_token(user_id: int, is_admin: bool) -> str:
     """Create a JWT token for a user."""
-    expire = datetime.now(timezone.utc) + timedelta(minutes=settings.JWT_EXPIRATION_MINUTES)
+    now = datetime.now(timezone.utc)
+    expire = now + timedelta(minutes=settings.JWT_EXPIRATION_MINUTES)
     
     payload = {
         "user_id": user_id,
         "is_admin": is_admin,
-        "exp": expire
+        "iat": now,
+        "exp": expire,
+        "jti": secrets.token_hex(8),  # unique per login, so logout revokes only this token
     }
     
     token = jwt.encode(
@@ -35,27 +41,50 @@ def create_access_token(user_id: int, is_admin: bool) -> str:
 
 
 def decode_access_token(token: str) -> dict:
-    """Decode and verify a JWT token."""
+    """
+    Decode and verify a JWT token.
+    Verified claims are cached until the token's exp, so a token is only
+    signature-checked the first time this process sees it.
+    """
+    payload = token_cache.get(token)
+    if payload is not None:
+        return payload
+
     try:
         payload = jwt.decode(
             token, 
             settings.SECRET_KEY, 
             algorithms=[settings.JWT_ALGORITHM]
         )
-        return payload
     except jwt.ExpiredSignatureError:
         raise ValueError("Token has expired")
     except jwt.InvalidTokenError:
         raise ValueError("Invalid token")
 
+    if token_cache.is_revoked(token, payload):
+        raise ValueError("Token has been revoked")
 
-def get_current_user(
+    token_cache.put(token, payload)
+    return payload
+
+
+def revoke_access_token(token: str) -> None:
+    """Log a token out: reject it until it would have expired."""
+    payload = decode_access_token(token)
+    token_cache.revoke(token, payload["exp"])
+
+
+async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
-) -> User:
+) -> Principal:
     """
     Dependency to get the current authenticated user.
     Requires valid JWT token in Authorization header.
+
+    Returns a detached Principal (id, is_admin, name). Runs on the event
+    loop: the token and principal caches answer most requests without a
+    thread hop, and only a principal-cache miss opens an async session to
+    load the user.
     """
     token = credentials.credentials
     
@@ -70,7 +99,12 @@ def get_current_user(
                 headers={"WWW-Authenticate": "Bearer"}
             )
         
-        user = db.query(User).filter(User.id == user_id).first()
+        principal = principal_cache.get(user_id)
+        if principal is not None:
+            return principal
+
+        async with primary_async_session() as db:
+            user = await db.get(User, user_id)
         
         if user is None:
             raise HTTPException(
@@ -79,7 +113,9 @@ def get_current_user(
                 headers={"WWW-Authenticate": "Bearer"}
             )
         
-        return user
+        principal = Principal.from_user(user)
+        principal_cache.put(principal)
+        return principal
         
     except ValueError as e:
         raise HTTPException(
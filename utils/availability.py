@@ -0,0 +1,122 @@
+# utils/availability.py
+"""
+Room availability heatmap - remaining capacity per room per time bucket.
+
+One grouped query pulls every confirmed reservation (with its attendee count)
+in the date range; NumPy then builds a rooms x buckets occupancy matrix using
+a difference array and a cumulative sum along the time axis.
+
+NumPy is imported on first use so workers that never serve the heatmap
+don't pay for it at startup.
+"""
+from __future__ import annotations
+
+import re
+from datetime import date
+from typing import TYPE_CHECKING
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from models.dining_room import DiningRoom
+from models.reservation import Reservation
+from models.reservation_attendee import ReservationAttendee
+
+if TYPE_CHECKING:
+    import numpy as np
+
+MINUTES_PER_DAY = 24 * 60
+
+_GRANULARITY_RE = re.compile(r"^(\d+)([mh])$")
+
+
+def parse_granularity(value: str) -> int:
+    """
+    Parse "15m" / "30m" / "1h" into minutes.
+    Raises ValueError unless the bucket size evenly divides a day.
+    """
+    match = _GRANULARITY_RE.match(value.strip().lower())
+    if not match:
+        raise ValueError("Granularity must look like 15m, 30m or 1h")
+
+    minutes = int(match.group(1)) * (60 if match.group(2) == "h" else 1)
+    if minutes <= 0 or MINUTES_PER_DAY % minutes != 0:
+        raise ValueError("Granularity must evenly divide 24 hours")
+    return minutes
+
+
+def occupancy_matrix(
+    db: Session,
+    rooms: list[DiningRoom],
+    date_from: date,
+    date_to: date,
+    granularity: int,
+) -> np.ndarray:
+    """
+    Return an int matrix of shape (len(rooms), days * buckets_per_day) where
+    each cell is the headcount of every confirmed reservation overlapping that
+    bucket. Bucket 0 starts at midnight on `date_from`.
+    """
+    import numpy as np
+
+    buckets_per_day = MINUTES_PER_DAY // granularity
+    n_days = (date_to - date_from).days + 1
+    n_buckets = n_days * buckets_per_day
+
+    room_index = {room.id: i for i, room in enumerate(rooms)}
+    if not room_index:
+        return np.zeros((0, n_buckets), dtype=np.int64)
+
+    rows = (
+        db.query(
+            Reservation.dining_room_id,
+            Reservation.date,
+            Reservation.start_time,
+            Reservation.end_time,
+            func.count(ReservationAttendee.id),
+        )
+        .join(ReservationAttendee, ReservationAttendee.reservation_id == Reservation.id)
+        .filter(
+            Reservation.dining_room_id.in_(room_index.keys()),
+            Reservation.date >= date_from,
+            Reservation.date <= date_to,
+            Reservation.status == "confirmed",
+        )
+        .group_by(
+            Reservation.dining_room_id,
+            Reservation.date,
+            Reservation.start_time,
+            Reservation.end_time,
+        )
+        .all()
+    )
+
+    # One extra column so an end index of n_buckets is a valid scatter target
+    diff = np.zeros((len(rooms), n_buckets + 1), dtype=np.int64)
+    if not rows:
+        return diff[:, :n_buckets]
+
+    room_idx = np.fromiter((room_index[r[0]] for r in rows), dtype=np.int64, count=len(rows))
+    day_offset = np.fromiter(((r[1] - date_from).days for r in rows), dtype=np.int64, count=len(rows))
+    start_min = np.fromiter((r[2].hour * 60 + r[2].minute for r in rows), dtype=np.int64, count=len(rows))
+    end_min = np.fromiter((r[3].hour * 60 + r[3].minute for r in rows), dtype=np.int64, count=len(rows))
+    counts = np.fromiter((r[4] for r in rows), dtype=np.int64, count=len(rows))
+
+    # Half-open [start, end): a bucket is occupied if any minute of it overlaps
+    base = day_offset * buckets_per_day
+    start_idx = base + start_min // granularity
+    end_idx = base + -(-end_min // granularity)
+
+    valid = end_idx > start_idx
+    np.add.at(diff, (room_idx[valid], start_idx[valid]), counts[valid])
+    np.add.at(diff, (room_idx[valid], end_idx[valid]), -counts[valid])
+
+    return np.cumsum(diff, axis=1)[:, :n_buckets]
+
+
+def remaining_capacity(rooms: list[DiningRoom], occupancy: np.ndarray) -> np.ndarray:
+    """Capacity minus occupancy per bucket, floored at zero."""
+    import numpy as np
+
+    capacities = np.array([room.capacity for room in rooms], dtype=np.int64).reshape(-1, 1)
+    return np.clip(capacities - occupancy, 0, None)
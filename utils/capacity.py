@@ -0,0 +1,133 @@
+# utils/capacity.py
+"""
+Capacity engine - peak concurrent occupancy for a dining room.
+
+Loads one room-day's overlapping reservations (with attendee counts) in a
+single grouped query, then runs a sweep-line over their start/end times to
+find the true peak number of people in the room during a proposed window.
+"""
+from __future__ import annotations
+
+from datetime import date, time
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from models.reservation import Reservation
+from models.reservation_attendee import ReservationAttendee
+
+
+def load_room_intervals(
+    db: Session,
+    dining_room_id: int,
+    on_date: date,
+    start_time: time,
+    end_time: time,
+) -> list[tuple[time, time, int]]:
+    """
+    Return (start, end, attendee_count) for the confirmed reservations in the
+    room on that date that overlap the window. One query.
+
+    Reservations sharing the same start/end are merged in SQL, so the result
+    is bounded by the number of distinct windows rather than reservations.
+    """
+    rows = (
+        db.query(
+            Reservation.start_time,
+            Reservation.end_time,
+            func.count(ReservationAttendee.id),
+        )
+        .join(ReservationAttendee, ReservationAttendee.reservation_id == Reservation.id)
+        .filter(
+            Reservation.dining_room_id == dining_room_id,
+            Reservation.date == on_date,
+            Reservation.status == "confirmed",
+            # Overlap logic: (StartA < EndB) and (EndA > StartB)
+            Reservation.start_time < end_time,
+            Reservation.end_time > start_time,
+        )
+        .group_by(Reservation.start_time, Reservation.end_time)
+        .all()
+    )
+    return [(start, end, count) for start, end, count in rows]
+
+
+def peak_occupancy(
+    intervals: list[tuple[time, time, int]],
+    start_time: time,
+    end_time: time,
+) -> int:
+    """
+    Peak concurrent headcount inside [start_time, end_time).
+
+    Intervals are half-open, so a party leaving at 20:00 does not overlap a
+    party arriving at 20:00. O(n log n) in the number of intervals.
+    """
+    events: list[tuple[time, int]] = []
+    for start, end, count in intervals:
+        if count <= 0 or start >= end_time or end <= start_time:
+            continue
+        events.append((max(start, start_time), count))
+        events.append((min(end, end_time), -count))
+
+    # Departures sort before arrivals at the same instant (-count < +count)
+    events.sort()
+
+    current = 0
+    peak = 0
+    for _, delta in events:
+        current += delta
+        if current > peak:
+            peak = current
+    return peak
+
+
+def room_peak_occupancy(
+    db: Session,
+    dining_room_id: int,
+    on_date: date,
+    start_time: time,
+    end_time: time,
+) -> int:
+    """Peak concurrent occupancy for a room during a proposed window."""
+    intervals = load_room_intervals(db, dining_room_id, on_date, start_time, end_time)
+    return peak_occupancy(intervals, start_time, end_time)
+
+
+
+def load_room_range_intervals(
+    db: Session,
+    dining_room_id: int,
+    date_from: date,
+    date_to: date,
+    start_time: time,
+    end_time: time,
+) -> dict[date, list[tuple[time, time, int]]]:
+    """
+    Like load_room_intervals, but for every date in [date_from, date_to] at
+    once: one range query, grouped into per-date interval lists.
+    """
+    rows = (
+        db.query(
+            Reservation.date,
+            Reservation.start_time,
+            Reservation.end_time,
+            func.count(ReservationAttendee.id),
+        )
+        .join(ReservationAttendee, ReservationAttendee.reservation_id == Reservation.id)
+        .filter(
+            Reservation.dining_room_id == dining_room_id,
+            Reservation.date >= date_from,
+            Reservation.date <= date_to,
+            Reservation.status == "confirmed",
+            Reservation.start_time < end_time,
+            Reservation.end_time > start_time,
+        )
+        .group_by(Reservation.date, Reservation.start_time, Reservation.end_time)
+        .all()
+    )
+
+    by_date: dict[date, list[tuple[time, time, int]]] = {}
+    for on_date, start, end, count in rows:
+        by_date.setdefault(on_date, []).append((start, end, count))
+    return by_date
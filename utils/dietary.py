@@ -0,0 +1,61 @@
+# utils/dietary.py
+"""
+Dietary restriction tags.
+
+dietary_restrictions is free text ("NO shellfish, pork", "Gluten-free",
+"vegan; nut allergy"). For the kitchen it is split into normalized tags so
+the same restriction is counted once however it was typed:
+
+- lower-cased, split on , ; / & + newlines, " and " and parentheses
+  ("vegetarian (no eggs)" is "vegetarian" and "eggs")
+- "no", "avoid", "allergic to", "... allergy", "... free" wording is
+  dropped, so "No gluten", "gluten-free" and "gluten allergy" are all
+  "gluten"
+- a few common synonyms are folded together (ALIASES)
+- placeholders like "none" or "n/a" and qualifiers like "(strict)"
+  produce no tag
+"""
+import re
+
+_SEPARATORS = re.compile(r"[,;/&+\n()]|\band\b")
+# Removed before splitting, or the slash would make "n" and "a" tags
+_NOT_APPLICABLE = re.compile(r"\bn\s*/\s*a\b")
+_PREFIXES = re.compile(r"^(?:no|non|avoid|avoids|allergic to|allergy to|allergies to|strictly)\s+")
+_SUFFIXES = re.compile(r"[\s-]+(?:free|allergy|allergies|allergic|intolerance|intolerant|only|diet)$")
+
+EMPTY = {"", "none", "n/a", "na", "nil", "nothing", "no", "ok", "strict", "severe", "mild"}
+
+ALIASES = {
+    "veggie": "vegetarian",
+    "gf": "gluten",
+    "celiac": "gluten",
+    "coeliac": "gluten",
+    "lactose": "dairy",
+    "milk": "dairy",
+    "nuts": "nut",
+    "tree nuts": "tree nut",
+    "peanuts": "peanut",
+    "shell fish": "shellfish",
+    "halal meat": "halal",
+    "kosher meat": "kosher",
+}
+
+
+def normalize_dietary_tag(text: str) -> str | None:
+    tag = " ".join(text.lower().replace("-", " ").split()).strip(" .!")
+    tag = _PREFIXES.sub("", tag)
+    tag = _SUFFIXES.sub("", tag).strip()
+    tag = ALIASES.get(tag, tag)
+    return None if tag in EMPTY else tag
+
+
+def dietary_tags(text: str | None) -> list[str]:
+    """Normalized tags for one attendee, de-duplicated, in the order written"""
+    if not text or normalize_dietary_tag(text) is None:
+        return []
+    tags: list[str] = []
+    for part in _SEPARATORS.split(_NOT_APPLICABLE.sub("", text.lower())):
+        tag = normalize_dietary_tag(part)
+        if tag and tag not in tags:
+            tags.append(tag)
+    return tags
@@ -0,0 +1,12 @@
+# utils/etags.py
+"""
+Conditional GET helpers shared by the routes that send ETags.
+"""
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """True if an If-None-Match header covers `etag` (weak tags and * included)."""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
@@ -0,0 +1,249 @@
+# utils/fee_recompute.py
+"""
+Bulk fee recomputation - re-price one rule's fees on every future reservation.
+
+Runs after an admin changes a rule's amount, threshold or enabled flag.
+Reservations are walked in id-ordered chunks; each chunk is one SELECT of
+fee inputs (plus one for guest counts and allowances when the rule needs
+them), the new amounts are evaluated in memory with the same evaluators as
+apply_automatic_fees, and the results are written back with one bulk
+INSERT, UPDATE and DELETE per chunk. Paid and admin-overridden fees are
+never touched.
+
+Progress is tracked in an in-process job table so the admin UI can poll it;
+finished jobs are forgotten after FEE_RECOMPUTE_JOB_TTL_SECONDS.
+"""
+from __future__ import annotations
+
+import threading
+import time
+import uuid
+from datetime import date, datetime, timezone
+
+from sqlalchemy import delete, insert, update
+from sqlalchemy.orm import Session
+
+from config import settings
+from database import SessionLocal
+from models.fee import Fee
+from models.reservation import Reservation
+from models.rule import Rule
+from utils.fee_rules import EVALUATORS, FeeInputs, compile_rule, load_guest_inputs
+
+CHUNK_SIZE = 5000
+
+_jobs: dict[str, dict] = {}
+_jobs_lock = threading.Lock()
+
+
+def recompute_rule_fees(
+    db: Session,
+    rule_id: int,
+    from_date: date | None = None,
+    chunk_size: int = CHUNK_SIZE,
+    progress=None,
+) -> dict:
+    """
+    Re-price `rule_id` on every reservation dated `from_date` (default today)
+    or later. Commits after each chunk. `progress(stats)` is called after
+    every chunk. Returns the final counters.
+    """
+    rule = db.query(Rule).filter(Rule.id == rule_id).first()
+    if not rule:
+        raise ValueError(f"Rule {rule_id} not found")
+
+    from_date = from_date or date.today()
+    compiled = compile_rule(rule) if rule.code in EVALUATORS else None
+    active = compiled is not None and rule.enabled == 1
+
+    stats = {
+        "total": db.query(Reservation).filter(Reservation.date >= from_date).count(),
+        "processed": 0,
+        "inserted": 0,
+        "updated": 0,
+        "deleted": 0,
+        "skipped": 0,
+    }
+    if progress:
+        progress(stats)
+
+    if compiled is None:
+        # Not an automatic rule - nothing computes it, nothing to re-price
+        stats["processed"] = stats["total"]
+        if progress:
+            progress(stats)
+        return stats
+
+    last_id = 0
+    while True:
+        rows = (
+            db.query(
+                Reservation.id,
+                Reservation.date,
+                Reservation.attendee_count,
+                Reservation.guest_count,
+                Fee.id,
+                Fee.quantity,
+                Fee.calculated_amount,
+                Fee.paid,
+                Fee.override_amount,
+            )
+            .outerjoin(Fee, (Fee.reservation_id == Reservation.id) & (Fee.rule_id == rule.id))
+            .filter(Reservation.date >= from_date, Reservation.id > last_id)
+            .order_by(Reservation.id)
+            .limit(chunk_size)
+            .all()
+        )
+        if not rows:
+            break
+        last_id = rows[-1][0]
+
+        guest_inputs: dict[int, tuple[int, int]] = {}
+        if active and compiled.needs_allowance:
+            guest_inputs = load_guest_inputs(db, [r[0] for r in rows if r[2]])
+
+        inserts: list[dict] = []
+        updates: list[dict] = []
+        deletes: list[int] = []
+        changed: set[int] = set()
+
+        for (res_id, on_date, total, guests,
+             fee_id, quantity, amount, paid, override) in rows:
+            if fee_id is not None and (paid or override is not None):
+                stats["skipped"] += 1
+                continue
+
+            result = None
+            if active:
+                allowance = 0
+                if compiled.needs_allowance:
+                    guests, allowance = guest_inputs.get(res_id, (0, 0))
+                result = compiled.evaluate(
+                    FeeInputs(
+                        on_date=on_date,
+                        total_count=total,
+                        guest_count=guests,
+                        guest_allowance=allowance,
+                    )
+                )
+
+            if result is None or result[1] <= 0:
+                if fee_id is not None:
+                    deletes.append(fee_id)
+                    changed.add(res_id)
+                continue
+
+            new_quantity, new_amount = result
+            if fee_id is None:
+                inserts.append({
+                    "reservation_id": res_id,
+                    "rule_id": rule.id,
+                    "quantity": new_quantity,
+                    "calculated_amount": new_amount,
+                    "paid": 0,
+                })
+                changed.add(res_id)
+            elif quantity != new_quantity or amount != new_amount:
+                updates.append({
+                    "id": fee_id,
+                    "quantity": new_quantity,
+                    "calculated_amount": new_amount,
+                })
+                changed.add(res_id)
+
+        if inserts:
+            db.execute(insert(Fee), inserts)
+        if updates:
+            db.execute(update(Fee), updates)
+        if deletes:
+            db.execute(
+                delete(Fee).where(Fee.id.in_(deletes)),
+                execution_options={"synchronize_session": False},
+            )
+        if changed:
+            db.execute(
+                update(Reservation)
+                .where(Reservation.id.in_(changed))
+                .values(fee_version=Reservation.fee_version + 1),
+                # fee_version isn't on any report; keep report caches warm
+                execution_options={"synchronize_session": False, "report_data": False},
+            )
+        db.commit()
+
+        stats["processed"] += len({r[0] for r in rows})
+        stats["inserted"] += len(inserts)
+        stats["updated"] += len(updates)
+        stats["deleted"] += len(deletes)
+        if progress:
+            progress(stats)
+
+    return stats
+
+
+# ==================== JOB TRACKING ====================
+
+def _prune(now: float) -> None:
+    """Forget finished jobs past their TTL (caller holds _jobs_lock)."""
+    for job_id, job in list(_jobs.items()):
+        if job["_expires"] is not None and job["_expires"] <= now:
+            del _jobs[job_id]
+
+
+def start_recompute_job(rule_id: int) -> str:
+    """Register a queued job and return its id; run it with run_recompute_job."""
+    job_id = uuid.uuid4().hex
+    with _jobs_lock:
+        _prune(time.monotonic())
+        _jobs[job_id] = {
+            "id": job_id,
+            "rule_id": rule_id,
+            "status": "queued",
+            "total": 0,
+            "processed": 0,
+            "inserted": 0,
+            "updated": 0,
+            "deleted": 0,
+            "skipped": 0,
+            "error": None,
+            "started_at": None,
+            "finished_at": None,
+            "_expires": None,
+        }
+    return job_id
+
+
+def _update_job(job_id: str, **fields) -> None:
+    with _jobs_lock:
+        _jobs[job_id].update(fields)
+
+
+def _finish_job(job_id: str, **fields) -> None:
+    _update_job(
+        job_id,
+        finished_at=datetime.now(timezone.utc),
+        _expires=time.monotonic() + settings.FEE_RECOMPUTE_JOB_TTL_SECONDS,
+        **fields,
+    )
+
+
+def run_recompute_job(job_id: str) -> None:
+    """Execute a queued job in its own session (meant for BackgroundTasks)."""
+    rule_id = _jobs[job_id]["rule_id"]
+    _update_job(job_id, status="running", started_at=datetime.now(timezone.utc))
+
+    db = SessionLocal()
+    try:
+        recompute_rule_fees(db, rule_id, progress=lambda stats: _update_job(job_id, **stats))
+        _finish_job(job_id, status="done")
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Fee recompute job {job_id} failed: {e}")
+        _finish_job(job_id, status="failed", error=str(e))
+    finally:
+        db.close()
+
+
+def get_recompute_job(job_id: str) -> dict | None:
+    with _jobs_lock:
+        job = _jobs.get(job_id)
+        return {k: v for k, v in job.items() if not k.startswith("_")} if job else None
@@ -0,0 +1,200 @@
+# utils/fee_rules.py
+"""
+Fee rule registry - enabled automatic fee rules compiled into evaluators.
+
+The registry loads the enabled automatic rules once, snapshots them into
+plain (detached) evaluator objects keyed by rule code, and serves them from
+memory until invalidated. admin.update_rule invalidates it on commit; a
+short TTL covers rule changes made by other worker processes or scripts.
+Each invalidation also moves the registry's version, which the fees ETag
+includes because fee responses embed their rule.
+"""
+from __future__ import annotations
+
+import secrets
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import date
+
+from sqlalchemy import case, func, select
+from sqlalchemy.orm import Session, aliased
+
+from models.member import Member
+from models.reservation_attendee import ReservationAttendee
+from models.rule import Rule
+
+AUTOMATIC_FEE_CODES = ("peak_hours", "excess_occupancy", "excess_member_guests")
+
+REGISTRY_TTL_SECONDS = 60
+
+# Members without an allowance set (NULL or 0) may bring this many guests
+DEFAULT_GUEST_ALLOWANCE = 4
+
+
+@dataclass(frozen=True)
+class FeeInputs:
+    """Everything the automatic fees depend on for one reservation."""
+    on_date: date
+    total_count: int
+    guest_count: int
+    guest_allowance: int
+
+
+@dataclass(frozen=True)
+class CompiledRule(ABC):
+    """Detached snapshot of a Rule row with its fee calculation."""
+    id: int
+    code: str
+    base_amount: float
+    threshold: int | None
+
+    @property
+    def needs_allowance(self) -> bool:
+        return False
+
+    @abstractmethod
+    def evaluate(self, inputs: FeeInputs) -> tuple[int | None, float] | None:
+        """Return (quantity, amount); amount 0 means no fee. None = not applicable."""
+
+
+class PeakHoursRule(CompiledRule):
+    """Flat surcharge on Fri/Sat/Sun"""
+
+    def evaluate(self, inputs: FeeInputs) -> tuple[int | None, float] | None:
+        is_peak_day = inputs.on_date.weekday() in [4, 5, 6]  # Fri/Sat/Sun
+        return None, self.base_amount if is_peak_day else 0
+
+
+class ExcessOccupancyRule(CompiledRule):
+    """Per-person fee for every attendee beyond the threshold"""
+
+    def evaluate(self, inputs: FeeInputs) -> tuple[int | None, float] | None:
+        if not self.threshold:
+            return None
+        excess = max(0, inputs.total_count - self.threshold)
+        return (excess if excess > 0 else None), excess * self.base_amount
+
+
+class ExcessMemberGuestsRule(CompiledRule):
+    """Per-person fee for guests beyond the attending members' allowance"""
+
+    @property
+    def needs_allowance(self) -> bool:
+        return True
+
+    def evaluate(self, inputs: FeeInputs) -> tuple[int | None, float] | None:
+        excess_guests = max(0, inputs.guest_count - inputs.guest_allowance)
+        return (excess_guests if excess_guests > 0 else None), excess_guests * self.base_amount
+
+
+EVALUATORS: dict[str, type[CompiledRule]] = {
+    "peak_hours": PeakHoursRule,
+    "excess_occupancy": ExcessOccupancyRule,
+    "excess_member_guests": ExcessMemberGuestsRule,
+}
+
+
+def compile_rule(rule: Rule) -> CompiledRule:
+    return EVALUATORS[rule.code](
+        id=rule.id,
+        code=rule.code,
+        base_amount=rule.base_amount,
+        threshold=rule.threshold,
+    )
+
+
+def evaluate_fees(
+    rules: dict[str, CompiledRule],
+    inputs: FeeInputs,
+) -> list[tuple[CompiledRule, int | None, float]]:
+    """(rule, quantity, amount) for every applicable rule, in a stable order."""
+    fees: list[tuple[CompiledRule, int | None, float]] = []
+    for code in AUTOMATIC_FEE_CODES:
+        rule = rules.get(code)
+        if not rule:
+            continue
+        result = rule.evaluate(inputs)
+        if result is not None:
+            fees.append((rule, *result))
+    return fees
+
+
+def load_guest_inputs(db: Session, reservation_ids) -> dict[int, tuple[int, int]]:
+    """
+    (guest_count, guest_allowance) per reservation, in one query.
+    Guests are attendees without a member record (including members since
+    deleted); the allowance is summed once per distinct attending member.
+    Reservations without attendees are left out.
+    """
+    member_attendee = aliased(ReservationAttendee)
+    allowance = (
+        select(
+            func.coalesce(
+                func.sum(func.coalesce(func.nullif(Member.guest_allowance, 0), DEFAULT_GUEST_ALLOWANCE)),
+                0,
+            )
+        )
+        .where(
+            Member.id.in_(
+                select(member_attendee.member_id).where(
+                    member_attendee.reservation_id == ReservationAttendee.reservation_id
+                )
+            )
+        )
+        .scalar_subquery()
+    )
+    rows = (
+        db.query(
+            ReservationAttendee.reservation_id,
+            func.sum(case((ReservationAttendee.member_id.is_(None), 1), else_=0)),
+            allowance,
+        )
+        .filter(ReservationAttendee.reservation_id.in_(reservation_ids))
+        .group_by(ReservationAttendee.reservation_id)
+        .all()
+    )
+    return {reservation_id: (guests, allowance) for reservation_id, guests, allowance in rows}
+
+
+class FeeRuleRegistry:
+    """Thread-safe, in-process cache of compiled automatic fee rules."""
+
+    def __init__(self, ttl_seconds: float = REGISTRY_TTL_SECONDS):
+        self._ttl = ttl_seconds
+        self._lock = threading.Lock()
+        self._rules: dict[str, CompiledRule] | None = None
+        self._loaded_at = 0.0
+        # Per-process token, so a restart never revalidates an old client copy
+        self._token = secrets.token_hex(4)
+        self._generation = 0
+
+    @property
+    def version(self) -> str:
+        """Changes whenever any rule is edited through the admin API."""
+        return f"{self._token}.{self._generation}"
+
+    def get(self, db: Session) -> dict[str, CompiledRule]:
+        rules = self._rules
+        if rules is not None and time.monotonic() - self._loaded_at < self._ttl:
+            return rules
+
+        with self._lock:
+            if self._rules is None or time.monotonic() - self._loaded_at >= self._ttl:
+                rows = (
+                    db.query(Rule)
+                    .filter(Rule.code.in_(AUTOMATIC_FEE_CODES), Rule.enabled == 1)
+                    .all()
+                )
+                self._rules = {row.code: compile_rule(row) for row in rows}
+                self._loaded_at = time.monotonic()
+            return self._rules
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._rules = None
+            self._generation += 1
+
+
+fee_rule_registry = FeeRuleRegistry()
@@ -0,0 +1,142 @@
+# utils/passwords.py
+"""
+Password hashing - bcrypt on a dedicated, bounded worker pool.
+
+bcrypt is deliberately slow CPU work. Running it inline in the login and
+signup handlers ties up Starlette's shared threadpool during login bursts
+and stalls unrelated requests. Instead, the async helpers below submit the
+work to a small dedicated executor (bcrypt releases the GIL, so threads
+are enough) and cap how much work may be waiting; beyond that cap callers
+get PasswordHashingBusy and the API answers 503 instead of queueing forever.
+"""
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from config import settings
+
+
+class PasswordHashingBusy(Exception):
+    """Raised when the hashing queue is full."""
+
+
+class HashingMetrics:
+    """Queueing counters for the password hashing pool."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.submitted = 0
+        self.completed = 0
+        self.rejected = 0
+        self.in_flight = 0
+        self.rehashed = 0
+        self.total_wait_ms = 0.0
+        self.max_wait_ms = 0.0
+        self.total_run_ms = 0.0
+
+    def bump(self, name: str, delta: int = 1) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + delta)
+
+    def record(self, wait_ms: float, run_ms: float) -> None:
+        with self._lock:
+            self.completed += 1
+            self.total_wait_ms += wait_ms
+            self.total_run_ms += run_ms
+            self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+
+    def stats(self) -> dict:
+        with self._lock:
+            done = self.completed or 1
+            return {
+                "workers": settings.PASSWORD_HASH_WORKERS,
+                "max_pending": settings.PASSWORD_HASH_MAX_PENDING,
+                "bcrypt_rounds": settings.BCRYPT_ROUNDS,
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "in_flight": self.in_flight,
+                "rehashed": self.rehashed,
+                "avg_wait_ms": round(self.total_wait_ms / done, 2),
+                "max_wait_ms": round(self.max_wait_ms, 2),
+                "avg_run_ms": round(self.total_run_ms / done, 2),
+            }
+
+
+metrics = HashingMetrics()
+
+_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    thread_name_prefix="bcrypt",
+)
+_slots = threading.BoundedSemaphore(settings.PASSWORD_HASH_MAX_PENDING)
+
+
+# ==================== SYNC PRIMITIVES ====================
+
+def hash_password_sync(password: str, rounds: int | None = None) -> str:
+    """Hash with the configured bcrypt work factor (blocking)."""
+    import bcrypt  # imported on first use; most requests never touch a password
+
+    salt = bcrypt.gensalt(rounds=rounds or settings.BCRYPT_ROUNDS)
+    return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
+
+
+def verify_password_sync(password: str, password_hash: str) -> bool:
+    """Check a password against a stored hash (blocking)."""
+    import bcrypt
+
+    return bcrypt.checkpw(password.encode("utf-8"), password_hash.encode("utf-8"))
+
+
+def needs_rehash(password_hash: str) -> bool:
+    """True if the hash was made with a different work factor than configured."""
+    try:
+        cost = int(password_hash.split("$")[2])
+    except (IndexError, ValueError):
+        return True
+    return cost != settings.BCRYPT_ROUNDS
+
+
+# ==================== POOLED (ASYNC) API ====================
+
+async def _run_in_pool(fn, *args):
+    if not _slots.acquire(blocking=False):
+        metrics.bump("rejected")
+        raise PasswordHashingBusy("Password hashing queue is full")
+
+    submitted_at = time.perf_counter()
+    metrics.bump("submitted")
+    metrics.bump("in_flight")
+
+    def timed():
+        started_at = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            finished_at = time.perf_counter()
+            metrics.record(
+                (started_at - submitted_at) * 1000,
+                (finished_at - started_at) * 1000,
+            )
+
+    try:
+        return await asyncio.wrap_future(_executor.submit(timed))
+    finally:
+        metrics.bump("in_flight", -1)
+        _slots.release()
+
+
+async def hash_password(password: str) -> str:
+    return await _run_in_pool(hash_password_sync, password)
+
+
+async def verify_password(password: str, password_hash: str) -> bool:
+    return await _run_in_pool(verify_password_sync, password, password_hash)
+
+
+def record_rehash() -> None:
+    metrics.bump("rehashed")
@@ -0,0 +1,143 @@
+# utils/pool_metrics.py
+"""
+Connection-pool instrumentation.
+
+Pool exhaustion used to show up only as requests hanging for pool_timeout
+seconds. Each engine's pool now records how long callers waited for a
+connection, how many gave up (pool timeout), and the peak number of
+connections in use and in overflow, so the pool can be sized from data
+via /admin/pool-stats.
+
+Wait time and timeouts come from InstrumentedQueuePool.connect (there is
+no "before checkout" pool event to time against); in-use and overflow
+peaks come from the checkout pool event.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+RECENT_WAITS = 1000
+
+
+class PoolMetrics:
+    """Checkout counters for one engine's pool."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.pool = None
+        self._lock = threading.Lock()
+        self._recent_waits: deque[float] = deque(maxlen=RECENT_WAITS)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.connects = 0
+        self.total_wait_ms = 0.0
+        self.max_wait_ms = 0.0
+        self.peak_in_use = 0
+        self.peak_overflow = 0
+
+    def record_wait(self, wait_ms: float, timed_out: bool) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+                return
+            self.checkouts += 1
+            self.total_wait_ms += wait_ms
+            self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+            self._recent_waits.append(wait_ms)
+
+    def record_checkout(self, pool) -> None:
+        in_use = pool.checkedout()
+        overflow = max(0, pool.overflow())
+        with self._lock:
+            self.peak_in_use = max(self.peak_in_use, in_use)
+            self.peak_overflow = max(self.peak_overflow, overflow)
+
+    def record_connect(self) -> None:
+        with self._lock:
+            self.connects += 1
+
+    def stats(self) -> dict:
+        pool = self.pool
+        with self._lock:
+            waits = sorted(self._recent_waits)
+            done = self.checkouts or 1
+            return {
+                "pool_size": pool.size() if pool is not None else None,
+                "timeout_seconds": pool.timeout() if pool is not None else None,
+                "in_use": pool.checkedout() if pool is not None else None,
+                "overflow": max(0, pool.overflow()) if pool is not None else None,
+                "idle": pool.checkedin() if pool is not None else None,
+                "peak_in_use": self.peak_in_use,
+                "peak_overflow": self.peak_overflow,
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "connects": self.connects,
+                "avg_wait_ms": round(self.total_wait_ms / done, 3),
+                "p95_wait_ms": round(waits[int(len(waits) * 0.95)], 3) if waits else 0.0,
+                "max_wait_ms": round(self.max_wait_ms, 3),
+            }
+
+
+class _TimedConnectMixin:
+    metrics: PoolMetrics | None = None
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except PoolTimeoutError:
+            if self.metrics:
+                self.metrics.record_wait(0.0, timed_out=True)
+            raise
+        if self.metrics:
+            self.metrics.record_wait((time.perf_counter() - started) * 1000, timed_out=False)
+        return connection
+
+    def recreate(self):
+        # engine.dispose() swaps in a fresh pool; keep reporting to the same metrics
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        if self.metrics:
+            self.metrics.pool = pool
+        return pool
+
+
+class InstrumentedQueuePool(_TimedConnectMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_TimedConnectMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+pool_metrics: dict[str, PoolMetrics] = {}
+
+
+def instrument_engine(engine, name: str) -> None:
+    """Attach checkout metrics to an engine (sync or the async one's sync_engine)."""
+    pool = engine.pool
+    if not isinstance(pool, _TimedConnectMixin):
+        return  # SQLite in-memory pools etc.: nothing worth sizing
+
+    metrics = PoolMetrics(name)
+    metrics.pool = pool
+    pool.metrics = metrics
+    pool_metrics[name] = metrics
+
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        metrics.record_checkout(metrics.pool)
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        metrics.record_connect()
+
+
+def pool_stats() -> dict:
+    return {name: metrics.stats() for name, metrics in pool_metrics.items()}
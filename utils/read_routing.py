@@ -0,0 +1,122 @@
+# utils/read_routing.py
+"""
+Read-your-writes tracking for read-replica routing.
+
+A replica lags the primary by a little, so a client that just wrote and
+immediately reads back (create a reservation, then reload the list) could
+see stale data. ReadYourWritesMiddleware records every successful unsafe
+request (POST/PUT/PATCH/DELETE) under a digest of its Authorization
+header; for REPLICA_STICKY_SECONDS afterwards that client's reads stay on
+the primary. Tracking is per process, which matches our single-worker
+deploy.
+"""
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+
+from config import settings
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+PRUNE_EVERY = 1000
+
+
+def client_key(authorization: str | None) -> str | None:
+    """Stable, non-reversible key for a caller's credentials."""
+    if not authorization:
+        return None
+    return hashlib.sha256(authorization.encode("utf-8")).hexdigest()
+
+
+class ReadRouter:
+    """Sticky-primary windows plus routing counters."""
+
+    def __init__(self, enabled: bool, sticky_seconds: float):
+        self.enabled = enabled
+        self._sticky_seconds = sticky_seconds
+        self._lock = threading.Lock()
+        self._sticky_until: dict[str, float] = {}
+        self._marks = 0
+
+        # Counters
+        self.replica_reads = 0
+        self.sticky_reads = 0
+        self.fallbacks = 0
+
+    def mark_write(self, key: str | None) -> None:
+        if key is None:
+            return
+        now = time.monotonic()
+        with self._lock:
+            self._sticky_until[key] = now + self._sticky_seconds
+            self._marks += 1
+            if self._marks % PRUNE_EVERY == 0:
+                self._sticky_until = {
+                    k: until for k, until in self._sticky_until.items() if until > now
+                }
+
+    def use_replica(self, key: str | None) -> bool:
+        """True if this caller's read may go to the replica."""
+        if not self.enabled:
+            return False
+        with self._lock:
+            until = self._sticky_until.get(key) if key else None
+            if until is not None and until > time.monotonic():
+                self.sticky_reads += 1
+                return False
+            self.replica_reads += 1
+            return True
+
+    def record_fallback(self) -> None:
+        with self._lock:
+            self.replica_reads -= 1
+            self.fallbacks += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "sticky_seconds": self._sticky_seconds,
+                "sticky_clients": len(self._sticky_until),
+                "replica_reads": self.replica_reads,
+                "sticky_reads": self.sticky_reads,
+                "fallbacks": self.fallbacks,
+            }
+
+
+read_router = ReadRouter(
+    enabled=bool(settings.DATABASE_REPLICA_URL),
+    sticky_seconds=settings.REPLICA_STICKY_SECONDS,
+)
+
+
+class ReadYourWritesMiddleware:
+    """Mark callers sticky-to-primary when an unsafe request succeeds."""
+
+    def __init__(self, app, router: ReadRouter = read_router):
+        self.app = app
+        self.router = router
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or scope["method"] in SAFE_METHODS
+            or not self.router.enabled
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message):
+            # Mark before the client sees the response, so its next read
+            # cannot beat the sticky window
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                headers = dict(scope["headers"])
+                authorization = headers.get(b"authorization")
+                self.router.mark_write(
+                    client_key(authorization.decode("latin-1") if authorization else None)
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
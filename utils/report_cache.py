@@ -0,0 +1,243 @@
+# utils/report_cache.py
+"""
+Rendered-report cache.
+
+Rendering the daily PDF rebuilds the whole ReportLab document, yet the
+same date is pulled many times a shift while its data rarely changes.
+Rendered bytes (the PDF, the manifest JSON) are kept here, tagged with an
+ETag derived from the date's data version:
+
+- report_versions holds a counter per date, bumped after any commit that
+  wrote a reservation or attendee on that date (a reservation moved to
+  another day bumps both days), plus a generation bumped by changes that
+  touch every report (rooms, user names) and one per report kind (member
+  dietary restrictions only show on the kitchen manifest)
+- an entry whose ETag no longer matches the current version is a miss
+- total cached bytes are capped; least recently used entries go first
+
+Writes are seen two ways: ORM flushes (before_flush) and ORM-enabled
+bulk statements such as insert(Reservation) (do_orm_execute). Bulk
+inserts bump the dates they write; bulk updates and deletes can't be
+traced to dates cheaply and bump every report, unless the statement
+carries execution_options(report_data=False) because it only touches
+columns no report shows (fee_version).
+
+Versions only move on commit, so a render racing a write is stored under
+the version it started from and is never served after that write. Like
+the other caches this is per process; the ETag includes a per-process
+token so a restart never revalidates an old client copy.
+"""
+from __future__ import annotations
+
+import secrets
+import threading
+from collections import OrderedDict
+from datetime import date
+from itertools import chain
+
+from sqlalchemy import event, inspect, select
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from config import settings
+from models.dining_room import DiningRoom
+from models.member import Member
+from models.reservation import Reservation
+from models.reservation_attendee import ReservationAttendee
+from models.user import User
+
+
+class ReportDataVersions:
+    """Per-date data versions plus generations for report-wide changes."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._token = secrets.token_hex(4)
+        self._generation = 0
+        self._kinds: dict[str, int] = {}
+        self._dates: dict[date, int] = {}
+
+    def etag(self, day: date, kind: str = "daily") -> str:
+        with self._lock:
+            return (
+                f'"{kind}-{day.isoformat()}-{self._token}.{self._generation}.'
+                f'{self._kinds.get(kind, 0)}.{self._dates.get(day, 0)}"'
+            )
+
+    def bump(self, days) -> None:
+        with self._lock:
+            for day in days:
+                self._dates[day] = self._dates.get(day, 0) + 1
+
+    def bump_kind(self, kind: str) -> None:
+        with self._lock:
+            self._kinds[kind] = self._kinds.get(kind, 0) + 1
+
+    def bump_all(self) -> None:
+        with self._lock:
+            self._generation += 1
+            # Every date is superseded by the new generation
+            self._dates.clear()
+
+
+class ReportCache:
+    """Thread-safe LRU of rendered reports, capped by total size in bytes."""
+
+    def __init__(self, max_bytes: int):
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[str, date], tuple[str, bytes]] = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self.evictions = 0
+
+    def get(self, kind: str, day: date, etag: str) -> bytes | None:
+        key = (kind, day)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != etag:
+                if entry is not None:
+                    self._drop(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, kind: str, day: date, etag: str, content: bytes) -> None:
+        if len(content) > self._max_bytes:
+            return
+        key = (kind, day)
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (etag, content)
+            self._bytes += len(content)
+            while self._bytes > self._max_bytes:
+                self._drop(next(iter(self._entries)))
+                self.evictions += 1
+
+    def record_not_modified(self) -> None:
+        with self._lock:
+            self.not_modified += 1
+
+    def _drop(self, key: tuple[str, date]) -> None:
+        _, content = self._entries.pop(key)
+        self._bytes -= len(content)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self._max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "not_modified": self.not_modified,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+report_versions = ReportDataVersions()
+report_cache = ReportCache(max_bytes=settings.REPORT_CACHE_MAX_BYTES)
+
+
+# ==================== INVALIDATION ====================
+
+def _as_date(value) -> date | None:
+    if isinstance(value, str):
+        return date.fromisoformat(value)
+    return value
+
+
+def _reservation_dates(reservation: Reservation) -> set[date]:
+    """Current date plus the previous one if the reservation was moved."""
+    history = inspect(reservation).attrs.date.history
+    return {_as_date(d) for d in chain(history.added, history.unchanged, history.deleted) if d}
+
+
+def _attendee_reservation(session: Session, attendee: ReservationAttendee) -> Reservation | None:
+    reservation = attendee.__dict__.get("reservation")
+    if reservation is None and attendee.reservation_id is not None:
+        # Identity-map hit in practice: routes load the reservation first
+        reservation = session.get(Reservation, attendee.reservation_id)
+    return reservation
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_report_changes(session: Session, flush_context, instances) -> None:
+    dates: set[date] = session.info.setdefault("report_dates", set())
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if obj in session.dirty and not session.is_modified(obj):
+            continue
+        if isinstance(obj, Reservation):
+            dates |= _reservation_dates(obj)
+        elif isinstance(obj, ReservationAttendee):
+            reservation = _attendee_reservation(session, obj)
+            if reservation is not None:
+                dates |= _reservation_dates(reservation)
+        elif isinstance(obj, DiningRoom) or (isinstance(obj, User) and obj not in session.new):
+            session.info["report_all"] = True
+        elif isinstance(obj, Member) and obj not in session.new:
+            # Manifests read members' current dietary restrictions
+            session.info.setdefault("report_kinds", set()).add("manifest")
+
+
+def _statement_rows(state: ORMExecuteState) -> list[dict]:
+    params = state.parameters
+    if isinstance(params, dict):
+        return [params]
+    return list(params or [])
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_bulk_report_changes(state: ORMExecuteState) -> None:
+    if not (state.is_insert or state.is_update or state.is_delete):
+        return
+    mapper = state.bind_mapper
+    if mapper is None or mapper.class_ not in (Reservation, ReservationAttendee):
+        return
+    if not state.execution_options.get("report_data", True):
+        return
+
+    session = state.session
+    rows = _statement_rows(state)
+    if state.is_insert and rows:
+        if mapper.class_ is Reservation and all(row.get("date") for row in rows):
+            session.info.setdefault("report_dates", set()).update(_as_date(row["date"]) for row in rows)
+            return
+        reservation_ids = {row.get("reservation_id") for row in rows}
+        if mapper.class_ is ReservationAttendee and None not in reservation_ids:
+            days = session.execute(
+                select(Reservation.date).where(Reservation.id.in_(reservation_ids)).distinct()
+            ).scalars()
+            session.info.setdefault("report_dates", set()).update(days)
+            return
+    # Rows matched by a bulk update/delete aren't known up front
+    session.info["report_all"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_report_versions(session: Session) -> None:
+    if session.info.pop("report_all", False):
+        report_versions.bump_all()
+    for kind in session.info.pop("report_kinds", ()):
+        report_versions.bump_kind(kind)
+    dates = session.info.pop("report_dates", None)
+    if dates:
+        report_versions.bump(dates)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_report_changes(session: Session) -> None:
+    session.info.pop("report_all", None)
+    session.info.pop("report_kinds", None)
+    session.info.pop("report_dates", None)
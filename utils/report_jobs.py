@@ -0,0 +1,264 @@
+# utils/report_jobs.py
+"""
+Report jobs - render report PDFs in a worker process pool.
+
+ReportLab layout is pure-Python CPU work that holds the GIL; rendered in
+the request thread it slows every other request the worker is serving.
+A report job loads its (small) rows in the request, then hands rendering
+to a ProcessPoolExecutor:
+
+- at most REPORT_WORKERS renders run at once; with REPORT_JOBS_MAX_PENDING
+  jobs already queued or running, submit_report_job raises ReportJobsBusy
+  and the API answers 503 instead of queueing forever
+- a job is identified by (kind, date, ETag): submitting a report that is
+  already queued, running or done returns that job instead of rendering
+  it again, and a report already in report_cache is a finished job
+  straight away
+- finished jobs keep their bytes for REPORT_JOB_TTL_SECONDS; the bytes
+  also go into report_cache, so GET /daily-pdf serves them too
+- a job not finished REPORT_JOB_TIMEOUT_SECONDS after it was submitted
+  fails as timed out, so a hung render can't hold a queue slot forever
+
+The pool is started on first use with the spawn start method (forking a
+process that runs threads and holds pooled DB connections is unsafe) and
+shut down with the app. If a worker dies (OOM kill, segfault) the pool is
+broken for good, so it is dropped and the next submit starts a new one;
+a render that times out has its pool's workers killed and is handled the
+same way (other renders on that pool fail too, as if a worker had died).
+Jobs are tracked per process, like fee recompute jobs.
+"""
+from __future__ import annotations
+
+import multiprocessing
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import date, datetime, timezone
+
+from config import settings
+from utils.report_cache import report_cache
+
+ACTIVE = ("queued", "running")
+
+
+class ReportJobsBusy(Exception):
+    """Raised when too many report jobs are queued or running."""
+
+
+_jobs: dict[str, dict] = {}
+_job_ids: dict[tuple[str, date, str], str] = {}
+_jobs_lock = threading.Lock()
+_executor: ProcessPoolExecutor | None = None
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    with _jobs_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(
+                max_workers=settings.REPORT_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _executor
+
+
+def _discard_executor(executor: ProcessPoolExecutor, terminate: bool = False) -> None:
+    """
+    Drop a broken pool so the next _get_executor starts a fresh one.
+    With `terminate`, also kill its workers: a stuck render never returns,
+    and would otherwise keep its process alive and block interpreter exit
+    (ProcessPoolExecutor has no public way to do this before Python 3.14).
+    """
+    global _executor
+    with _jobs_lock:
+        if _executor is executor:
+            _executor = None
+    processes = list((executor._processes or {}).values()) if terminate else []
+    executor.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        process.terminate()
+
+
+def _submit_render(render, args) -> tuple[ProcessPoolExecutor, Future]:
+    executor = _get_executor()
+    try:
+        return executor, executor.submit(render, *args)
+    except BrokenProcessPool:
+        # Broke since the last job finished; retry once on a new pool
+        print("⚠️  Report pool broken, starting a new one")
+        _discard_executor(executor)
+        executor = _get_executor()
+        return executor, executor.submit(render, *args)
+
+
+def shutdown_report_pool() -> None:
+    global _executor
+    with _jobs_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _public(job: dict) -> dict:
+    return {k: v for k, v in job.items() if not k.startswith("_")}
+
+
+def _prune(now: float) -> list[ProcessPoolExecutor]:
+    """
+    Fail jobs past their deadline and forget finished jobs past their TTL
+    (caller holds _jobs_lock). Returns the pools of timed-out renders for
+    the caller to discard once the lock is released.
+    """
+    stuck = []
+    for job_id, job in list(_jobs.items()):
+        if job["status"] in ACTIVE and job["_deadline"] <= now:
+            print(f"❌ Report job {job_id} timed out")
+            job.update(
+                status="failed",
+                error=f"Timed out after {settings.REPORT_JOB_TIMEOUT_SECONDS}s",
+                finished_at=datetime.now(timezone.utc),
+                _expires=now + settings.REPORT_JOB_TTL_SECONDS,
+            )
+            if _job_ids.get(job["_key"]) == job_id:
+                del _job_ids[job["_key"]]
+            if job["_future"] is not None and not job["_future"].cancel():
+                stuck.append(job["_executor"])
+        elif job["_expires"] is not None and job["_expires"] <= now:
+            del _jobs[job_id]
+            if _job_ids.get(job["_key"]) == job_id:
+                del _job_ids[job["_key"]]
+    return stuck
+
+
+def _prune_jobs() -> None:
+    with _jobs_lock:
+        stuck = _prune(time.monotonic())
+    for executor in set(stuck):
+        _discard_executor(executor, terminate=True)
+
+
+def _finish(job_id: str, result: bytes | None = None, error: str | None = None) -> bool:
+    """Record a job's outcome; False if it had already timed out."""
+    with _jobs_lock:
+        job = _jobs.get(job_id)
+        if job is None or job["status"] not in ACTIVE:
+            # Timed out (and maybe forgotten) before the render came back
+            return False
+        job.update(
+            status="failed" if error else "done",
+            error=error,
+            size=len(result) if result is not None else None,
+            finished_at=datetime.now(timezone.utc),
+            _result=result,
+            _expires=time.monotonic() + settings.REPORT_JOB_TTL_SECONDS,
+        )
+        if error and _job_ids.get(job["_key"]) == job_id:
+            # A failed job is not reused; the next submit tries again
+            del _job_ids[job["_key"]]
+    if result is not None:
+        kind, day, etag = job["_key"]
+        report_cache.put(kind, day, etag, result)
+    return True
+
+
+def _on_rendered(job_id: str, executor: ProcessPoolExecutor, future: Future) -> None:
+    if future.cancelled():
+        # Timed out while queued, or its pool was shut down
+        _finish(job_id, error="Cancelled")
+        return
+    try:
+        result = future.result()
+    except Exception as e:
+        if isinstance(e, BrokenProcessPool):
+            _discard_executor(executor)
+        if _finish(job_id, error=str(e) or type(e).__name__):
+            print(f"❌ Report job {job_id} failed: {e}")
+    else:
+        _finish(job_id, result=result)
+
+
+def submit_report_job(kind: str, day: date, etag: str, filename: str, render, load) -> dict:
+    """
+    Return the job for this report, starting one if needed.
+
+    `load()` runs in the caller (it may use the request's session) and
+    returns the arguments for `render`, a picklable module-level function
+    returning the PDF bytes; neither is called when the job is deduplicated
+    or the report is already cached.
+    """
+    key = (kind, day, etag)
+    _prune_jobs()
+    now = time.monotonic()
+    with _jobs_lock:
+        job_id = _job_ids.get(key)
+        if job_id is not None:
+            return _public(_jobs[job_id])
+
+        cached = report_cache.get(kind, day, etag)
+        if cached is None and sum(j["status"] in ACTIVE for j in _jobs.values()) >= settings.REPORT_JOBS_MAX_PENDING:
+            raise ReportJobsBusy("Report queue is full")
+
+        job_id = uuid.uuid4().hex
+        job = {
+            "id": job_id,
+            "kind": kind,
+            "date": day,
+            "filename": filename,
+            "status": "queued",
+            "size": None,
+            "error": None,
+            "created_at": datetime.now(timezone.utc),
+            "finished_at": None,
+            "_key": key,
+            "_result": None,
+            "_expires": None,
+            "_deadline": now + settings.REPORT_JOB_TIMEOUT_SECONDS,
+            "_executor": None,
+            "_future": None,
+        }
+        _jobs[job_id] = job
+        _job_ids[key] = job_id
+
+    if cached is not None:
+        _finish(job_id, result=cached)
+        return get_report_job(job_id)
+
+    try:
+        args = load()
+        executor, future = _submit_render(render, args)
+    except Exception as e:
+        _finish(job_id, error=str(e) or type(e).__name__)
+        raise
+
+    with _jobs_lock:
+        if job["status"] == "queued":
+            job.update(status="running", _executor=executor, _future=future)
+    future.add_done_callback(lambda f: _on_rendered(job_id, executor, f))
+    return get_report_job(job_id)
+
+
+def get_report_job(job_id: str) -> dict | None:
+    _prune_jobs()
+    with _jobs_lock:
+        job = _jobs.get(job_id)
+        return _public(job) if job else None
+
+
+def get_report_job_result(job_id: str) -> bytes | None:
+    with _jobs_lock:
+        job = _jobs.get(job_id)
+        return job["_result"] if job else None
+
+
+def report_job_stats() -> dict:
+    _prune_jobs()
+    with _jobs_lock:
+        statuses = [job["status"] for job in _jobs.values()]
+        return {
+            "workers": settings.REPORT_WORKERS,
+            "max_pending": settings.REPORT_JOBS_MAX_PENDING,
+            "pool_started": _executor is not None,
+            **{status: statuses.count(status) for status in ("queued", "running", "done", "failed")},
+        }
@@ -0,0 +1,310 @@
+# utils/report_render.py
+"""
+Daily report rendering - turns already-loaded report rows into PDF bytes.
+
+Nothing here touches the database or the app, so the module can be imported
+cheaply by report worker processes (see utils/report_jobs.py); the rows
+are plain NamedTuples and pickle across the process boundary. Multi-day
+reports repeat the daily layout, one date per page.
+"""
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import datetime, date, time
+from io import BytesIO
+from typing import Iterable, Iterator, NamedTuple
+
+# Timeline rows: 11:00 AM - 9:00 PM in 1-hour increments
+REPORT_HOURS = range(11, 22)
+
+
+class ReportRoom(NamedTuple):
+    id: int
+    name: str
+    is_active: bool
+
+
+class ReportBooking(NamedTuple):
+    dining_room_id: int
+    start_time: time
+    end_time: time
+    attendee_count: int
+    creator_name: str | None
+
+
+def _hour(value) -> int:
+    # Handle start_time/end_time types (string vs object)
+    if isinstance(value, str):
+        return int(value.split(':')[0])
+    return value.hour
+
+
+def bucket_bookings_by_hour(bookings: list[ReportBooking]) -> dict[tuple[int, int], list[str]]:
+    """
+    (hour, room_id) -> cell lines, in one pass over the bookings.
+    A booking fills every timeline hour with start_hour <= hour < end_hour.
+    """
+    cells: dict[tuple[int, int], list[str]] = defaultdict(list)
+    for booking in bookings:
+        if booking.creator_name is None:
+            continue
+        line = f"• {booking.creator_name} ({booking.attendee_count})"
+        first = max(_hour(booking.start_time), REPORT_HOURS.start)
+        last = min(_hour(booking.end_time), REPORT_HOURS.stop)
+        for hour in range(first, last):
+            cells[(hour, booking.dining_room_id)].append(line)
+    return cells
+
+
+# ==================== PDF ====================
+
+def _report_doc(output):
+    # reportlab is heavy and only admins ever fetch the PDF: import on first use
+    from reportlab.lib.pagesizes import letter, landscape
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate
+
+    return SimpleDocTemplate(
+        output,
+        pagesize=landscape(letter),
+        rightMargin=0.5*inch,
+        leftMargin=0.5*inch,
+        topMargin=0.75*inch,
+        bottomMargin=0.5*inch
+    )
+
+
+def daily_report_flowables(
+    target_date: date,
+    rooms: list[ReportRoom],
+    bookings: list[ReportBooking],
+) -> list:
+    """The daily report's page content for one date"""
+    from reportlab.lib import colors
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.units import inch
+    from reportlab.platypus import Table, TableStyle, Paragraph, Spacer
+    from reportlab.lib.enums import TA_CENTER
+
+    # Container for PDF elements
+    elements = []
+    styles = getSampleStyleSheet()
+    
+    # Custom styles
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=24,
+        textColor=colors.HexColor('#121212'),
+        spaceAfter=6,
+        alignment=TA_CENTER,
+        fontName='Helvetica-Bold'
+    )
+    
+    subtitle_style = ParagraphStyle(
+        'CustomSubtitle',
+        parent=styles['Normal'],
+        fontSize=11,
+        textColor=colors.HexColor('#757575'),
+        spaceAfter=20,
+        alignment=TA_CENTER,
+        fontName='Helvetica'
+    )
+    
+    header_style = ParagraphStyle(
+        'SectionHeader',
+        parent=styles['Heading2'],
+        fontSize=14,
+        textColor=colors.HexColor('#eb5638'),
+        spaceAfter=10,
+        fontName='Helvetica-Bold'
+    )
+    
+    # ==================== HEADER ====================
+    elements.append(Paragraph("STERLING CATERING", title_style))
+    elements.append(Paragraph("DAILY OPERATIONS REPORT", title_style))
+    
+    date_str = target_date.strftime("%A, %B %d, %Y")
+    elements.append(Paragraph(date_str, subtitle_style))
+    elements.append(Paragraph(
+        "Contact: (555) 123-4567 | reservations@sterlingcatering.com",
+        subtitle_style
+    ))
+    
+    elements.append(Spacer(1, 0.3*inch))
+    
+    # Calculate stats
+    total_reservations = len(bookings)
+    total_guests = sum(b.attendee_count for b in bookings)
+    
+    # ==================== SUMMARY STATS ====================
+    elements.append(Paragraph("TODAY'S SUMMARY", header_style))
+    
+    stats_data = [
+        ['Total Reservations', 'Total Guests', 'Active Rooms', 'Operating Hours'],
+        [
+            str(total_reservations),
+            str(total_guests),
+            str(sum(1 for r in rooms if r.is_active)),
+            '11:00 AM - 9:00 PM'
+        ]
+    ]
+    
+    stats_table = Table(stats_data, colWidths=[2.5*inch, 2.5*inch, 2.5*inch, 2.5*inch])
+    stats_table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#121212')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 10),
+        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 1), (-1, -1), 16),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
+        ('TOPPADDING', (0, 0), (-1, -1), 12),
+        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e0e0e0')),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f8f8f8'))
+    ]))
+    
+    elements.append(stats_table)
+    elements.append(Spacer(1, 0.3*inch))
+    
+    # ==================== TIMELINE SCHEDULE ====================
+    elements.append(Paragraph("RESERVATION SCHEDULE", header_style))
+    
+    # Create time slots (11:00 AM - 9:00 PM in 1-hour increments)
+    time_slots = []
+    for hour in REPORT_HOURS:
+        # Convert to AM/PM
+        if hour == 12:
+            time_str = "12:00 PM"
+        elif hour > 12:
+            time_str = f"{hour-12}:00 PM"
+        else:
+            time_str = f"{hour}:00 AM"
+        time_slots.append((hour, time_str))
+    
+    # Build schedule table
+    header_row = ['TIME'] + [room.name for room in rooms]
+    schedule_data = [header_row]
+    
+    # Every reservation placed into its hours once, then looked up per cell
+    cells = bucket_bookings_by_hour(bookings)
+    
+    for hour, time_str in time_slots:
+        row = [time_str]
+        for room in rooms:
+            if not room.is_active:
+                row.append("CLOSED")
+            else:
+                # Join with newlines to show multiple
+                row.append("\n".join(cells.get((hour, room.id), [])))
+        schedule_data.append(row)
+    
+    # Calculate column widths dynamically
+    num_rooms = len(rooms)
+    room_col_width = (9 * inch) / num_rooms
+    col_widths = [1.5*inch] + [room_col_width] * num_rooms
+    
+    schedule_table = Table(schedule_data, colWidths=col_widths, repeatRows=1)
+    
+    # Style the schedule table
+    table_style = [
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#121212')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 9),
+        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 1), (-1, -1), 8),
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#e0e0e0')),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f8f8f8')]),
+        ('LEFTPADDING', (0, 0), (-1, -1), 6),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 6),
+        ('TOPPADDING', (0, 0), (-1, -1), 8),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+    ]
+    
+    # Highlight cells
+    for row_idx in range(1, len(schedule_data)):
+        for col_idx in range(1, len(schedule_data[row_idx])):
+            cell = schedule_data[row_idx][col_idx]
+            if cell == "CLOSED":
+                 table_style.append(('BACKGROUND', (col_idx, row_idx), (col_idx, row_idx), colors.HexColor('#e0e0e0')))
+                 table_style.append(('TEXTCOLOR', (col_idx, row_idx), (col_idx, row_idx), colors.HexColor('#757575')))
+            elif cell and "•" in cell:
+                table_style.append(('BACKGROUND', (col_idx, row_idx), (col_idx, row_idx), colors.HexColor('#fff5f3')))
+                table_style.append(('TEXTCOLOR', (col_idx, row_idx), (col_idx, row_idx), colors.HexColor('#121212')))
+                table_style.append(('FONTNAME', (col_idx, row_idx), (col_idx, row_idx), 'Helvetica-Bold'))
+    
+    schedule_table.setStyle(TableStyle(table_style))
+    elements.append(schedule_table)
+    
+    # Footer
+    elements.append(Spacer(1, 0.3*inch))
+    footer_style = ParagraphStyle(
+        'Footer', parent=styles['Normal'], fontSize=8, textColor=colors.HexColor('#757575'), alignment=TA_CENTER, fontName='Helvetica'
+    )
+    elements.append(Paragraph(f"Generated on {datetime.now().strftime('%Y-%m-%d at %H:%M')} | Sterling Catering Operations", footer_style))
+    
+    return elements
+
+
+def render_daily_report_pdf(
+    target_date: date,
+    rooms: list[ReportRoom],
+    bookings: list[ReportBooking],
+) -> BytesIO:
+    """Lay out the daily report from already-loaded data (no DB access)"""
+    buffer = BytesIO()
+    _report_doc(buffer).build(daily_report_flowables(target_date, rooms, bookings))
+    buffer.seek(0)
+    return buffer
+
+
+def render_daily_report_bytes(
+    target_date: date,
+    rooms: list[ReportRoom],
+    bookings: list[ReportBooking],
+) -> bytes:
+    """render_daily_report_pdf as bytes (what the worker pool returns)"""
+    return render_daily_report_pdf(target_date, rooms, bookings).getvalue()
+
+
+class _LazyFlowables(list):
+    """
+    Flowables for doc.build() that pull the next day in only once the
+    current one has been laid out, so one day's rows and tables are alive
+    at a time however long the range is.
+    """
+
+    def __init__(self, pages: Iterator[list]):
+        super().__init__()
+        self._pages = pages
+
+    def __len__(self) -> int:
+        while not super().__len__():
+            page = next(self._pages, None)
+            if page is None:
+                return 0
+            self.extend(page)
+        return super().__len__()
+
+
+def render_range_report_pdf(
+    output,
+    rooms: list[ReportRoom],
+    days: Iterable[tuple[date, list[ReportBooking]]],
+) -> None:
+    """
+    Write the daily report layout for each (date, bookings) in `days`, one
+    date per page, to the file-like `output`. `days` is consumed lazily.
+    """
+    from reportlab.platypus import PageBreak
+
+    def pages():
+        for i, (day, bookings) in enumerate(days):
+            yield ([PageBreak()] if i else []) + daily_report_flowables(day, rooms, bookings)
+
+    _report_doc(output).build(_LazyFlowables(pages()))
@@ -0,0 +1,122 @@
+# utils/token_cache.py
+"""
+Verified-token cache.
+
+Clients reuse the same bearer token for up to JWT_EXPIRATION_MINUTES, yet
+every request used to re-verify its HS256 signature and re-parse its
+claims. Once a token has been verified its claims are kept here, keyed by
+a SHA-256 digest of the token (the raw token is never stored), until the
+token's own `exp`.
+
+Revocation:
+- revoke(token, exp)   -> one token (logout); rejected until it expires
+- revoke_user(user_id) -> every token issued to that user so far (user
+                          deleted); checked against the token's `iat`
+
+Like the principal cache this is per process.
+"""
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from sqlalchemy import event
+
+from config import settings
+from models.user import User
+
+
+def token_digest(token: str) -> bytes:
+    return hashlib.sha256(token.encode("utf-8")).digest()
+
+
+class TokenCache:
+    """Thread-safe LRU of verified claims, each entry living until its `exp`."""
+
+    def __init__(self, max_size: int):
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[bytes, dict] = OrderedDict()
+        self._revoked_tokens: dict[bytes, float] = {}
+        self._revoked_users: dict[int, float] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.revocations = 0
+
+    def get(self, token: str) -> dict | None:
+        digest = token_digest(token)
+        with self._lock:
+            payload = self._entries.get(digest)
+            if payload is None or payload["exp"] <= time.time():
+                if payload is not None:
+                    del self._entries[digest]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(digest)
+            self.hits += 1
+            return payload
+
+    def put(self, token: str, payload: dict) -> None:
+        if "exp" not in payload:
+            return  # never cache a token that does not expire
+        digest = token_digest(token)
+        with self._lock:
+            self._entries[digest] = payload
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def is_revoked(self, token: str, payload: dict) -> bool:
+        with self._lock:
+            if token_digest(token) in self._revoked_tokens:
+                return True
+            revoked_at = self._revoked_users.get(payload.get("user_id"))
+            return revoked_at is not None and payload.get("iat", 0) <= revoked_at
+
+    def revoke(self, token: str, exp: float) -> None:
+        """Reject this token from now until it would have expired anyway."""
+        digest = token_digest(token)
+        now = time.time()
+        with self._lock:
+            self._entries.pop(digest, None)
+            self._revoked_tokens = {d: e for d, e in self._revoked_tokens.items() if e > now}
+            self._revoked_tokens[digest] = exp
+            self.revocations += 1
+
+    def revoke_user(self, user_id: int) -> None:
+        """Reject every token issued to this user up to now."""
+        with self._lock:
+            self._revoked_users[user_id] = time.time()
+            for digest in [d for d, p in self._entries.items() if p.get("user_id") == user_id]:
+                del self._entries[digest]
+            self.revocations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self._max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "revocations": self.revocations,
+                "revoked_tokens": len(self._revoked_tokens),
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+token_cache = TokenCache(max_size=settings.TOKEN_CACHE_MAX_SIZE)
+
+
+@event.listens_for(User, "after_delete")
+def _revoke_deleted_user(mapper, connection, target: User) -> None:
+    token_cache.revoke_user(target.id)